@@ -0,0 +1,69 @@
+"""
+Memory benchmark: project hierarchy as plain dicts vs slotted HierarchyNode classes.
+
+Run from the repository root:
+    python -m __test__.bench_hierarchy_memory [shots]
+"""
+import sys
+import tracemalloc
+import uuid
+
+from app.services.launcher.hierarchy_nodes import ProjectNode, EpisodeNode, SequenceNode, ShotNode
+
+
+def make_ids(shots: int, shots_per_sequence: int = 50, sequences_per_episode: int = 20):
+    # Simulate JSON responses: every id/name is a fresh string object, like after json.loads
+    episodes = []
+    for e in range(max(1, shots // (shots_per_sequence * sequences_per_episode))):
+        sequences = []
+        for q in range(sequences_per_episode):
+            sequences.append((str(uuid.uuid4()), f"SQ{q:03d}", [
+                (str(uuid.uuid4()), "".join(["SH", f"{s * 10:04d}"])) for s in range(shots_per_sequence)
+            ]))
+        episodes.append((str(uuid.uuid4()), f"EP{e:03d}", sequences))
+    return episodes
+
+
+def build_dicts(episodes):
+    return [{
+        "project_id": "project", "project": "Project", "tasks": [], "assets": [],
+        "episodes": [{
+            "episode_id": episode_id, "episode": episode_name,
+            "sequences": [{
+                "sequence_id": sequence_id, "sequence": sequence_name,
+                "shots": [{"shot_id": shot_id, "shot": shot_name} for shot_id, shot_name in shots]
+            } for sequence_id, sequence_name, shots in sequences]
+        } for episode_id, episode_name, sequences in episodes]
+    }]
+
+
+def build_nodes(episodes):
+    return [ProjectNode("project", "Project", [
+        EpisodeNode(episode_id, episode_name, [
+            SequenceNode(sequence_id, sequence_name, [ShotNode(shot_id, shot_name) for shot_id, shot_name in shots])
+            for sequence_id, sequence_name, shots in sequences
+        ])
+        for episode_id, episode_name, sequences in episodes
+    ])]
+
+
+def measure(builder, episodes) -> int:
+    tracemalloc.start()
+    tree = builder(episodes)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return size
+
+
+if __name__ == "__main__":
+    shot_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    episodes = make_ids(shot_count)
+
+    dict_size = measure(build_dicts, episodes)
+    node_size = measure(build_nodes, episodes)
+
+    print(f"Shots:           {shot_count}")
+    print(f"Dict tree:       {dict_size / 1024 / 1024:.2f} MiB")
+    print(f"Slotted tree:    {node_size / 1024 / 1024:.2f} MiB")
+    print(f"Saving:          {(1 - node_size / dict_size) * 100:.1f}%")
@@ -0,0 +1,56 @@
+"""
+Latency benchmark: quick-switcher search over project / episode / sequence / shot / task paths.
+
+Run from the repository root:
+    python -m __test__.bench_shot_search [entries]
+"""
+import sys
+import time
+
+from app.services.launcher.hierarchy_nodes import ProjectNode, TaskTypeNode, EpisodeNode, SequenceNode, ShotNode
+from app.services.launcher.shot_search_index import ShotSearchIndex
+
+TASKS = ["Layout", "Animation", "Lighting", "FX", "Compositing"]
+PROJECTS = ["Mochi", "Kaiju", "Neko", "Tora"]
+QUERIES = ["s", "sh", "sh0120", "anim", "0050", "mochi ep02 light", "kaiju sq01", "ep03 sq120 sh0050 anim", "comp sh01"]
+
+
+def build_tree(entries: int, shots_per_sequence: int = 20, sequences_per_episode: int = 25):
+    shots_per_project = max(1, entries // (len(TASKS) * len(PROJECTS)))
+    episodes_per_project = max(1, shots_per_project // (shots_per_sequence * sequences_per_episode))
+
+    projects = []
+    for p, project_name in enumerate(PROJECTS):
+        tasks = [TaskTypeNode(f"task-{p}-{t}", task_name, "Shot") for t, task_name in enumerate(TASKS)]
+        episodes = [
+            EpisodeNode(f"ep-{p}-{e}", f"EP{e + 1:02d}", [
+                SequenceNode(f"sq-{p}-{e}-{q}", f"SQ{(q + 1) * 10:03d}", [
+                    ShotNode(f"sh-{p}-{e}-{q}-{s}", f"SH{(s + 1) * 10:04d}") for s in range(shots_per_sequence)
+                ])
+                for q in range(sequences_per_episode)
+            ])
+            for e in range(episodes_per_project)
+        ]
+        projects.append(ProjectNode(f"project-{p}", project_name, episodes, tasks))
+    return projects
+
+
+def measure(index, query: str, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        index.search(query)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+if __name__ == "__main__":
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    tree = build_tree(entry_count)
+
+    start = time.perf_counter()
+    index = ShotSearchIndex(tree)
+    build_time = time.perf_counter() - start
+
+    print(f"Entries:         {len(index)}")
+    print(f"Build:           {build_time * 1000:.0f} ms")
+    for query in QUERIES:
+        print(f"{query!r:<26} {measure(index, query):6.2f} ms")
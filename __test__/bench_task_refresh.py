@@ -0,0 +1,91 @@
+"""
+Refresh benchmark: dashboard task table reset vs row-level diff.
+
+Run from the repository root:
+    python -m __test__.bench_task_refresh [tasks]
+"""
+import copy
+import sys
+import time
+
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from app.utils.pyqt.task_table_model import TaskTableModel
+
+
+def make_tasks(count: int) -> list:
+    return [{
+        "id": f"task-{i}",
+        "project_name": f"Project {i % 4}",
+        "task_type_name": ("Layout", "Animation", "Lighting", "Compositing")[i % 4],
+        "task_status_name": "WIP",
+        "entity_type_name": "Shot",
+        "episode_name": f"EP{i // 500:02d}",
+        "sequence_name": f"SQ{i // 50:03d}",
+        "entity_name": f"SH{i % 50 * 10:04d}",
+        "due_date": "2026-01-01",
+        "priority": i % 3,
+        "last_comment_person_id": f"person-{i % 40}",
+        "last_comment_person_full_name": f"Person {i % 40}",
+        "last_comment_person_avatar_path": None,
+        "last_comment_text": f"Comment {i}",
+    } for i in range(count)]
+
+
+def measure(view, refresh, tasks, before=None, repeat: int = 10) -> tuple:
+    """Average ms per refresh and the model signals it emitted, before() runs untimed ahead of each one"""
+    model = view.model()
+    signals = {"reset": 0, "inserted": 0, "removed": 0, "changed": 0}
+    connections = [
+        (model.modelReset, lambda: signals.__setitem__("reset", signals["reset"] + 1)),
+        (model.rowsInserted, lambda *args: signals.__setitem__("inserted", signals["inserted"] + 1)),
+        (model.rowsRemoved, lambda *args: signals.__setitem__("removed", signals["removed"] + 1)),
+        (model.dataChanged, lambda *args: signals.__setitem__("changed", signals["changed"] + 1)),
+    ]
+
+    # Fresh dict objects, like a new TaskService response
+    fresh_lists = [copy.deepcopy(tasks) for _ in range(repeat)]
+
+    elapsed = 0
+    for fresh in fresh_lists:
+        if before is not None:
+            before()
+            QApplication.processEvents()
+
+        for signal, slot in connections:
+            signal.connect(slot)
+        start = time.perf_counter()
+        refresh(fresh)
+        QApplication.processEvents()
+        elapsed += time.perf_counter() - start
+        for signal, slot in connections:
+            signal.disconnect(slot)
+    elapsed = elapsed / repeat * 1000
+    return elapsed, {name: count // repeat for name, count in signals.items()}
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tasks = make_tasks(task_count)
+
+    view = QTableView()
+    model = TaskTableModel(view)
+    view.setModel(model)
+    view.resize(1200, 800)
+    view.show()
+    model.set_tasks(tasks)
+
+    edited = copy.deepcopy(tasks)
+    edited[10]["task_status_name"] = "Done"
+    del edited[500]
+    edited.insert(1500, {**tasks[0], "id": "task-new"})
+
+    print(f"Tasks:                   {task_count}")
+    for label, refresh, fresh, before in (
+        ("Reset, unchanged", model.set_tasks, tasks, None),
+        ("Diff, unchanged", model.apply_tasks, tasks, None),
+        ("Diff, 3 rows changed", model.apply_tasks, edited, lambda: model.set_tasks(tasks)),
+    ):
+        elapsed, signals = measure(view, refresh, fresh, before)
+        print(f"{label:<24} {elapsed:7.2f} ms  {signals}")
@@ -0,0 +1,79 @@
+"""
+Benchmark: version folder scans, listdir + isfile against scandir, cold and cached.
+
+Builds version folders in a temporary directory (or scans an existing root with one version
+folder per sub directory, e.g. a mounted NAS share, where the difference is largest).
+
+Run from the repository root:
+    python -m __test__.bench_version_scan [folders] [versions] [root]
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+from app.utils.version_shots import VersionShotService
+
+
+def legacy_scan(folder_path: str):
+    """The listdir + isfile scan VersionShotService used before"""
+    normal_files, backup_files = {}, {}
+    version_regex = re.compile(r"_v(\d{3,})", re.IGNORECASE)
+    for file in os.listdir(folder_path):
+        full_path = os.path.join(folder_path, file)
+        if not os.path.isfile(full_path):
+            continue
+        _, ext = os.path.splitext(file)
+        is_backup = not ext or not ext[1:].isalpha()
+        match = version_regex.search(file)
+        version = int(match.group(1)) if match else 0
+        (backup_files if is_backup else normal_files).setdefault(version, {})[file] = full_path
+    return dict(sorted(normal_files.items())), dict(sorted(backup_files.items()))
+
+
+def build_folders(root: str, folders: int, versions: int) -> list:
+    folder_paths = []
+    for f in range(folders):
+        folder_path = os.path.join(root, f"SH{(f + 1) * 10:04d}", "versions")
+        os.makedirs(folder_path)
+        for v in range(1, versions + 1):
+            for suffix in ("blend", "blend1"):
+                open(os.path.join(folder_path, f"SH{(f + 1) * 10:04d}_anim_v{v:03d}.{suffix}"), "w").close()
+        folder_paths.append(folder_path)
+
+    # Older than the mtime granularity, otherwise nothing gets cached
+    past = time.time() - 60
+    for folder_path in folder_paths:
+        os.utime(folder_path, (past, past))
+    return folder_paths
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    folder_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    version_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as temp_root:
+        if len(sys.argv) > 3:
+            root = sys.argv[3]
+            paths = [entry.path for entry in os.scandir(root) if entry.is_dir()]
+        else:
+            paths = build_folders(temp_root, folder_count, version_count)
+
+        for path in paths:
+            assert legacy_scan(path) == VersionShotService.get_version_shot_data(path, use_cache=False)
+
+        VersionShotService.invalidate()
+        print(f"Folders:            {len(paths)}")
+        print(f"listdir + isfile:   {timed(lambda: [legacy_scan(path) for path in paths]):8.1f} ms")
+        print(f"scandir:            {timed(lambda: [VersionShotService.get_version_shot_data(path, use_cache=False) for path in paths]):8.1f} ms")
+        print(f"scan_many (cold):   {timed(lambda: VersionShotService.scan_many(paths, use_cache=False)):8.1f} ms")
+        VersionShotService.invalidate()
+        VersionShotService.scan_many(paths)
+        print(f"scan_many (cached): {timed(lambda: VersionShotService.scan_many(paths)):8.1f} ms")
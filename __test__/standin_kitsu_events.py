@@ -0,0 +1,117 @@
+"""
+Kitsu event listener against a local socket.io stand-in server.
+
+Starts a python-socketio server on 127.0.0.1, checks that events sent on the /events namespace reach
+the listener, that it falls back to polling once the server goes away, and that it reconnects when
+the server is back.
+
+Run from the repository root:
+    python -m __test__.standin_kitsu_events
+"""
+import socket
+import threading
+import time
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler, make_server
+
+import socketio
+
+from app.services.kitsu_events import KitsuEventListener
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer:
+    """Minimal Zou event server: accepts any client on /events and emits whatever it is told to"""
+
+    def __init__(self, port: int):
+        self.port = port
+        # wsgiref cannot upgrade to WebSocket, the stand-in stays on long-polling
+        self.sio = socketio.Server(async_mode="threading", transports=["polling"])
+        self.connected = threading.Event()
+        self.sio.on("connect", lambda sid, environ, auth=None: self.connected.set(), namespace="/events")
+        self._server = None
+
+    def start(self):
+        self.connected.clear()
+        self._server = make_server(
+            "127.0.0.1", self.port, socketio.WSGIApp(self.sio),
+            server_class=ThreadingWSGIServer, handler_class=QuietHandler
+        )
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        for sid in list(self.sio.manager.get_participants("/events", None)):
+            self.sio.disconnect(sid[0], namespace="/events")
+        self._server.shutdown()
+        self._server.server_close()
+
+    def emit(self, event_name: str, data: dict):
+        self.sio.emit(event_name, data, namespace="/events")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(condition, timeout: float = 10) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def check(label: str, ok: bool):
+    print(f"[{'+' if ok else '-'}] {label}")
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    server = StandInServer(free_port())
+    server.start()
+
+    events, polls, states = [], [], []
+    listener = KitsuEventListener(
+        on_event=lambda name, data: events.append((name, data)),
+        on_poll=lambda: polls.append(time.monotonic()),
+        on_connection_changed=states.append,
+        event_host=f"http://127.0.0.1:{server.port}",
+        poll_interval=1,
+    )
+    listener.start()
+
+    check("Connected to the stand-in server", server.connected.wait(10) and wait_for(lambda: listener.connected))
+
+    server.emit("task:update", {"task_id": "task-1", "project_id": "project-1"})
+    server.emit("shot:new", {"shot_id": "shot-1", "project_id": "project-1"})
+    server.emit("not:subscribed", {})
+    check("Subscribed events delivered", wait_for(lambda: len(events) >= 2))
+    time.sleep(0.5)
+    check("Only subscribed events delivered", [name for name, _ in events] == ["task:update", "shot:new"])
+    check("Event payload kept", events[0][1].get("task_id") == "task-1")
+
+    server.stop()
+    check("Disconnect detected", wait_for(lambda: not listener.connected))
+    check("Polling while the socket is down", wait_for(lambda: len(polls) >= 2))
+
+    server.start()
+    check("Reconnected after the server came back", server.connected.wait(10) and wait_for(lambda: listener.connected))
+    polls_when_back = len(polls)
+    time.sleep(2)
+    check("Polling stopped once reconnected", len(polls) == polls_when_back)
+
+    listener.stop()
+    server.stop()
+    print(f"[+] Connection states: {states}")
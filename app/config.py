@@ -22,6 +22,56 @@ class Settings:
     FILES_DIR = os.path.join(CONFIG_DIR, "files")
     AVATAR_FILE = os.path.join(FILES_DIR, "user", "avatar.png")
 
+    # Launcher hierarchy loading
+    LAUNCHER_MAX_WORKERS = 8  # concurrent Zou requests while loading the project tree
+    LAUNCHER_BULK_LOAD = True  # fetch sequences and shots per project instead of per episode/sequence
+
+    # On-disk hierarchy snapshot
+    CACHE_DIR = os.path.join(CONFIG_DIR, "cache")
+    HIERARCHY_CACHE_FILE = os.path.join(CACHE_DIR, "hierarchy.db")
+    HIERARCHY_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds before the snapshot is ignored at startup
+    HIERARCHY_REFRESH_INTERVAL = 5 * 60  # seconds between background re-syncs of the project tree
+
+    # Dashboard
+    PERSON_DIRECTORY_TTL = 10 * 60  # seconds before the cached person list is reloaded
+    AVATAR_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds before an avatar on disk is downloaded again
+    AVATAR_MAX_WORKERS = 4  # concurrent avatar downloads
+    THUMBNAIL_CACHE_MAX_BYTES = 256 * 1024 * 1024  # preview thumbnails kept on disk, least recently used evicted first
+    THUMBNAIL_MAX_WORKERS = 4  # concurrent thumbnail downloads
+    PREVIEW_PIXMAP_CACHE_KB = 64 * 1024  # decoded, scaled previews kept in memory (QPixmapCache)
+    IMAGE_DECODE_WORKERS = 2  # threads decoding previews and avatars off the GUI thread
+    PREFETCH_LOOKAHEAD_ROWS = 20  # task rows above and below the viewport whose previews are prefetched
+    PREFETCH_MAX_WORKERS = 2  # concurrent prefetch downloads, kept below THUMBNAIL_MAX_WORKERS
+    PREFETCH_DEBOUNCE_MS = 150  # scrolling settles for this long before the prefetch queue is rebuilt
+
+    # Background jobs
+    JOB_RUNNER_MAX_THREADS = 6  # handler network calls running at once (see JobRunner)
+
+    # Kiyokai API
+    KIYOKAI_TIMEOUT = 10  # default seconds per request
+    KIYOKAI_TIMEOUTS = {  # seconds per endpoint (KiyokaiService method name), overriding KIYOKAI_TIMEOUT
+        "get_nas_server_list": 5,
+        "create_master_shot": 30,
+        "create_version_shot": 30,
+    }
+    KIYOKAI_HTTP2 = False  # needs the h2 package (pip install httpx[http2])
+    KIYOKAI_MAX_CONNECTIONS = 10  # pooled connections to the Kiyokai server
+    KIYOKAI_KEEPALIVE_EXPIRY = 60  # seconds an idle pooled connection is kept open
+    KIYOKAI_CACHE_TTL = 30  # seconds a master / version shot read is served from memory
+    KIYOKAI_CACHE_MAX_ENTRIES = 512  # cached reads kept, oldest dropped first
+    VERSION_IMPORT_CONCURRENCY = 4  # version shots registered at once by a folder import, below KIYOKAI_MAX_CONNECTIONS
+    PROVISION_CONCURRENCY = 4  # master shots created at once by a batch provision
+    PROVISION_MASTER_TEMPLATE = "{episode}/{sequence}/{shot}/{shot}_{task}.blend"  # master file under the NAS root, may use * and ?
+    PROVISION_VERSION_TEMPLATE = "{episode}/{sequence}/{shot}/versions"  # version folder under the NAS root
+    VERSION_SCAN_WORKERS = 8  # version folders listed at once by VersionShotService.scan_many
+    VERSION_SCAN_CACHE_FOLDERS = 1024  # scanned version folders kept in memory, keyed by folder mtime
+    VERSION_SCAN_MTIME_GRANULARITY = 2  # seconds, folders changed more recently than this are not cached
+
+    # Kitsu event stream
+    EVENTS_POLL_INTERVAL = 60  # seconds between polls while the socket is down
+    EVENTS_DEBOUNCE_MS = 500  # bursts of events within this window trigger a single refresh
+
     os.makedirs(CONFIG_DIR, exist_ok=True)
     os.makedirs(FILES_DIR, exist_ok=True)
+    os.makedirs(CACHE_DIR, exist_ok=True)
     os.makedirs(os.path.dirname(AVATAR_FILE), exist_ok=True)
@@ -16,6 +16,10 @@ class AppState:
 
             cls.task_data = None
             cls.project_data = None
+            cls.hierarchy = None
+            cls.hierarchy_refresher = None
+            cls.event_bridge = None
+            cls.job_runner = None
 
             cls._instance.cookies = None
             cls._instance.username = None
@@ -41,5 +45,17 @@ class AppState:
     def set_project_data(self, project_data):
         self.project_data = project_data
 
+    def set_hierarchy(self, hierarchy):
+        self.hierarchy = hierarchy
+
+    def set_hierarchy_refresher(self, hierarchy_refresher):
+        self.hierarchy_refresher = hierarchy_refresher
+
+    def set_event_bridge(self, event_bridge):
+        self.event_bridge = event_bridge
+
+    def set_job_runner(self, job_runner):
+        self.job_runner = job_runner
+
     def is_logged_in(self):
         return self.cookies is not None
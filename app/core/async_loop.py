@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from functools import partial
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class AsyncLoop:
+    """
+    An asyncio event loop running on its own daemon thread, next to the Qt event loop.
+
+    Coroutines are handed over with submit() and come back as concurrent.futures.Future, the same
+    kind of future the thread pool services return, so the Qt side can wait on them with
+    add_done_callback (see app.utils.pyqt.job_runner). Blocking calls such as the gazu services
+    are awaited from coroutines through run_blocking().
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, args=(self._loop,), name="async-loop", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coroutine):
+        """Schedule a coroutine on the loop, returns a concurrent.futures.Future of its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def stop(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+
+    @staticmethod
+    def _run(loop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+            logger.info("Async loop stopped")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Await a blocking call (gazu, file system) on the default executor without stalling the loop"""
+    return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args, **kwargs))
+
+
+async_loop = AsyncLoop()
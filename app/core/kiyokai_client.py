@@ -0,0 +1,199 @@
+import asyncio
+import importlib.util
+import threading
+
+import httpx
+
+from app.config import Settings
+from app.core.app_states import AppState
+from app.core.logger import get_logger
+from app.core.response_cache import ResponseCache
+from app.core.single_flight import flights
+
+logger = get_logger(__name__)
+
+class _AccessTokenAuth(httpx.Auth):
+    """Bearer token read from AppState on every request, so a new login needs no new client"""
+
+    def auth_flow(self, request):
+        token = AppState().access_token
+        if token:
+            request.headers["Authorization"] = f"Bearer {token}"
+        yield request
+
+
+class KiyokaiClient:
+    """
+    One long-lived httpx.Client for the Kiyokai API.
+
+    Connections are pooled and kept alive between calls (HTTP/2 when enabled and the h2 package is
+    installed). The base URL follows AppState().kiyokai_url: the client is rebuilt when it changes.
+    Each call names its endpoint so it can get its own timeout from Settings.KIYOKAI_TIMEOUTS.
+
+    Concurrent identical GETs share one in-flight request. Reads passed cache_tags are served from
+    the response cache until their TTL runs out; writes passed invalidates drop every cached read
+    carrying one of those tags once they complete. Reads that guard a write (the lock check before
+    opening a file) pass fresh=True: they skip the cached response, which a lock taken by another
+    client never invalidates, and store the fresh one.
+    """
+
+    def __init__(self, timeout: float = Settings.KIYOKAI_TIMEOUT, endpoint_timeouts: dict = None,
+                 http2: bool = Settings.KIYOKAI_HTTP2, max_connections: int = Settings.KIYOKAI_MAX_CONNECTIONS,
+                 keepalive_expiry: float = Settings.KIYOKAI_KEEPALIVE_EXPIRY, cache: ResponseCache = None):
+        self.cache = cache
+        self.timeout = timeout
+        self.endpoint_timeouts = Settings.KIYOKAI_TIMEOUTS if endpoint_timeouts is None else endpoint_timeouts
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+
+        self.limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        base_url = self._base_url()
+        with self._lock:
+            if self._client is None or str(self._client.base_url).rstrip("/") != base_url:
+                if self._client is not None:
+                    self._client.close()
+                self._client = httpx.Client(**self._client_options(base_url))
+                logger.info(f"Kiyokai client ready for {base_url} (http2={self.http2})")
+            return self._client
+
+    @staticmethod
+    def _base_url() -> str:
+        return (AppState().kiyokai_url or "").rstrip("/")
+
+    def _client_options(self, base_url: str) -> dict:
+        return {
+            "base_url": base_url, "auth": _AccessTokenAuth(), "http2": self.http2,
+            "limits": self.limits, "timeout": self.timeout,
+        }
+
+    def timeout_for(self, endpoint: str = None) -> float:
+        return self.endpoint_timeouts.get(endpoint, self.timeout)
+
+    def request(self, method: str, path: str, endpoint: str = None, cache_tags=None, invalidates=None,
+                fresh: bool = False, **kwargs) -> httpx.Response:
+        key = self._cache_key(method, path, endpoint, cache_tags)
+        response = None if fresh else self._cached(key)
+        if response is not None:
+            return response
+
+        generation = self._generation(key, cache_tags)
+        kwargs.setdefault("timeout", self.timeout_for(endpoint))
+        try:
+            if method == "GET":
+                response = flights.do(self._flight_key(path, endpoint, generation), self.client.request, method, path, **kwargs)
+            else:
+                response = self.client.request(method, path, **kwargs)
+        finally:
+            self._invalidate(invalidates)
+        self._store(key, response, cache_tags, generation)
+        return response
+
+    def _cache_key(self, method, path, endpoint, cache_tags):
+        if self.cache is None or cache_tags is None or method != "GET":
+            return None
+        # The base URL is part of the key, another server is other data
+        return self._base_url(), endpoint, path
+
+    def _flight_key(self, path, endpoint, generation):
+        # Concurrent identical GETs, from either client, share one request (see SingleFlight). The
+        # generation is part of the key: a read sent after a write never joins a flight from before it
+        return f"kiyokai.{endpoint or path}", self._base_url(), path, generation
+
+    def _generation(self, key, cache_tags):
+        # Taken before sending: a write landing while the read is in flight keeps it out of the cache
+        return None if key is None else self.cache.generation(cache_tags)
+
+    def _cached(self, key):
+        return None if key is None else self.cache.get(key)
+
+    def _store(self, key, response, cache_tags, generation):
+        # Only successful reads, a missing master shot may be created any moment
+        if key is not None and response.is_success:
+            self.cache.set(key, response, cache_tags, generation=generation)
+
+    def _invalidate(self, invalidates):
+        if self.cache is not None and invalidates:
+            self.cache.invalidate(invalidates)
+
+    def get(self, path: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        return self.request("GET", path, endpoint, **kwargs)
+
+    def post(self, path: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        return self.request("POST", path, endpoint, **kwargs)
+
+    def patch(self, path: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        return self.request("PATCH", path, endpoint, **kwargs)
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+class AsyncKiyokaiClient(KiyokaiClient):
+    """
+    KiyokaiClient on httpx.AsyncClient, for coroutines running on the shared async loop
+    (app.core.async_loop). Only ever touched from that loop's thread.
+    """
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        base_url = self._base_url()
+        if self._client is None or str(self._client.base_url).rstrip("/") != base_url:
+            if self._client is not None:
+                # The URL only changes on a new login, close the old pool in the background
+                asyncio.get_running_loop().create_task(self._client.aclose())
+            self._client = httpx.AsyncClient(**self._client_options(base_url))
+            logger.info(f"Async Kiyokai client ready for {base_url} (http2={self.http2})")
+        return self._client
+
+    async def request(self, method: str, path: str, endpoint: str = None, cache_tags=None, invalidates=None,
+                      fresh: bool = False, **kwargs) -> httpx.Response:
+        key = self._cache_key(method, path, endpoint, cache_tags)
+        response = None if fresh else self._cached(key)
+        if response is not None:
+            return response
+
+        generation = self._generation(key, cache_tags)
+        kwargs.setdefault("timeout", self.timeout_for(endpoint))
+        try:
+            if method == "GET":
+                response = await flights.do_async(self._flight_key(path, endpoint, generation), self.client.request, method, path, **kwargs)
+            else:
+                response = await self.client.request(method, path, **kwargs)
+        finally:
+            self._invalidate(invalidates)
+        self._store(key, response, cache_tags, generation)
+        return response
+
+    async def get(self, path: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        return await self.request("GET", path, endpoint, **kwargs)
+
+    async def post(self, path: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        return await self.request("POST", path, endpoint, **kwargs)
+
+    async def patch(self, path: str, endpoint: str = None, **kwargs) -> httpx.Response:
+        return await self.request("PATCH", path, endpoint, **kwargs)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Shared by both clients, a write through one evicts the reads of the other
+kiyokai_cache = ResponseCache(ttl=Settings.KIYOKAI_CACHE_TTL, max_entries=Settings.KIYOKAI_CACHE_MAX_ENTRIES)
+
+kiyokai_client = KiyokaiClient(cache=kiyokai_cache)
+async_kiyokai_client = AsyncKiyokaiClient(cache=kiyokai_cache)
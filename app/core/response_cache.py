@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache with tag-based invalidation.
+
+    Every entry carries a set of tags (for example "mastershots" or "shot:<shot_id>:<task_id>");
+    invalidate(tags) drops every entry that has any of them. The oldest entries are dropped first
+    once max_entries is reached.
+
+    invalidate() also bumps a generation counter per tag. A reader takes generation(tags) before
+    sending its request and passes it to set(): a response that was in flight while one of its
+    tags was invalidated predates the write and is not stored.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()  # key -> (expires_at, tags, value)
+        self._by_tag = {}  # tag -> set of keys
+        self._generations = Counter()  # tag -> number of invalidations
+        self._epoch = 0  # bumped by clear(), which invalidates every tag at once
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Cached value, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[2]
+
+    def generation(self, tags) -> tuple:
+        """Snapshot of the invalidation count of tags, to hand back to set()"""
+        with self._lock:
+            return self._generation(tags)
+
+    def set(self, key, value, tags=(), ttl: float = None, generation: tuple = None):
+        """Store value, unless generation was taken before one of tags got invalidated"""
+        with self._lock:
+            if generation is not None and generation != self._generation(tags):
+                return False
+            if key in self._entries:
+                self._remove(key)
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = (expires_at, frozenset(tags), value)
+            for tag in tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+            return True
+
+    def invalidate(self, tags) -> int:
+        """Drop every entry tagged with any of tags, returns how many were dropped"""
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                self._generations[tag] += 1
+                keys |= self._by_tag.get(tag, set())
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _generation(self, tags):
+        return (self._epoch,) + tuple(self._generations[tag] for tag in tags)
+
+    def _remove(self, key):
+        _, tags, _ = self._entries.pop(key)
+        for tag in tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
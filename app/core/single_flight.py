@@ -0,0 +1,107 @@
+import asyncio
+import copy
+import functools
+import threading
+from collections import Counter
+from concurrent.futures import Future
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one.
+
+    The first caller for a key runs the call; callers arriving while it is in flight wait for it
+    and get the same result (or exception) instead of issuing their own. Works across threads and
+    between threads and the async loop, since every flight is a concurrent.futures.Future.
+    With copy_result the result is copied once as soon as it arrives, before the leader's caller
+    can touch it, and every waiter gets its own copy of that snapshot.
+    calls and collapsed count per name (the first item of the key) how many calls came in and how
+    many of them were served by another caller's request.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.calls = Counter()
+        self.collapsed = Counter()
+
+    def do(self, key: tuple, func, *args, copy_result: bool = False, **kwargs):
+        """Run func(*args, **kwargs) unless the same key is already in flight, then wait for that one"""
+        future, leader = self._join(key)
+        if not leader:
+            result = future.result()
+            return copy.deepcopy(result) if copy_result else result
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, copy.deepcopy(result) if copy_result else result)
+        return result
+
+    async def do_async(self, key: tuple, func, *args, copy_result: bool = False, **kwargs):
+        """Coroutine version of do(): await func(*args, **kwargs) or the flight already running for key"""
+        future, leader = self._join(key)
+        if not leader:
+            # Shielded: a cancelled waiter must not cancel the flight of the others
+            result = await asyncio.shield(asyncio.wrap_future(future))
+            return copy.deepcopy(result) if copy_result else result
+
+        # The request runs as its own task, so cancelling the leader does not fail its waiters either
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        # Runs before the leader resumes, so the waiters' snapshot predates any change it makes
+        task.add_done_callback(lambda t: self._settle(
+            key, future, error=asyncio.CancelledError() if t.cancelled() else t.exception(),
+            result=None if t.cancelled() or t.exception() else copy.deepcopy(t.result()) if copy_result else t.result()
+        ))
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """{name: {"calls": n, "collapsed": n}}"""
+        with self._lock:
+            return {name: {"calls": calls, "collapsed": self.collapsed[name]} for name, calls in self.calls.items()}
+
+    @property
+    def collapsed_total(self) -> int:
+        return sum(self.collapsed.values())
+
+    def _join(self, key):
+        with self._lock:
+            self.calls[key[0]] += 1
+            future = self._flights.get(key)
+            if future is not None:
+                self.collapsed[key[0]] += 1
+                logger.debug(f"Collapsed into in-flight call: {key}")
+                return future, False
+
+            future = self._flights[key] = Future()
+            return future, True
+
+    def _settle(self, key, future, result=None, error=None):
+        with self._lock:
+            self._flights.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+flights = SingleFlight()
+
+
+def single_flight(func):
+    """
+    Decorator for read-only service calls: concurrent calls with the same arguments share one
+    request. Waiters get a deep copy of the result, callers are free to edit what they get back.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return flights.do((name, args, tuple(sorted(kwargs.items()))), func, *args, copy_result=True, **kwargs)
+
+    return wrapper
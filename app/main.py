@@ -14,7 +14,12 @@ from app.modules.main.handle_dashboard import DashboardHandler
 from app.services.auth import AuthServices
 from app.services.task import TaskService
 from app.ui.main.main_ui import Ui_MainWindow as MainWindowUI
+from app.utils.pyqt.kitsu_event_bridge import KitsuEventBridge
+from app.utils.pyqt.image_loader import ImageLoader
+from app.utils.pyqt.job_runner import JobRunner
 from app.core.app_states import AppState
+from app.core.kiyokai_client import kiyokai_cache
+from app.core.single_flight import flights
 
 class MainUI(QMainWindow):
     def __init__(self):
@@ -25,6 +30,13 @@ class MainUI(QMainWindow):
         self.ui.setupUi(self)
         self.setWindowTitle(f"{Settings.APP_NAME} - {Settings.BUILD_VERSION}")
 
+        self.image_loader = ImageLoader(self)
+        self.image_loader.image_ready.connect(self.on_avatar_image_ready)
+        self.image_loader.image_failed.connect(self.on_avatar_image_failed)
+
+        # Shared by every tab for the calls that would otherwise block a slot
+        AppState().set_job_runner(JobRunner(self))
+
         if self.prelaunch():  # returns True on successful login
             self.load_ui()
             self.show()  # Show main window only after login
@@ -51,10 +63,16 @@ class MainUI(QMainWindow):
             self.load_avatar_image(f"{Settings.AVATAR_FILE}")
 
         # Set up tabs
-        self.ui.tabWidget.addTab(DashboardHandler(), "Dashboard")
+        dashboard = DashboardHandler()
+        self.ui.tabWidget.addTab(dashboard, "Dashboard")
         self.ui.tabWidget.addTab(LauncherHandler(), "Launcher")
         self.ui.tabWidget.addTab(SettingsHandler(), "Settings")
 
+        # Push task and hierarchy changes from Kitsu, polling when the socket is down
+        AppState().set_event_bridge(KitsuEventBridge(self))
+        dashboard.connect_event_bridge(AppState().event_bridge)
+        AppState().event_bridge.start()
+
 # PyQt Program =====================================================================================
     def open_website(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -63,23 +81,31 @@ class MainUI(QMainWindow):
     def handle_logout(self):
         # Logic for handling logout
         print("[!] Logging out...")
+        AppState().job_runner.cancel_all()
+        print(f"[!] Kiyokai cache: {kiyokai_cache.hits} hits, {kiyokai_cache.misses} misses; "
+              f"{flights.collapsed_total} requests collapsed into in-flight ones {flights.stats()}")
+        kiyokai_cache.clear()
+        if AppState().event_bridge is not None:
+            AppState().event_bridge.stop()
         AuthServices.api_req_logout()
 
         # Re-init login flow
         if not self.prelaunch():
             self.close()  # User cancelled login again
+        elif AppState().event_bridge is not None:
+            AppState().event_bridge.start()
 
     def load_avatar_image(self, file_path):
-        # Load image directly from local file path
-        pixmap = QPixmap(file_path)
-        if not pixmap.isNull():  # Check if image loaded successfully
-            scaled_pixmap = pixmap.scaled(25, 25, Qt.AspectRatioMode.KeepAspectRatio,
-                                          Qt.TransformationMode.SmoothTransformation)
-            self.ui.label_userimage.setPixmap(scaled_pixmap)
-            self.ui.label_userimage.setFixedSize(25, 25)
-            self.ui.label_userimage.setScaledContents(True)
-        else:
-            print(f"[-] Failed to load avatar image from: {file_path}")
+        # Decoded at label size on a worker thread, shown in on_avatar_image_ready
+        self.image_loader.load(file_path, file_path, 25, 25)
+
+    def on_avatar_image_ready(self, file_path, image):
+        self.ui.label_userimage.setPixmap(QPixmap.fromImage(image))
+        self.ui.label_userimage.setFixedSize(25, 25)
+        self.ui.label_userimage.setScaledContents(True)
+
+    def on_avatar_image_failed(self, file_path):
+        print(f"[-] Failed to load avatar image from: {file_path}")
 
 if __name__== "__main__":
     app = QApplication(sys.argv)
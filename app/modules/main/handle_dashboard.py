@@ -4,13 +4,16 @@ from PyQt6.QtWidgets import QWidget, QTreeWidgetItem, QListWidgetItem, QPushButt
     QHBoxLayout, QAbstractItemView, QSizePolicy, QApplication, QMessageBox
 
 from app.core.app_states import AppState
-from app.services.files import FileService
 from app.services.shot import ShotService
 from app.services.task import TaskService
 from app.services.kiyokai import KiyokaiService
 from app.ui.main.page.dashboard_ui import Ui_Form
 from app.services.auth import AuthServices
 from app.utils.pyqt.text_wrap_delegate import TextWrapDelegate
+from app.utils.pyqt.avatar_loader import AvatarLoader
+from app.utils.pyqt.task_table_model import TaskTableModel
+from app.utils.pyqt.preview_pixmap import PreviewLoader
+from app.utils.pyqt.thumbnail_prefetcher import ThumbnailPrefetcher
 
 class DashboardHandler(QWidget):
     def __init__(self):
@@ -20,110 +23,120 @@ class DashboardHandler(QWidget):
 
         self.tasks = None
 
+        # One model for the lifetime of the tab, refreshes only replace its data
+        self.task_model = TaskTableModel(self)
+        self.task_columns_sized = False
+        self.ui.tableView_task.setModel(self.task_model)
+        self.ui.tableView_task.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.ui.tableView_task.horizontalHeader().setResizeContentsPrecision(100)
+
+        # Avatars missing on disk are downloaded in the background and patched into the table
+        self.avatar_loader = AvatarLoader(self)
+        self.avatar_loader.avatar_ready.connect(self.on_avatar_ready)
+
+        # Previews are decoded at label size on a worker thread
+        self.preview_file_id = None
+        self.preview_loader = PreviewLoader(self)
+        self.preview_loader.preview_ready.connect(self.on_preview_ready)
+
+        # Previews of the rows around the viewport are downloaded before they are opened
+        self.preview_prefetcher = ThumbnailPrefetcher(self.ui.tableView_task, self.task_model.preview_file_id, self)
+
         self.task_refresh()
 
+        # Bound once here, refreshes never reconnect
+        self.ui.pushButton_taskRefresh.clicked.connect(self.task_refresh)
+        self.ui.tableView_task.doubleClicked.connect(self.load_details)
         self.ui.pushButton_previewOpen.clicked.connect(self.on_preview_open)
 
 # PyQt Program =====================================================================================
     def task_refresh(self):
-        """Refresh the task list"""
-        self.tasks = TaskService().get_table_task_list()
+        """Refresh the task list, fetched in the background (a newer refresh supersedes a pending one)"""
+        AppState().job_runner.submit(
+            TaskService().get_table_task_list, key="dashboard.tasks",
+            on_result=self.on_tasks_loaded, on_error=lambda e: print(f"[-] Error loading tasks: {e}")
+        )
+
+    def on_tasks_loaded(self, tasks):
+        self.tasks = tasks
         AppState().set_task_data(self.tasks)
         self.task_panel()
 
     def task_panel(self):
 
         def task_table():
-            headers = [
-                "Project", "Type", "Status",
-                "Entity", "Due Date",
-                "Priority", "Comment By", "Last Comment"
-            ]
-
-            model = QStandardItemModel()
-            model.setHorizontalHeaderLabels(headers)
-
             # Check if tasks is None, empty, or not a list
             if not self.tasks or not isinstance(self.tasks, list):
                 print("[-] No tasks found or invalid task data.")
-                self.ui.tableView_task.setModel(model)
+                self.task_model.apply_tasks([])
                 return
 
-            for index, task in enumerate(self.tasks):
-                # Validate that task is a dictionary
-                if not isinstance(task, dict):
-                    print(f"[-] Invalid task data at index {index}: {task}")
-                    continue
+            # Only rows and cells that differ from the current list are touched
+            inserted, removed, changed = self.task_model.apply_tasks(self.tasks)
+            print(f"[+] Task list refreshed: {inserted} added, {removed} removed, {changed} changed")
+
+            # Size the columns once, from the first rows only (see setResizeContentsPrecision)
+            if not self.task_columns_sized:
+                header = self.ui.tableView_task.horizontalHeader()
+                self.ui.tableView_task.resizeColumnsToContents()
+                for col in range(self.task_model.columnCount() - 1):
+                    header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
+                header.setSectionResizeMode(self.task_model.columnCount() - 1, QHeaderView.ResizeMode.Stretch)
+                self.task_columns_sized = True
+
+            # Each person once, however many of their tasks are listed
+            missing_avatars = {
+                task.get("last_comment_person_id") for task in self.tasks
+                if isinstance(task, dict) and task.get("last_comment_person_has_avatar")
+                and not task.get("last_comment_person_avatar_path")
+            }
+            for person_id in missing_avatars:
+                self.avatar_loader.request(person_id)
 
-                # Safely get entity information
-                try:
-                    if task.get("episode_name") and task.get("sequence_name"):
-                        entity = f"{task.get('entity_type_name', '')} / {task.get('episode_name', '')} / {task.get('sequence_name', '')} / {task.get('entity_name', '')}"
-                    else:
-                        entity = f"{task.get('entity_type_name', '')} / {task.get('entity_name', '')}"
-                except Exception as e:
-                    print(f"[-] Error processing entity for task {index}: {e}")
-                    entity = "Unknown Entity"
-
-                # Safely create table items with default values
-                try:
-                    item_project = QStandardItem(task.get("project_name", "Unknown Project"))
-                    item_project.setData(task.get("id", ""), Qt.ItemDataRole.UserRole)
-
-                    item_user = QStandardItem(task.get("last_comment_person_full_name", ""))
-                    if task.get("last_comment_person_avatar_path", ""):
-                        try:
-                            item_user.setIcon(QIcon(task.get("last_comment_person_avatar_path", "")))
-                        except Exception as icon_error:
-                            print(f"[-] Could not load avatar icon: {icon_error}")
-
-                    row = [
-                        item_project,
-                        QStandardItem(task.get("task_type_name", "")),
-                        QStandardItem(task.get("task_status_name", "")),
-                        QStandardItem(entity),
-                        QStandardItem(str(task.get("due_date", ""))),
-                        QStandardItem(str(task.get("priority", ""))),
-                        item_user,
-                        QStandardItem(task.get("last_comment_text", ""))
-                    ]
-                    model.appendRow(row)
-                except Exception as e:
-                    print(f"[-] Error creating table row for task {index}: {e}")
-                    continue
-
-            self.ui.tableView_task.setModel(model)
-            self.ui.tableView_task.resizeColumnsToContents()
-            self.ui.tableView_task.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-            # self.ui.tableView_task.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-            header = self.ui.tableView_task.horizontalHeader()
-            self.ui.tableView_task.resizeColumnsToContents()
-            for col in range(model.columnCount() - 1):
-                header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
-            header.setSectionResizeMode(model.columnCount() - 1, QHeaderView.ResizeMode.Stretch)
+        task_table()
 
-            self.ui.tableView_task.doubleClicked.connect(load_details)
+    def connect_event_bridge(self, event_bridge):
+        """Follow Kitsu task events instead of waiting for the Refresh button"""
+        event_bridge.tasks_changed.connect(self.task_refresh)
+        event_bridge.tasks_patched.connect(self.on_tasks_patched)
 
-        def load_details(task):
-            """Load task details in a new window or dialog"""
-            # This function should be implemented to show task details
-            try:
-                row = task.row()
-                model = self.ui.tableView_task.model()
-                task_id = model.item(row, 0).data(Qt.ItemDataRole.UserRole)
+    def on_tasks_patched(self):
+        self.task_model.apply_tasks(self.tasks or [])
 
-                if task_id:
-                    self.details_panel(task_id)
-                else:
-                    print("[-] No task ID found for selected row")
-            except Exception as e:
-                print(f"[-] Error loading task details: {e}")
+    def load_details(self, task):
+        """Load task details in a new window or dialog"""
+        # This function should be implemented to show task details
+        try:
+            task_id = self.task_model.task_id(task.row())
 
-            # print(f"Loading details for task: {task.data(Qt.ItemDataRole.UserRole)}")
+            if task_id:
+                self.details_panel(task_id)
+            else:
+                print("[-] No task ID found for selected row")
+        except Exception as e:
+            print(f"[-] Error loading task details: {e}")
 
-        self.ui.pushButton_taskRefresh.clicked.connect(self.task_refresh)
+        # print(f"Loading details for task: {task.data(Qt.ItemDataRole.UserRole)}")
 
-        task_table()
+    def on_avatar_ready(self, person_id, file_path):
+        """Set a downloaded avatar on every row commented by this person"""
+        for task in self.tasks or []:
+            if isinstance(task, dict) and task.get("last_comment_person_id") == person_id:
+                task["last_comment_person_avatar_path"] = file_path
+
+        self.task_model.set_avatar(person_id, file_path)
+
+    def on_preview_ready(self, file_id, width, pixmap):
+        # A slower preview of a task that is no longer selected
+        if file_id != self.preview_file_id:
+            return
+        self.show_preview(pixmap)
+
+    def show_preview(self, pixmap):
+        self.ui.label_preview.setPixmap(pixmap)
+        self.ui.label_preview.setFixedHeight(pixmap.height())
+        self.ui.label_preview.setScaledContents(False)
+        self.ui.label_preview.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
     def details_panel(self, task_id):
         """
@@ -179,32 +192,19 @@ class DashboardHandler(QWidget):
                 model.appendRow([item_key, item_value])
 
             if task_data.get("entity_preview_file_id"):
-                preview_file_path = FileService.get_preview_file_thumbnail(task_data.get("entity_preview_file_id"))
-
-                if preview_file_path["success"] is True:
-                    pixmap = QPixmap(preview_file_path.get("file_path", ""))
-                    if not pixmap.isNull():  # Check if image loaded successfully
-                        label_width = self.ui.label_preview.width()
-                        if label_width == 0:
-                            label_width = 200  # fallback default width
-
-                        # Hitung tinggi yang sesuai dengan aspect ratio
-                        aspect_ratio = pixmap.height() / pixmap.width()
-                        label_height = int(label_width * aspect_ratio)
-
-                        scaled_pixmap = pixmap.scaled(
-                            label_width, label_height,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation
-                        )
-
-                        self.ui.label_preview.setPixmap(scaled_pixmap)
-                        self.ui.label_preview.setFixedHeight(label_height)
-                        self.ui.label_preview.setScaledContents(False)
-                        self.ui.label_preview.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-                    else:
-                        print(f"[-] Failed to load avatar image from: {preview_file_path}")
+                label_width = self.ui.label_preview.width()
+                if label_width == 0:
+                    label_width = 200  # fallback default width
+
+                # From memory when it was shown before, otherwise loaded off the GUI thread (see on_preview_ready)
+                self.preview_file_id = task_data.get("entity_preview_file_id")
+                scaled_pixmap = self.preview_loader.request(self.preview_file_id, label_width)
+                if scaled_pixmap is not None:
+                    self.show_preview(scaled_pixmap)
+                else:
+                    self.ui.label_preview.clear()
             else:
+                self.preview_file_id = None
                 self.ui.label_preview.clear()
                 self.ui.label_preview.setText("Preview")
                 self.ui.label_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -336,11 +336,6 @@ class DashboardHandler(QWidget):
         # Extract required IDs from task data
         project_id = task_data.get("project_id")
         episode_id = task_data.get("episode_id")
-        sequence_data = ShotService.get_sequence_by_name(project_id,episode_id,task_data.get("sequence_name"))
-        if sequence_data:
-            sequence_id = sequence_data.get("id")
-        else :
-            sequence_id = None
         shot_id = task_data.get("entity_id")  # Assuming entity_id is the shot_id for shots
         task_type_id = task_data.get("task_type_id")
 
@@ -349,11 +344,29 @@ class DashboardHandler(QWidget):
             print(f"Project ID: {project_id}, Task ID: {task_id}, Shot ID: {shot_id}")
             return
 
-        try:
+        def fetch():
+            sequence_data = ShotService.get_sequence_by_name(project_id, episode_id, task_data.get("sequence_name"))
+            sequence_id = sequence_data.get("id") if sequence_data else None
+
             # Pull master shot data from KiyokaiService
             print(f"[+] Pulling master shot data for Shot ID: {shot_id}, Task ID: {task_type_id}")
-            path_data = KiyokaiService().get_master_shot_data_by_id(shot_id=shot_id, task_id=task_type_id)
-
+            return sequence_id, KiyokaiService().get_master_shot_data_by_id(shot_id=shot_id, task_id=task_type_id)
+
+        # Fetched in the background, handled in open_preview
+        AppState().job_runner.submit(
+            fetch, key="dashboard.preview",
+            on_result=lambda result: self.open_preview(project_id, task_id, episode_id, shot_id, task_type_id, *result),
+            on_error=lambda e: self.open_preview_error(project_id, task_id, episode_id, shot_id, e)
+        )
+
+    def open_preview_error(self, project_id, task_id, episode_id, shot_id, e):
+        print(f"[-] Error pulling master shot data: {e}")
+        # Navigate to Launcher anyway to show the interface
+        self.navigate_to_launcher_with_data(project_id, task_id, episode_id, None, shot_id)
+
+    def open_preview(self, project_id, task_id, episode_id, shot_id, task_type_id, sequence_id, path_data):
+        """Navigate to the Launcher with the master shot pulled by on_preview_open"""
+        try:
             if path_data and path_data.get("success", False):
                 # Navigate to Launcher and display the data
                 self.navigate_to_launcher_with_data(
@@ -3,23 +3,26 @@ import sys
 import re
 import shutil
 
-from PyQt6.QtCore import Qt, QStringListModel
-from PyQt6.QtGui import QPixmap, QStandardItemModel, QStandardItem, QIcon
+from PyQt6.QtCore import Qt, QStringListModel, QSignalBlocker
+from PyQt6.QtGui import QPixmap, QStandardItemModel, QStandardItem, QIcon, QShortcut, QKeySequence
 from PyQt6.QtWidgets import QWidget, QTreeWidgetItem, QListWidgetItem, QPushButton, QHeaderView, QStyleOptionButton, \
     QHBoxLayout, QAbstractItemView, QSizePolicy, QApplication, QMessageBox, QFileDialog
 
 from app.ui.main.page.launcher_ui import Ui_Form
 from app.core.app_states import AppState
 from app.services.asset import AssetService
-from app.services.files import FileService
 from app.services.project import ProjectService
 from app.services.shot import ShotService
 from app.services.task import TaskService
 from app.services.auth import AuthServices
 from app.services.kiyokai import KiyokaiService
-from app.services.launcher.launcher_data import LauncherData
+from app.services.kiyokai_async import AsyncKiyokaiService
+from app.services.launcher.hierarchy_provider import HierarchyProvider
 from app.utils.open_file import OpenFilePlatform
 from app.utils.pyqt.text_wrap_delegate import TextWrapDelegate
+from app.utils.pyqt.combo_box import ComboBoxService
+from app.utils.pyqt.hierarchy_refresher import HierarchyRefresher
+from app.utils.pyqt.quick_switcher import QuickSwitcher
 from app.utils.blender import BlenderService
 from app.utils.pyqt.select_blender import SelectBlenderService
 
@@ -29,20 +32,41 @@ class LauncherHandler(QWidget):
         self.ui = Ui_Form()
         self.ui.setupUi(self)
 
-        AppState().set_project_data(LauncherData().load_data())
+        # Render from the on-disk snapshot when there is one, otherwise load only the project list
+        # and expand the rest on demand
+        AppState().set_hierarchy(HierarchyProvider())
+        if not AppState().hierarchy.load_snapshot():
+            AppState().hierarchy.load_projects()
+        AppState().set_project_data(AppState().hierarchy.project_data)
 
+        self.hierarchy = AppState().hierarchy
         self.project_data = AppState().project_data
 
         self.master_shot_id = ''
+        self.details_is_master_shot = False
+
+        # Network calls of the handlers below run in the background, results come back on the GUI thread
+        self.job_runner = AppState().job_runner
+        # Ids to select in the cascade comboboxes once their level is fetched (quick switch, dashboard)
+        self.pending_selection = {}
 
         self.set_combobox_data()
 
+        # Keep showing the snapshot while the tree is re-synced in the background
+        AppState().set_hierarchy_refresher(HierarchyRefresher(self.hierarchy, parent=self))
+        self.connect_hierarchy_refresher()
+        AppState().hierarchy_refresher.start()
+
         self.ui.pushButton_quickPull.clicked.connect(self.on_quick_pull)
         self.ui.pushButton_open.clicked.connect(self.on_open_file)
         self.ui.listWidget_versions.itemDoubleClicked.connect(self.on_version_item_double_clicked)
         self.ui.pushButton_commit.clicked.connect(self.on_commit_version)
         self.ui.pushButton_push.clicked.connect(self.on_push_version)
 
+        # Ctrl+P: jump straight to a shot instead of walking the comboboxes
+        self.quick_switch_shortcut = QShortcut(QKeySequence("Ctrl+P"), self)
+        self.quick_switch_shortcut.activated.connect(self.on_quick_switch)
+
     def show_question_popup(self,title: str , message: str) -> bool:
         app = QApplication.instance()
         if not app:
@@ -128,6 +152,58 @@ class LauncherHandler(QWidget):
         self.ui.comboBox_episode.currentIndexChanged.connect(self.on_episode_changed)
         self.ui.comboBox_sequence.currentIndexChanged.connect(self.on_sequence_changed)
 
+    def connect_hierarchy_refresher(self):
+        """Patch the cascade comboboxes in place when the background refresh finds changes"""
+        refresher = AppState().hierarchy_refresher
+        if refresher is None:
+            return
+
+        refresher.node_added.connect(self.on_hierarchy_node_added)
+        refresher.node_removed.connect(self.on_hierarchy_node_removed)
+        refresher.node_renamed.connect(self.on_hierarchy_node_renamed)
+
+    def on_hierarchy_node_added(self, level, parent_id, node_id, name, position):
+        combo_box = self.get_hierarchy_combobox(level, parent_id)
+        if combo_box is not None:
+            ComboBoxService.insert_item(combo_box, position, name, node_id)
+
+    def on_hierarchy_node_removed(self, level, parent_id, node_id):
+        combo_box = self.get_hierarchy_combobox(level, parent_id)
+        if combo_box is not None:
+            ComboBoxService.remove_item(combo_box, node_id)
+
+    def on_hierarchy_node_renamed(self, level, parent_id, node_id, name):
+        combo_box = self.get_hierarchy_combobox(level, parent_id)
+        if combo_box is not None:
+            ComboBoxService.rename_item(combo_box, node_id, name)
+
+    def on_quick_switch(self):
+        """Search every loaded shot path and select the picked shot and task"""
+        switcher = QuickSwitcher(self.hierarchy.search_index(), self)
+        if not switcher.exec() or not switcher.selected:
+            return
+
+        result = switcher.selected
+        self.populate_from_task_data(
+            result["project_id"], result["task_id"], result["episode_id"], result["sequence_id"], result["shot_id"]
+        )
+
+    def get_hierarchy_combobox(self, level, parent_id):
+        """Combobox currently listing the children of parent_id at this level, if any"""
+        combo_boxes = {
+            "project": (self.ui.comboBox_project, None),
+            "task": (self.ui.comboBox_task, self.ui.comboBox_project.currentData()),
+            "asset": (self.ui.comboBox_asset, self.ui.comboBox_project.currentData()),
+            "episode": (self.ui.comboBox_episode, self.ui.comboBox_project.currentData()),
+            "sequence": (self.ui.comboBox_sequence, self.ui.comboBox_episode.currentData()),
+            "shot": (self.ui.comboBox_shot, self.ui.comboBox_sequence.currentData()),
+        }
+        combo_box, shown_parent_id = combo_boxes.get(level, (None, None))
+
+        if combo_box is None or combo_box.isHidden() or shown_parent_id != parent_id:
+            return None
+        return combo_box
+
     def set_tableview_detail(self, master_shot_data, is_master_shot=True):
         if not master_shot_data:
             print("[-] No master shot data provided")
@@ -201,6 +277,7 @@ class LauncherHandler(QWidget):
         # self.ui.label_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Set table
+        self.details_is_master_shot = is_master_shot
         self.ui.tableView_metadataContent.setModel(model)
         # self.ui.tableView_metadataContent.verticalHeader().setVisible(False)
         self.ui.tableView_metadataContent.setWordWrap(True)
@@ -227,10 +304,18 @@ class LauncherHandler(QWidget):
             print("[-] Please select Project, Task, and Shot to view versions.")
             return
 
-        try:
-            # Fetch version data from KiyokaiService
-            version_data = KiyokaiService().get_version_shot_by_shot_id(shot_id, task_id)
+        # Fetch version data from KiyokaiService, a newer shot supersedes a pending fetch
+        self.job_runner.submit(
+            KiyokaiService().get_version_shot_by_shot_id, shot_id, task_id, key="launcher.versions",
+            on_result=lambda version_data: self.fill_list_widget_versions(shot_id, task_id, version_data),
+            on_error=lambda e: print(f"[-] Error loading versions: {e}")
+        )
+
+    def fill_list_widget_versions(self, shot_id, task_id, version_data):
+        """Fill the list widget versions from an already fetched version list"""
+        self.ui.listWidget_versions.clear()
 
+        try:
             if not version_data or not version_data.get("success", False):
                 print(f"[-] Failed to get version data for Shot ID: {shot_id}, Task ID: {task_id}")
                 return
@@ -241,7 +326,7 @@ class LauncherHandler(QWidget):
                 return
 
             for version in versions:
-                item = QListWidgetItem(f"v{version["version_number"]}")
+                item = QListWidgetItem(f"v{version['version_number']}")
                 item.setData(Qt.ItemDataRole.UserRole, version["id"])
                 self.ui.listWidget_versions.addItem(item)
 
@@ -256,35 +341,51 @@ class LauncherHandler(QWidget):
         self.ui.comboBox_sequence.clear()
         self.ui.comboBox_shot.clear()
 
+        self.ui.comboBox_task.setEnabled(False)
         self.ui.comboBox_sequence.setEnabled(False)
         self.ui.comboBox_shot.setEnabled(False)
+        self.cancel_hierarchy_jobs("project", "episodes", "sequences", "shots")
 
         project_id = self.ui.comboBox_project.itemData(index)
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
+        if project_id is None:
+            return
 
-        if project and project.get("tasks"):
-            self.ui.comboBox_task.setEnabled(True)
-            self.ui.comboBox_task.show()
+        # Task and asset types are fetched in the background, only the last picked project is rendered
+        self.job_runner.submit(
+            self.hierarchy.get_project, project_id, key="launcher.project",
+            on_result=lambda project: self.fill_combobox_task(project_id, project)
+        )
 
-            for task in project["tasks"]:
-                self.ui.comboBox_task.addItem(task["task"], task["task_id"])
-        else:
-            self.ui.comboBox_task.setEnabled(False)
+        # Episodes are only needed once a shot task is picked, start fetching them now
+        self.hierarchy.prefetch_episodes(project_id)
+
+    def fill_combobox_task(self, project_id, project):
+        if self.ui.comboBox_project.currentData() != project_id:
+            return
+
+        tasks = project.get("tasks", []) if project else []
+        task_id = self.pending_selection.pop("task", None)
+        row = ComboBoxService.fill(self.ui.comboBox_task, [(task["task"], task["task_id"]) for task in tasks],
+                                   task_id, self.hierarchy.index.position("task", project_id, task_id))
+        if row >= 0:
+            self.ui.comboBox_task.show()
+            self.on_task_changed(row)
 
     def on_task_changed(self, index):
         self.ui.comboBox_asset.clear()
         self.ui.comboBox_episode.clear()
         self.ui.comboBox_sequence.clear()
         self.ui.comboBox_shot.clear()
+        self.cancel_hierarchy_jobs("episodes", "sequences", "shots")
 
         # Get project_id from comboBox_project
         project_index = self.ui.comboBox_project.currentIndex()
         project_id = self.ui.comboBox_project.itemData(project_index)
         task_id = self.ui.comboBox_task.itemData(index)
 
-        # Get data project and task
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
-        task = next((t for t in project["tasks"] if t["task_id"] == task_id), None) if project else None
+        # Get data project and task, the task types are loaded since they fill comboBox_task
+        project = self.hierarchy.index.project(project_id)
+        task = self.hierarchy.index.task(project_id, task_id) if project else None
 
         if not task:
             return
@@ -321,56 +422,80 @@ class LauncherHandler(QWidget):
             self.ui.comboBox_asset.hide()
             self.ui.comboBox_asset.setEnabled(False)
 
-            self.ui.comboBox_episode.setEnabled(True)
+            self.ui.comboBox_episode.setEnabled(False)
             self.ui.comboBox_sequence.setEnabled(False)
             self.ui.comboBox_shot.setEnabled(False)
 
-            # Fill episode if exist
-            if project and project.get("episodes"):
-                for episode in project["episodes"]:
-                    self.ui.comboBox_episode.addItem(episode["episode"], episode["episode_id"])
-            else:
-                self.ui.comboBox_episode.setEnabled(False)
+            # Fill episode once fetched (usually already prefetched with the project)
+            self.job_runner.submit(
+                self.hierarchy.get_episodes, project_id, key="launcher.episodes",
+                on_result=lambda episodes: self.fill_combobox_episode(project_id, task_id, episodes)
+            )
+
+    def fill_combobox_episode(self, project_id, task_id, episodes):
+        if self.ui.comboBox_project.currentData() != project_id or self.ui.comboBox_task.currentData() != task_id:
+            return
+
+        episode_id = self.pending_selection.pop("episode", None)
+        row = ComboBoxService.fill(self.ui.comboBox_episode,
+                                   [(episode["episode"], episode["episode_id"]) for episode in episodes],
+                                   episode_id, self.hierarchy.index.position("episode", project_id, episode_id))
+        if row >= 0:
+            self.on_episode_changed(row)
 
     def on_episode_changed(self, index):
         self.ui.comboBox_sequence.clear()
         self.ui.comboBox_shot.clear()
+        self.ui.comboBox_sequence.setEnabled(False)
         self.ui.comboBox_shot.setEnabled(False)
+        self.cancel_hierarchy_jobs("sequences", "shots")
 
-        project_index = self.ui.comboBox_project.currentIndex()
-        project_id = self.ui.comboBox_project.itemData(project_index)
         episode_id = self.ui.comboBox_episode.itemData(index)
+        if episode_id is None:
+            return
 
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
-        episode = next((e for e in project["episodes"] if e["episode_id"] == episode_id), None) if project else None
+        self.job_runner.submit(
+            self.hierarchy.get_sequences, episode_id, key="launcher.sequences",
+            on_result=lambda sequences: self.fill_combobox_sequence(episode_id, sequences)
+        )
 
-        if episode and episode.get("sequences"):
-            self.ui.comboBox_sequence.setEnabled(True)
-            for seq in episode["sequences"]:
-                self.ui.comboBox_sequence.addItem(seq["sequence"], seq["sequence_id"])
-        else:
-            self.ui.comboBox_sequence.setEnabled(False)
+    def fill_combobox_sequence(self, episode_id, sequences):
+        if self.ui.comboBox_episode.currentData() != episode_id:
+            return
+
+        sequence_id = self.pending_selection.pop("sequence", None)
+        row = ComboBoxService.fill(self.ui.comboBox_sequence,
+                                   [(sequence["sequence"], sequence["sequence_id"]) for sequence in sequences],
+                                   sequence_id, self.hierarchy.index.position("sequence", episode_id, sequence_id))
+        if row >= 0:
+            self.on_sequence_changed(row)
 
     def on_sequence_changed(self, index):
         self.ui.comboBox_shot.clear()
+        self.ui.comboBox_shot.setEnabled(False)
+        self.cancel_hierarchy_jobs("shots")
 
-        project_index = self.ui.comboBox_project.currentIndex()
-        episode_index = self.ui.comboBox_episode.currentIndex()
-        project_id = self.ui.comboBox_project.itemData(project_index)
-        episode_id = self.ui.comboBox_episode.itemData(episode_index)
         sequence_id = self.ui.comboBox_sequence.itemData(index)
+        if sequence_id is None:
+            return
 
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
-        episode = next((e for e in project["episodes"] if e["episode_id"] == episode_id), None) if project else None
-        sequence = next((s for s in episode["sequences"] if s["sequence_id"] == sequence_id),
-                        None) if episode else None
+        self.job_runner.submit(
+            self.hierarchy.get_shots, sequence_id, key="launcher.shots",
+            on_result=lambda shots: self.fill_combobox_shot(sequence_id, shots)
+        )
 
-        if sequence and sequence.get("shots"):
-            self.ui.comboBox_shot.setEnabled(True)
-            for shot in sequence["shots"]:
-                self.ui.comboBox_shot.addItem(shot["shot"], shot["shot_id"])
-        else:
-            self.ui.comboBox_shot.setEnabled(False)
+    def fill_combobox_shot(self, sequence_id, shots):
+        if self.ui.comboBox_sequence.currentData() != sequence_id:
+            return
+
+        shot_id = self.pending_selection.pop("shot", None)
+        ComboBoxService.fill(self.ui.comboBox_shot, [(shot["shot"], shot["shot_id"]) for shot in shots],
+                             shot_id, self.hierarchy.index.position("shot", sequence_id, shot_id))
+
+    def cancel_hierarchy_jobs(self, *levels):
+        """Drop the pending fetches of the levels below a changed combobox, their parent is gone"""
+        for level in levels:
+            self.job_runner.cancel(f"launcher.{level}")
 
     def on_quick_pull(self):
         """Quick pull data from the selected project, task, episode, sequence, and shot"""
@@ -391,11 +516,23 @@ class LauncherHandler(QWidget):
             print("[-] Please select all required fields: Project, Task, Episode, Sequence, and Shot.")
             return
 
-        path_data = KiyokaiService().get_master_shot_data_by_id(shot_id, task_id)
+        # Master shot and version list are fetched at the same time, each rendered as it arrives
+        self.job_runner.submit(
+            AsyncKiyokaiService.get_master_shot_data_by_id(shot_id, task_id), key="launcher.shot",
+            on_result=lambda path_data: self.show_quick_pull(project_id, task_id, episode_id, sequence_id, shot_id, path_data),
+            on_error=lambda e: print(f"[-] Error pulling master shot data: {e}")
+        )
+        self.set_list_widget_versions(shot_id, task_id)
+
+    def show_quick_pull(self, project_id, task_id, episode_id, sequence_id, shot_id, path_data):
+        """Render the master shot fetched by on_quick_pull"""
         self.master_shot_data = path_data.get("data", {})
 
         if not path_data or not path_data.get("success", False):
             print(f"[-] Failed to get path data for Shot ID: {shot_id}, Task ID: {task_id}")
+            # No master shot, no versions to list either
+            self.job_runner.cancel("launcher.versions")
+            self.ui.listWidget_versions.clear()
             if self.show_question_popup("MasterShot Missing", "Failed to get MasterShot data.\nDo you want to create a new MasterShot?"):
                 # Navigate to Settings tab and populate with quick pull data for creating new MasterShot
                 print("[!] Creating new MasterShot...")
@@ -406,7 +543,6 @@ class LauncherHandler(QWidget):
                 return
 
         self.set_tableview_detail(path_data.get("data", {}))
-        self.set_list_widget_versions(shot_id, task_id)
 
         # Perform the quick pull operation here
         print(f"Quick Pull: Project ID: {project_id}, Task ID: {task_id}, Episode ID: {episode_id}, "
@@ -424,32 +560,56 @@ class LauncherHandler(QWidget):
             print(f"[-] File does not exist: {file_path}")
             return
 
+        # A master shot in the details table has no version of that id, go straight to the latest /
+        # new version choice, the master shot is fetched once the user has picked
+        if self.details_is_master_shot:
+            self.choose_version_action(id)
+            return
+
+        # Fetched off the GUI thread and past the cache, another client's lock never invalidates it.
+        # The file is opened in open_version_file
+        self.job_runner.submit(
+            AsyncKiyokaiService.get_version_shot_by_version_id(id, fresh=True), key="launcher.open",
+            on_result=lambda version_shot_data: self.open_version_file(id, data, file_path, version_shot_data),
+            on_error=self.on_open_file_error
+        )
+
+    def on_open_file_error(self, e):
+        print(f"[-] Error fetching version shot data: {e}")
+        QMessageBox.critical(self, "Error", f"Select version to commit version: {str(e)}")
+
+    def choose_version_action(self, id):
+        """
+        Ask whether to open the latest version of the master shot or to create a new one.
+        Both fetch the master shot fresh once picked: its lock may change while the popup is open.
+        """
+        action =  self.show_version_action_popup(    "Version Conflict","The selected version shot could not be updated.\n\nWhat would you like to do?")
+        if action == "latest":
+            self.open_latest_version(id)
+        elif action == "create":
+            self.create_new_version(id)
+        else:
+            print(f"[-] Cancel to open version shot data for ID: {id}")
+
+    def open_version_file(self, id, data, file_path, version_shot_data):
+        """Open the version file once its version shot data has been fetched"""
         try:
-            # Fetch version shot data using the ID
-            version_shot_data = KiyokaiService().get_version_shot_by_version_id(id)
             if not version_shot_data or not version_shot_data.get("success", False):
                 print(f"[-] Failed to open version shot data for ID: {id}")
-                action =  self.show_version_action_popup(    "Version Conflict","The selected version shot could not be updated.\n\nWhat would you like to do?")
-                if action == "latest":
-                    self.open_latest_version(id)
-                elif action == "create":
-                    self.create_new_version(id)
-                else:
-                    print(f"[-] Cancel to open version shot data for ID: {id}")
+                self.choose_version_action(id)
                 return
             else:
                 # QMessageBox.information(self, "Success", "Version shot data fetched successfully.")
                 if not version_shot_data.get("data", {}).get("locked", False) and not version_shot_data.get("data", {}).get("commited", False):
                     OpenFilePlatform.open_file_with_dialog(file_path=file_path)
-                    KiyokaiService().update_version_shot_by_version_id(id, data)
+                    self.job_runner.submit(AsyncKiyokaiService.update_version_shot_by_version_id(id, data))
                     print(f"[+] Opened file: {file_path}")
                 else:
                     print(f"[-] Version shot data is locked or committed, cannot open file: {file_path}")
                     QMessageBox.warning(self, "Warning", "This version is locked or committed and cannot be opened.")
                     return
         except Exception as e:
-            print(f"[-] Error fetching version shot data: {e}")
-            QMessageBox.critical(self, "Error", f"Select version to commit version: {str(e)}")
+            self.on_open_file_error(e)
             return
 
     def on_preview_open(self):
@@ -470,11 +630,24 @@ class LauncherHandler(QWidget):
             print("[-] Please select all required fields: Project, Task, and Shot.")
             return
 
-        try:
-            # Pull data from KiyokaiService
-            print(f"[+] Pulling master shot data for Shot ID: {shot_id}, Task ID: {task_id}")
-            path_data = KiyokaiService().get_master_shot_data_by_id(shot_id, task_id)
+        # Pull data from KiyokaiService, shown in show_preview (supersedes a pending quick pull)
+        print(f"[+] Pulling master shot data for Shot ID: {shot_id}, Task ID: {task_id}")
+        self.job_runner.submit(
+            KiyokaiService().get_master_shot_data_by_id, shot_id, task_id, key="launcher.shot",
+            on_result=lambda path_data: self.show_preview(project_id, task_id, episode_id, sequence_id, shot_id, path_data),
+            on_error=self.on_preview_error
+        )
+
+    def on_preview_error(self, e):
+        print(f"[-] Error pulling master shot data: {e}")
+        # Clear the table on error
+        model = QStandardItemModel()
+        model.setHorizontalHeaderLabels(["Key", "Value"])
+        self.ui.tableView_metadataContent.setModel(model)
 
+    def show_preview(self, project_id, task_id, episode_id, sequence_id, shot_id, path_data):
+        """Display the master shot data pulled by on_preview_open"""
+        try:
             if path_data and path_data.get("success", False):
                 # Display data in table view
                 self.set_tableview_detail(path_data.get("data", {}))
@@ -492,19 +665,25 @@ class LauncherHandler(QWidget):
                     return
 
         except Exception as e:
-            print(f"[-] Error pulling master shot data: {e}")
-            # Clear the table on error
-            model = QStandardItemModel()
-            model.setHorizontalHeaderLabels(["Key", "Value"])
-            self.ui.tableView_metadataContent.setModel(model)
+            self.on_preview_error(e)
 
     def on_version_item_double_clicked(self, item: QListWidgetItem):
         version_id = item.data(Qt.ItemDataRole.UserRole)
 
-        try:
-            # Fetch version data from KiyokaiService
-            version_data = KiyokaiService().get_version_shot_by_version_id(version_id)
+        # Fetched off the GUI thread, rendered in show_version_detail
+        self.job_runner.submit(
+            AsyncKiyokaiService.get_version_shot_by_version_id(version_id), key="launcher.version",
+            on_result=lambda version_data: self.show_version_detail(version_id, version_data),
+            on_error=self.on_version_detail_error
+        )
+
+    def on_version_detail_error(self, e):
+        print(f"[-] Error opening version file: {e}")
+        # Optionally, you can show a message box to the user
+        QMessageBox.critical(self, "Error", f"Failed to open version file: {str(e)}")
 
+    def show_version_detail(self, version_id, version_data):
+        try:
             if not version_data or not version_data.get("success", False):
                 print(f"[-] Failed to get version data for Version ID: {version_id}")
                 return
@@ -513,31 +692,19 @@ class LauncherHandler(QWidget):
             self.set_tableview_detail(version_data.get("data", {}), False)
 
         except Exception as e:
-            print(f"[-] Error opening version file: {e}")
-            # Optionally, you can show a message box to the user
-            QMessageBox.critical(self, "Error", f"Failed to open version file: {str(e)}")
+            self.on_version_detail_error(e)
 
     def on_commit_version(self):
         """Commit the selected version"""
         try:
             id, data, _ = self.patch_version_data("commit")
 
-            try:
-                # Fetch version shot data using the ID
-                version_shot_data = KiyokaiService().update_version_shot_by_version_id(id, data)
-                if not version_shot_data or not version_shot_data.get("success", False):
-                    print(f"[-] Failed to get version shot data for ID: {id}")
-                    return
-                else:
-                    QMessageBox.information(self, "Success", "Version shot data fetched successfully.")
-            except Exception as e:
-                print(f"[-] Error fetching version shot data: {e}")
-                QMessageBox.critical(self, "Error", f"Select version to commit version: {str(e)}")
-                return
-
-            # Here you would typically commit the version using the fetched data
-            # For demonstration, we will just print the data
-            print(f"[+] Committing version for Version Shot ID: {self.master_shot_id}")
+            # Patched in the background, answered in on_version_updated
+            self.job_runner.submit(
+                KiyokaiService().update_version_shot_by_version_id, id, data,
+                on_result=lambda version_shot_data: self.on_version_updated("commit", id, version_shot_data),
+                on_error=lambda e: self.on_version_update_error("commit", e)
+            )
 
         except Exception as e:
             print(f"[-] Error committing version: {e}")
@@ -549,28 +716,32 @@ class LauncherHandler(QWidget):
         try:
             id, data, _ = self.patch_version_data("push")
 
-            try:
-                # Fetch version shot data using the ID
-                version_shot_data = KiyokaiService().update_version_shot_by_version_id(id, data)
-                if not version_shot_data or not version_shot_data.get("success", False):
-                    print(f"[-] Failed to get version shot data for ID: {id}")
-                    return
-                else:
-                    QMessageBox.information(self, "Success", "Version shot data fetched successfully.")
-            except Exception as e:
-                print(f"[-] Error fetching version shot data: {e}")
-                QMessageBox.critical(self, "Error", f"Select version to push version: {str(e)}")
-                return
-
-            # Here you would typically push the version using the fetched data
-            # For demonstration, we will just print the data
-            print(f"[+] Pushing version for Version Shot ID: {self.master_shot_id}")
+            # Patched in the background, answered in on_version_updated
+            self.job_runner.submit(
+                KiyokaiService().update_version_shot_by_version_id, id, data,
+                on_result=lambda version_shot_data: self.on_version_updated("push", id, version_shot_data),
+                on_error=lambda e: self.on_version_update_error("push", e)
+            )
 
         except Exception as e:
             print(f"[-] Error pushing version: {e}")
             # Optionally, you can show a message box to the user
             QMessageBox.critical(self, "Error", f"Failed to push version: {str(e)}")
 
+    def on_version_updated(self, action, id, version_shot_data):
+        if not version_shot_data or not version_shot_data.get("success", False):
+            print(f"[-] Failed to get version shot data for ID: {id}")
+            return
+        QMessageBox.information(self, "Success", "Version shot data fetched successfully.")
+
+        # Here you would typically commit / push the version using the fetched data
+        # For demonstration, we will just print the data
+        print(f"[+] {'Committing' if action == 'commit' else 'Pushing'} version for Version Shot ID: {self.master_shot_id}")
+
+    def on_version_update_error(self, action, e):
+        print(f"[-] Error fetching version shot data: {e}")
+        QMessageBox.critical(self, "Error", f"Select version to {action} version: {str(e)}")
+
     def navigate_to_settings_with_data(self, project_id, task_id, episode_id, sequence_id, shot_id):
         """Navigate to Settings tab and populate it with quick pull data"""
         try:
@@ -605,58 +776,21 @@ class LauncherHandler(QWidget):
         try:
             print(f"[+] Populating Launcher with: Project:{project_id}, Task:{task_id}, Episode:{episode_id}, Sequence:{sequence_id}, Shot:{shot_id}")
 
-            # Find and select the project
-            for i in range(self.ui.comboBox_project.count()):
-                if self.ui.comboBox_project.itemData(i) == project_id:
-                    self.ui.comboBox_project.setCurrentIndex(i)
-                    break
+            # The levels below are fetched in the background, each one selects its pending id once filled
+            self.pending_selection = {"task": task_id, "episode": episode_id, "sequence": sequence_id, "shot": shot_id}
 
-            # Trigger project changed to populate tasks
+            # Find and select the project, then trigger project changed once to populate tasks
+            with QSignalBlocker(self.ui.comboBox_project):
+                ComboBoxService.select_by_data(self.ui.comboBox_project, project_id, self.hierarchy.index.position("project", None, project_id))
             self.on_project_changed(self.ui.comboBox_project.currentIndex())
 
-            # Find and select the task
-            for i in range(self.ui.comboBox_task.count()):
-                if self.ui.comboBox_task.itemData(i) == task_id:
-                    self.ui.comboBox_task.setCurrentIndex(i)
-                    break
-
-            # Trigger task changed to populate episodes/sequences/shots
-            self.on_task_changed(self.ui.comboBox_task.currentIndex())
-
-            # Find and select the episode if available
-            if episode_id:
-                for i in range(self.ui.comboBox_episode.count()):
-                    if self.ui.comboBox_episode.itemData(i) == episode_id:
-                        self.ui.comboBox_episode.setCurrentIndex(i)
-                        break
-
-                # Trigger episode changed to populate sequences
-                self.on_episode_changed(self.ui.comboBox_episode.currentIndex())
-
-            # Find and select the sequence if available
-            if sequence_id:
-                for i in range(self.ui.comboBox_sequence.count()):
-                    if self.ui.comboBox_sequence.itemData(i) == sequence_id:
-                        self.ui.comboBox_sequence.setCurrentIndex(i)
-                        break
-
-                # Trigger sequence changed to populate shots
-                self.on_sequence_changed(self.ui.comboBox_sequence.currentIndex())
-
-            # Find and select the shot if available
-            if shot_id:
-                for i in range(self.ui.comboBox_shot.count()):
-                    if self.ui.comboBox_shot.itemData(i) == shot_id:
-                        self.ui.comboBox_shot.setCurrentIndex(i)
-                        break
-
             # Display master shot data if available
             if master_shot_data:
                 self.master_shot_id = master_shot_data.get("id", "")
                 self.set_tableview_detail(master_shot_data)
                 self.set_list_widget_versions(shot_id, task_id)
 
-            print("[+] Launcher form populated successfully with task data")
+            print("[+] Launcher form selection requested with task data")
 
         except Exception as e:
             print(f"[-] Error populating Launcher form: {e}")
@@ -714,10 +848,27 @@ class LauncherHandler(QWidget):
 
     def open_latest_version(self, mastershot_id):
         """Open the latest version of the master shot"""
-        try:
-            # Fetch the latest version shot data
-            master_shot = KiyokaiService().get_master_shot_by_master_shot_id(mastershot_id)
 
+        async def fetch():
+            # Fetch the latest version shot data past the cache, its lock decides whether to open it
+            response = await AsyncKiyokaiService.get_master_shot_by_master_shot_id(mastershot_id, fresh=True)
+
+            # The master shot embeds its latest version, which is only fetched when its path is missing
+            latest_version_shot = ((response or {}).get("data") or {}).get("latest_version_shot") or {}
+            latest_version = None
+            if latest_version_shot.get("id") and not latest_version_shot.get("file_path"):
+                latest_version = await AsyncKiyokaiService.get_version_shot_by_version_id(latest_version_shot.get("id"), fresh=True)
+            return response, latest_version
+
+        self.job_runner.submit(
+            fetch(), key="launcher.open",
+            on_result=lambda result: self.open_latest_version_file(mastershot_id, *result),
+            on_error=lambda e: print(f"[-] Error opening latest version shot: {e}")
+        )
+
+    def open_latest_version_file(self, mastershot_id, master_shot, latest_version):
+        """Open the file of the latest version fetched by open_latest_version"""
+        try:
             if not master_shot or not master_shot.get("success", False):
                 print(f"[-] Failed to get mastershot data for MasterShot ID: {mastershot_id}")
                 return
@@ -727,8 +878,11 @@ class LauncherHandler(QWidget):
                 print(f"[-] No version shot data found for MasterShot ID: {mastershot_id}")
                 return
 
-            latest_version = KiyokaiService().get_version_shot_by_version_id(master_shot_data.get("latest_version_shot").get("id"))
-            file_path = latest_version.get("data").get("file_path", "")
+            latest_version_shot = master_shot_data.get("latest_version_shot")
+            if latest_version is not None:
+                file_path = latest_version.get("data").get("file_path", "")
+            else:
+                file_path = latest_version_shot.get("file_path", "")
 
             if not file_path or not os.path.exists(file_path):
                 print(f"[-] File does not exist: {file_path}")
@@ -743,9 +897,9 @@ class LauncherHandler(QWidget):
             }
 
 
-            if not master_shot_data.get("latest_version_shot").get("locked", False) and not master_shot_data.get("latest_version_shot").get("commited", False):
+            if not latest_version_shot.get("locked", False) and not latest_version_shot.get("commited", False):
                 OpenFilePlatform.open_file_with_dialog(file_path=file_path)
-                KiyokaiService().update_version_shot_by_version_id(master_shot_data.get("latest_version_shot").get("id"), update_data)
+                self.job_runner.submit(AsyncKiyokaiService.update_version_shot_by_version_id(latest_version_shot.get("id"), update_data))
                 print(f"[+] Opened latest version shot: {file_path}")
             else:
                 print(f"[-] Latest version shot is locked or not committed: {file_path}")
@@ -756,10 +910,16 @@ class LauncherHandler(QWidget):
 
     def create_new_version(self, mastershot_id):
         """Create a new version for the master shot"""
-        try:
-            # Fetch the master shot data
-            master_shot = KiyokaiService().get_master_shot_by_master_shot_id(mastershot_id)
+        # Fetch the master shot data past the cache, the new version number follows its latest version
+        self.job_runner.submit(
+            KiyokaiService().get_master_shot_by_master_shot_id, mastershot_id, fresh=True, key="launcher.open",
+            on_result=lambda response: self.start_new_version(mastershot_id, response),
+            on_error=lambda e: print(f"[-] Error creating new version shot: {e}")
+        )
 
+    def start_new_version(self, mastershot_id, master_shot):
+        """Work out the new version file (asking for Blender if needed), then write and register it in the background"""
+        try:
             if not master_shot or not master_shot.get("success", False):
                 print(f"[-] Failed to get mastershot data for MasterShot ID: {mastershot_id}")
                 return
@@ -788,24 +948,10 @@ class LauncherHandler(QWidget):
                 base_folder = master_file_path
                 version_folder = os.path.join(base_folder, "versions")
 
-            if not os.path.exists(version_folder):
-                os.makedirs(version_folder, exist_ok=True)
-
             version_file_path = os.path.join(version_folder, new_file_name)
 
-            if file_ext == ".blend":
-                # Ask user to locate Blender executable
-                blender_path = SelectBlenderService(parent=self).select_blender()
-                blender_save_as = BlenderService().save_as_blend_file(blender_path, master_file_path, version_file_path)
-                if blender_save_as.get("success", True):
-                    print(f"[+] Blender project saved as: {version_file_path}")
-                else:
-                    print(f"[-] Failed to save Blender project: {blender_save_as.get('message', 'Unknown error')}")
-                    QMessageBox.warning(self, "Warning", "Failed to save Blender project.")
-                    return
-            else:
-                shutil.copy2(master_file_path, version_file_path)
-                print(f"[+] File copied to: {version_file_path}")
+            # Ask user to locate Blender executable, on the GUI thread
+            blender_path = SelectBlenderService(parent=self).select_blender() if file_ext == ".blend" else None
 
             new_version_data = {
                 "file_name": new_file_name,
@@ -825,7 +971,39 @@ class LauncherHandler(QWidget):
                 "task_name": master_shot_data.get("task_name"),
             }
 
-            new_version = KiyokaiService().create_version_shot(new_version_data)
+            # No key: a later open must not drop the result of a save that is already under way
+            self.job_runner.submit(
+                self.write_new_version, master_file_path, version_file_path, blender_path, new_version_data,
+                on_result=lambda new_version: self.open_new_version(mastershot_id, version_file_path, new_version),
+                on_error=self.on_new_version_error
+            )
+
+        except Exception as e:
+            print(f"[-] Error creating new version shot: {e}")
+
+    @staticmethod
+    def write_new_version(master_file_path, version_file_path, blender_path, new_version_data):
+        """Save the master file as the new version and register it, runs on the job runner"""
+        os.makedirs(os.path.dirname(version_file_path), exist_ok=True)
+
+        if blender_path is not None:
+            blender_save_as = BlenderService().save_as_blend_file(blender_path, master_file_path, version_file_path)
+            if not blender_save_as.get("success", True):
+                raise RuntimeError(f"Failed to save Blender project: {blender_save_as.get('message', 'Unknown error')}")
+            print(f"[+] Blender project saved as: {version_file_path}")
+        else:
+            shutil.copy2(master_file_path, version_file_path)
+            print(f"[+] File copied to: {version_file_path}")
+
+        return KiyokaiService().create_version_shot(new_version_data)
+
+    def on_new_version_error(self, e):
+        print(f"[-] Error creating new version shot: {e}")
+        QMessageBox.warning(self, "Warning", str(e))
+
+    def open_new_version(self, mastershot_id, version_file_path, new_version):
+        """Open the version written by write_new_version and lock it"""
+        try:
             if not new_version or not new_version.get("success", False):
                 print(f"[-] Failed to create new version shot for MasterShot ID: {mastershot_id}")
                 return
@@ -840,8 +1018,8 @@ class LauncherHandler(QWidget):
                 "locked_by_user_name": AppState().user_data.get("user").get("full_name"),
             }
             OpenFilePlatform.open_file_with_dialog(file_path=version_file_path)
-            KiyokaiService().update_version_shot_by_version_id(new_version.get("data").get("id"), update_data)
+            self.job_runner.submit(AsyncKiyokaiService.update_version_shot_by_version_id(new_version.get("data").get("id"), update_data))
             print(f"[+] Opened latest version shot: {version_file_path}")
 
         except Exception as e:
-            print(f"[-] Error creating new version shot: {e}")
\ No newline at end of file
+            print(f"[-] Error creating new version shot: {e}")
@@ -1,7 +1,7 @@
 import os
 import sys
 
-from PyQt6.QtCore import Qt, QStringListModel
+from PyQt6.QtCore import Qt, QStringListModel, QSignalBlocker
 from PyQt6.QtGui import QPixmap, QStandardItemModel, QStandardItem, QIcon
 from PyQt6.QtWidgets import QWidget, QTreeWidgetItem, QListWidgetItem, QPushButton, QHeaderView, QStyleOptionButton, \
     QHBoxLayout, QAbstractItemView, QSizePolicy, QApplication, QMessageBox, QFileDialog
@@ -9,14 +9,17 @@ from PyQt6.QtWidgets import QWidget, QTreeWidgetItem, QListWidgetItem, QPushButt
 from app.ui.main.page.settings_ui import Ui_Form
 from app.core.app_states import AppState
 from app.services.asset import AssetService
-from app.services.files import FileService
 from app.services.project import ProjectService
 from app.services.shot import ShotService
 from app.services.task import TaskService
 from app.services.auth import AuthServices
 from app.services.kiyokai import KiyokaiService
 from app.services.launcher.launcher_data import LauncherData
-from app.utils.version_shots import VersionShotService
+from app.services.version_import import VersionImportService
+from app.services.master_shot_provisioning import MasterShotProvisioningService
+from app.utils.pyqt.combo_box import ComboBoxService
+from app.utils.pyqt.progress_dialog import ProgressDialog
+from app.utils.pyqt.provision_dialog import ProvisionDialog
 
 class SettingsHandler(QWidget):
     def __init__(self):
@@ -26,15 +29,21 @@ class SettingsHandler(QWidget):
         self.ui = Ui_Form()
         self.ui.setupUi(self)
 
+        self.hierarchy = AppState().hierarchy
         self.project_data = AppState().project_data
 
+        # Ids to select in the cascade comboboxes once their level is fetched (quick pull)
+        self.pending_selection = {}
+
         self.set_combobox_data()
+        self.connect_hierarchy_refresher()
 
         self.ui.pushButton_nasSave.clicked.connect(self.on_create_nas)
         self.ui.toolButton_locateFile.clicked.connect(self.open_file_dialog)
         self.ui.pushButton_shotCreate.clicked.connect(self.on_create_master_shot)
         self.ui.pushButton_shotUpdate.clicked.connect(self.on_update_master_shot)
         self.ui.pushButton_shotLoad.clicked.connect(self.on_load_master_shots)
+        self.ui.pushButton_shotBatch.clicked.connect(self.on_batch_provision)
         self.ui.toolButton_locateFolder.clicked.connect(self.open_folder_dialog)
 
     def open_file_dialog(self):
@@ -108,10 +117,59 @@ class SettingsHandler(QWidget):
         # Set NAS server list
         self.set_combobox_nas_server()
 
+    def connect_hierarchy_refresher(self):
+        """Patch the cascade comboboxes in place when the background refresh finds changes"""
+        refresher = AppState().hierarchy_refresher
+        if refresher is None:
+            return
+
+        refresher.node_added.connect(self.on_hierarchy_node_added)
+        refresher.node_removed.connect(self.on_hierarchy_node_removed)
+        refresher.node_renamed.connect(self.on_hierarchy_node_renamed)
+
+    def on_hierarchy_node_added(self, level, parent_id, node_id, name, position):
+        combo_box = self.get_hierarchy_combobox(level, parent_id)
+        if combo_box is not None:
+            ComboBoxService.insert_item(combo_box, position, name, node_id)
+
+    def on_hierarchy_node_removed(self, level, parent_id, node_id):
+        combo_box = self.get_hierarchy_combobox(level, parent_id)
+        if combo_box is not None:
+            ComboBoxService.remove_item(combo_box, node_id)
+
+    def on_hierarchy_node_renamed(self, level, parent_id, node_id, name):
+        combo_box = self.get_hierarchy_combobox(level, parent_id)
+        if combo_box is not None:
+            ComboBoxService.rename_item(combo_box, node_id, name)
+
+    def get_hierarchy_combobox(self, level, parent_id):
+        """Combobox currently listing the children of parent_id at this level, if any"""
+        combo_boxes = {
+            "project": (self.ui.comboBox_project, None),
+            "task": (self.ui.comboBox_task, self.ui.comboBox_project.currentData()),
+            "asset": (self.ui.comboBox_asset, self.ui.comboBox_project.currentData()),
+            "episode": (self.ui.comboBox_episode, self.ui.comboBox_project.currentData()),
+            "sequence": (self.ui.comboBox_sequence, self.ui.comboBox_episode.currentData()),
+            "shot": (self.ui.comboBox_shot, self.ui.comboBox_sequence.currentData()),
+        }
+        combo_box, shown_parent_id = combo_boxes.get(level, (None, None))
+
+        if combo_box is None or combo_box.isHidden() or shown_parent_id != parent_id:
+            return None
+        return combo_box
+
     def set_combobox_nas_server(self):
-        """Set NAS server list in comboBox"""
+        """Set NAS server list in comboBox, fetched in the background"""
+        AppState().job_runner.submit(
+            KiyokaiService.get_nas_server_list, key="settings.nas",
+            on_result=self.fill_combobox_nas_server, on_error=self.on_request_error
+        )
+
+    def on_request_error(self, e):
+        QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+
+    def fill_combobox_nas_server(self, response):
         try:
-            response = KiyokaiService.get_nas_server_list()
             if response.get("success"):
                 nas_servers = response.get("data", [])
                 self.ui.comboBox_nas.clear()
@@ -130,35 +188,51 @@ class SettingsHandler(QWidget):
         self.ui.comboBox_sequence.clear()
         self.ui.comboBox_shot.clear()
 
+        self.ui.comboBox_task.setEnabled(False)
         self.ui.comboBox_sequence.setEnabled(False)
         self.ui.comboBox_shot.setEnabled(False)
+        self.cancel_hierarchy_jobs("project", "episodes", "sequences", "shots")
 
         project_id = self.ui.comboBox_project.itemData(index)
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
+        if project_id is None:
+            return
 
-        if project and project.get("tasks"):
-            self.ui.comboBox_task.setEnabled(True)
-            self.ui.comboBox_task.show()
+        # Task and asset types are fetched in the background, only the last picked project is rendered
+        AppState().job_runner.submit(
+            self.hierarchy.get_project, project_id, key="settings.project",
+            on_result=lambda project: self.fill_combobox_task(project_id, project)
+        )
 
-            for task in project["tasks"]:
-                self.ui.comboBox_task.addItem(task["task"], task["task_id"])
-        else:
-            self.ui.comboBox_task.setEnabled(False)
+        # Episodes are only needed once a shot task is picked, start fetching them now
+        self.hierarchy.prefetch_episodes(project_id)
+
+    def fill_combobox_task(self, project_id, project):
+        if self.ui.comboBox_project.currentData() != project_id:
+            return
+
+        tasks = project.get("tasks", []) if project else []
+        task_id = self.pending_selection.pop("task", None)
+        row = ComboBoxService.fill(self.ui.comboBox_task, [(task["task"], task["task_id"]) for task in tasks],
+                                   task_id, self.hierarchy.index.position("task", project_id, task_id))
+        if row >= 0:
+            self.ui.comboBox_task.show()
+            self.on_task_changed(row)
 
     def on_task_changed(self, index):
         self.ui.comboBox_asset.clear()
         self.ui.comboBox_episode.clear()
         self.ui.comboBox_sequence.clear()
         self.ui.comboBox_shot.clear()
+        self.cancel_hierarchy_jobs("episodes", "sequences", "shots")
 
         # Get project_id from comboBox_project
         project_index = self.ui.comboBox_project.currentIndex()
         project_id = self.ui.comboBox_project.itemData(project_index)
         task_id = self.ui.comboBox_task.itemData(index)
 
-        # Get data project and task
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
-        task = next((t for t in project["tasks"] if t["task_id"] == task_id), None) if project else None
+        # Get data project and task, the task types are loaded since they fill comboBox_task
+        project = self.hierarchy.index.project(project_id)
+        task = self.hierarchy.index.task(project_id, task_id) if project else None
 
         if not task:
             return
@@ -195,56 +269,80 @@ class SettingsHandler(QWidget):
             self.ui.comboBox_asset.hide()
             self.ui.comboBox_asset.setEnabled(False)
 
-            self.ui.comboBox_episode.setEnabled(True)
+            self.ui.comboBox_episode.setEnabled(False)
             self.ui.comboBox_sequence.setEnabled(False)
             self.ui.comboBox_shot.setEnabled(False)
 
-            # Fill episode if exist
-            if project and project.get("episodes"):
-                for episode in project["episodes"]:
-                    self.ui.comboBox_episode.addItem(episode["episode"], episode["episode_id"])
-            else:
-                self.ui.comboBox_episode.setEnabled(False)
+            # Fill episode once fetched (usually already prefetched with the project)
+            AppState().job_runner.submit(
+                self.hierarchy.get_episodes, project_id, key="settings.episodes",
+                on_result=lambda episodes: self.fill_combobox_episode(project_id, task_id, episodes)
+            )
+
+    def fill_combobox_episode(self, project_id, task_id, episodes):
+        if self.ui.comboBox_project.currentData() != project_id or self.ui.comboBox_task.currentData() != task_id:
+            return
+
+        episode_id = self.pending_selection.pop("episode", None)
+        row = ComboBoxService.fill(self.ui.comboBox_episode,
+                                   [(episode["episode"], episode["episode_id"]) for episode in episodes],
+                                   episode_id, self.hierarchy.index.position("episode", project_id, episode_id))
+        if row >= 0:
+            self.on_episode_changed(row)
 
     def on_episode_changed(self, index):
         self.ui.comboBox_sequence.clear()
         self.ui.comboBox_shot.clear()
+        self.ui.comboBox_sequence.setEnabled(False)
         self.ui.comboBox_shot.setEnabled(False)
+        self.cancel_hierarchy_jobs("sequences", "shots")
 
-        project_index = self.ui.comboBox_project.currentIndex()
-        project_id = self.ui.comboBox_project.itemData(project_index)
         episode_id = self.ui.comboBox_episode.itemData(index)
+        if episode_id is None:
+            return
 
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
-        episode = next((e for e in project["episodes"] if e["episode_id"] == episode_id), None) if project else None
+        AppState().job_runner.submit(
+            self.hierarchy.get_sequences, episode_id, key="settings.sequences",
+            on_result=lambda sequences: self.fill_combobox_sequence(episode_id, sequences)
+        )
 
-        if episode and episode.get("sequences"):
-            self.ui.comboBox_sequence.setEnabled(True)
-            for seq in episode["sequences"]:
-                self.ui.comboBox_sequence.addItem(seq["sequence"], seq["sequence_id"])
-        else:
-            self.ui.comboBox_sequence.setEnabled(False)
+    def fill_combobox_sequence(self, episode_id, sequences):
+        if self.ui.comboBox_episode.currentData() != episode_id:
+            return
+
+        sequence_id = self.pending_selection.pop("sequence", None)
+        row = ComboBoxService.fill(self.ui.comboBox_sequence,
+                                   [(sequence["sequence"], sequence["sequence_id"]) for sequence in sequences],
+                                   sequence_id, self.hierarchy.index.position("sequence", episode_id, sequence_id))
+        if row >= 0:
+            self.on_sequence_changed(row)
 
     def on_sequence_changed(self, index):
         self.ui.comboBox_shot.clear()
+        self.ui.comboBox_shot.setEnabled(False)
+        self.cancel_hierarchy_jobs("shots")
 
-        project_index = self.ui.comboBox_project.currentIndex()
-        episode_index = self.ui.comboBox_episode.currentIndex()
-        project_id = self.ui.comboBox_project.itemData(project_index)
-        episode_id = self.ui.comboBox_episode.itemData(episode_index)
         sequence_id = self.ui.comboBox_sequence.itemData(index)
+        if sequence_id is None:
+            return
 
-        project = next((p for p in self.project_data if p["project_id"] == project_id), None)
-        episode = next((e for e in project["episodes"] if e["episode_id"] == episode_id), None) if project else None
-        sequence = next((s for s in episode["sequences"] if s["sequence_id"] == sequence_id),
-                        None) if episode else None
+        AppState().job_runner.submit(
+            self.hierarchy.get_shots, sequence_id, key="settings.shots",
+            on_result=lambda shots: self.fill_combobox_shot(sequence_id, shots)
+        )
 
-        if sequence and sequence.get("shots"):
-            self.ui.comboBox_shot.setEnabled(True)
-            for shot in sequence["shots"]:
-                self.ui.comboBox_shot.addItem(shot["shot"], shot["shot_id"])
-        else:
-            self.ui.comboBox_shot.setEnabled(False)
+    def fill_combobox_shot(self, sequence_id, shots):
+        if self.ui.comboBox_sequence.currentData() != sequence_id:
+            return
+
+        shot_id = self.pending_selection.pop("shot", None)
+        ComboBoxService.fill(self.ui.comboBox_shot, [(shot["shot"], shot["shot_id"]) for shot in shots],
+                             shot_id, self.hierarchy.index.position("shot", sequence_id, shot_id))
+
+    def cancel_hierarchy_jobs(self, *levels):
+        """Drop the pending fetches of the levels below a changed combobox, their parent is gone"""
+        for level in levels:
+            AppState().job_runner.cancel(f"settings.{level}")
 
     def on_create_nas(self):
         """Create NAS directory"""
@@ -259,7 +357,15 @@ class SettingsHandler(QWidget):
                 "drive_letter": self.ui.comboBox_nasDrive.currentText().strip(),
             }
 
-            response = KiyokaiService.create_nas_server(data)
+            AppState().job_runner.submit(
+                KiyokaiService.create_nas_server, data,
+                on_result=self.on_nas_created, on_error=self.on_request_error
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+
+    def on_nas_created(self, response):
+        try:
             if response.get("success"):
                 QMessageBox.information(self, "Success", "NAS directory created successfully.")
             else:
@@ -272,7 +378,15 @@ class SettingsHandler(QWidget):
         try:
             data = self.get_update_create_data()
 
-            response = KiyokaiService.create_master_shot(data)
+            AppState().job_runner.submit(
+                KiyokaiService.create_master_shot, data,
+                on_result=lambda response: self.on_master_shot_created(data, response), on_error=self.on_request_error
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+
+    def on_master_shot_created(self, data, response):
+        try:
             if response.get("success"):
                 # QMessageBox.information(self, "Success", "Master shot created successfully.")
                 if self.ui.lineEdit_locateFolder.text().strip():
@@ -313,7 +427,16 @@ class SettingsHandler(QWidget):
                 "edit_user_name": AppState().user_data.get("user").get("full_name"),
             }
 
-            response = KiyokaiService.update_master_shot(shot_id=shot_id, task_id=task_id, data=data)
+            AppState().job_runner.submit(
+                KiyokaiService.update_master_shot, shot_id=shot_id, task_id=task_id, data=data,
+                on_result=lambda response: self.on_master_shot_updated(shot_id, task_id, response),
+                on_error=self.on_request_error
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+
+    def on_master_shot_updated(self, shot_id, task_id, response):
+        try:
             if response.get("success"):
                 # QMessageBox.information(self, "Success", "Master shot updated successfully.")
                 if self.ui.lineEdit_locateFolder.text().strip():
@@ -343,7 +466,15 @@ class SettingsHandler(QWidget):
             task_id = self.ui.comboBox_task.itemData(task_index) if task_index >= 0 else None
             shot_id = self.ui.comboBox_shot.itemData(shot_index) if shot_index >= 0 else None
 
-            response = KiyokaiService.get_master_shot_data_by_id(shot_id=shot_id, task_id=task_id)
+            AppState().job_runner.submit(
+                KiyokaiService.get_master_shot_data_by_id, shot_id=shot_id, task_id=task_id, key="settings.master_shot",
+                on_result=self.on_master_shots_loaded, on_error=self.on_request_error
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+
+    def on_master_shots_loaded(self, response):
+        try:
             if response.get("success"):
                 master_shots = response.get("data", {})
                 self.ui.lineEdit_locateFile.setText(os.path.join(master_shots.get("file_path", ""), master_shots.get("file_name", "")) ) # NEED TO FIX
@@ -354,33 +485,95 @@ class SettingsHandler(QWidget):
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
 
     def update_version_shot(self, data: dict):
-        """Update Version Shot"""
+        """Update Version Shot: register the versions of the version folder not registered yet"""
         try:
             version_folder = self.ui.lineEdit_locateFolder.text()
 
-            normal, backup = VersionShotService.get_version_shot_data(version_folder)
+            progress = ProgressDialog(self, "Update Version Shot", f"Registering versions from {version_folder}")
+            job = AppState().job_runner.submit(
+                VersionImportService.import_versions(data, version_folder, progress=progress.report),
+                key="settings.version_import",
+                on_result=lambda result: self.on_versions_imported(progress, result),
+                on_error=lambda e: self.on_version_import_error(progress, e)
+            )
+            job.signals.cancelled.connect(lambda: self.on_version_import_cancelled(progress))
+            progress.canceled.connect(job.cancel)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
 
-            for version_number, files in normal.items():
-                if not files:
-                    continue
+    def on_versions_imported(self, progress, result):
+        progress.finish()
+        message = (f"{len(result['created'])} version(s) registered, "
+                   f"{len(result['skipped'])} already registered.")
+        if result["failed"]:
+            failed = "\n".join(f"v{version_number:03d}: {error}" for version_number, error in result["failed"])
+            QMessageBox.warning(self, "Warning", f"{message}\n\n{len(result['failed'])} failed:\n{failed}")
+        else:
+            QMessageBox.information(self, "Success", f"Version updated successfully.\n\n{message}")
 
-                # Get the only item from the dict
-                file_name, file_path = next(iter(files.items()))
+    def on_version_import_error(self, progress, e):
+        progress.finish()
+        QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
 
-                version_data = data.copy()
-                version_data["file_name"] = file_name
-                version_data["file_path"] = file_path
-                version_data["version_number"] = version_number
+    def on_version_import_cancelled(self, progress):
+        progress.finish()
+        print("[-] Version import cancelled, run it again to register the remaining versions.")
 
-                response = KiyokaiService.create_version_shot(data=version_data)
-                if response.get("success"):
-                    print(f"[+] Version {version_number} - {file_name} created.")
-                else:
-                    print(f"[-] Failed to create Version {version_number}: {response.get('message', 'Unknown error')}")
-            QMessageBox.information(self, "Success", "Version updated successfully.")
+    def on_batch_provision(self):
+        """Batch Provision: create the missing master shots of the selected episode or sequence"""
+        try:
+            base = self.get_update_create_data()
+            if not base.get("task_id") or not base.get("episode_id"):
+                QMessageBox.warning(self, "Warning", "Please select Project, Task and Episode to provision.")
+                return
+
+            scope = f"{base['project_name']} / {base['task_name']} / {base['episode_name']}"
+            dialog = ProvisionDialog(scope, base.get("sequence_name"), self)
+            dialog.run_requested.connect(lambda dry_run: self.run_batch_provision(dialog, base, dry_run))
+            dialog.finished.connect(lambda: AppState().job_runner.cancel("settings.provision"))
+            dialog.exec()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
 
+    def run_batch_provision(self, dialog, base, dry_run):
+        options = dialog.options()
+        if not os.path.isdir(options["root_folder"]):
+            QMessageBox.warning(dialog, "Warning", "Please select an existing root folder.")
+            return
+        if not options["master_template"]:
+            QMessageBox.warning(dialog, "Warning", "Please enter a mastershot file template.")
+            return
+
+        dialog.set_running(True)
+        progress = ProgressDialog(dialog, "Batch Provision", "Checking shots" if dry_run else "Provisioning shots")
+        job = AppState().job_runner.submit(
+            MasterShotProvisioningService.provision(
+                base, self.hierarchy, options["root_folder"], options["master_template"], options["version_template"],
+                sequence_id=base.get("sequence_id") if options["only_sequence"] else None,
+                with_versions=options["with_versions"], dry_run=dry_run, progress=progress.report
+            ),
+            key="settings.provision",
+            on_result=lambda report: self.on_batch_provisioned(dialog, progress, report),
+            on_error=lambda e: self.on_batch_provision_error(dialog, progress, e)
+        )
+        job.signals.cancelled.connect(lambda: self.on_batch_provision_cancelled(dialog, progress))
+        progress.canceled.connect(job.cancel)
+
+    def on_batch_provisioned(self, dialog, progress, report):
+        progress.finish()
+        dialog.set_running(False)
+        dialog.show_report(MasterShotProvisioningService.format_report(report))
+
+    def on_batch_provision_error(self, dialog, progress, e):
+        progress.finish()
+        dialog.set_running(False)
+        QMessageBox.critical(dialog, "Error", f"An error occurred: {str(e)}")
+
+    def on_batch_provision_cancelled(self, dialog, progress):
+        progress.finish()
+        dialog.set_running(False)
+        dialog.show_report("Cancelled. Provision again to create the remaining master shots.")
+
     def get_update_create_data(self):
         """Get data for update or create Master Shot"""
         try:
@@ -441,49 +634,15 @@ class SettingsHandler(QWidget):
         try:
             print(f"[+] Populating Settings with: Project:{project_id}, Task:{task_id}, Episode:{episode_id}, Sequence:{sequence_id}, Shot:{shot_id}")
 
-            # Find and select the project
-            for i in range(self.ui.comboBox_project.count()):
-                if self.ui.comboBox_project.itemData(i) == project_id:
-                    self.ui.comboBox_project.setCurrentIndex(i)
-                    break
+            # The levels below are fetched in the background, each one selects its pending id once filled
+            self.pending_selection = {"task": task_id, "episode": episode_id, "sequence": sequence_id, "shot": shot_id}
 
-            # Trigger project changed to populate tasks
+            # Find and select the project, then trigger project changed once to populate tasks
+            with QSignalBlocker(self.ui.comboBox_project):
+                ComboBoxService.select_by_data(self.ui.comboBox_project, project_id, self.hierarchy.index.position("project", None, project_id))
             self.on_project_changed(self.ui.comboBox_project.currentIndex())
 
-            # Find and select the task
-            for i in range(self.ui.comboBox_task.count()):
-                if self.ui.comboBox_task.itemData(i) == task_id:
-                    self.ui.comboBox_task.setCurrentIndex(i)
-                    break
-
-            # Trigger task changed to populate episodes/sequences/shots
-            self.on_task_changed(self.ui.comboBox_task.currentIndex())
-
-            # Find and select the episode
-            for i in range(self.ui.comboBox_episode.count()):
-                if self.ui.comboBox_episode.itemData(i) == episode_id:
-                    self.ui.comboBox_episode.setCurrentIndex(i)
-                    break
-
-            # Trigger episode changed to populate sequences
-            self.on_episode_changed(self.ui.comboBox_episode.currentIndex())
-
-            # Find and select the sequence
-            for i in range(self.ui.comboBox_sequence.count()):
-                if self.ui.comboBox_sequence.itemData(i) == sequence_id:
-                    self.ui.comboBox_sequence.setCurrentIndex(i)
-                    break
-
-            # Trigger sequence changed to populate shots
-            self.on_sequence_changed(self.ui.comboBox_sequence.currentIndex())
-
-            # Find and select the shot
-            for i in range(self.ui.comboBox_shot.count()):
-                if self.ui.comboBox_shot.itemData(i) == shot_id:
-                    self.ui.comboBox_shot.setCurrentIndex(i)
-                    break
-
-            print("[+] Settings form populated successfully with quick pull data")
+            print("[+] Settings form selection requested with quick pull data")
 
         except Exception as e:
             print(f"[-] Error populating Settings form: {e}")
@@ -491,10 +650,4 @@ class SettingsHandler(QWidget):
 # Small Function =====================================================================================
     def pop_version_data(self, data, mastershot_id):
         """Pop and update version data"""
-        version_data = data.copy()
-        version_data.pop("file_name", None)
-        version_data.pop("file_path", None)
-        version_data.pop("nas_server_id", None)
-        version_data.pop("version_folder", None)
-        version_data["master_shot_id"] = mastershot_id
-        self.update_version_shot(version_data)
+        self.update_version_shot(VersionImportService.version_base(data, mastershot_id))
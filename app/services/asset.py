@@ -1,5 +1,6 @@
 from app.core.gazu_client import gazu_client
 from app.core.logger import get_logger
+from app.core.single_flight import single_flight
 
 logger = get_logger(__name__)
 
@@ -7,6 +8,7 @@ class AssetService:
     """Service for interacting with Asset API"""
 
     @staticmethod
+    @single_flight
     def get_asset_types_by_project(project_id: str):
         """Fetch assets by project ID"""
 
@@ -19,6 +21,7 @@ class AssetService:
             return {"success": False, "message": f"Network error: {e}"}
 
     @staticmethod
+    @single_flight
     def get_asset_metadata(asset_id: str):
         """Fetch asset metadata by asset ID"""
 
@@ -0,0 +1,99 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from app.config import Settings
+from app.core.gazu_client import gazu_client
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class AvatarCache:
+    """
+    Person avatars stored as <directory>/<person_id>.png.
+
+    A file on disk is reused while it is newer than the person's updated_at (uploading an avatar
+    touches the person) and younger than max_age. Each person is downloaded at most once per
+    session: downloads run on a small worker pool and every request for the same person shares
+    the same future. A failed download is forgotten, the next request tries again.
+    """
+
+    def __init__(self, directory: str = os.path.join(Settings.FILES_DIR, "avatar"),
+                 max_age: int = Settings.AVATAR_CACHE_MAX_AGE, max_workers: int = Settings.AVATAR_MAX_WORKERS):
+        self.directory = directory
+        self.max_age = max_age
+
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, person_id: str) -> str:
+        return os.path.join(self.directory, f"{person_id}.png")
+
+    def cached_path(self, person: dict):
+        """Path of the avatar on disk when it is present and fresh for this person, else None"""
+        file_path = self.path(person["id"])
+        try:
+            modified = os.path.getmtime(file_path)
+        except OSError:
+            return None
+
+        if time.time() - modified > self.max_age:
+            return None
+
+        updated_at = self._timestamp(person.get("updated_at"))
+        if updated_at is not None and modified < updated_at:
+            return None
+        return file_path
+
+    def fetch(self, person_id: str):
+        """Download an avatar in the background, the future resolves to its path or None"""
+        with self._lock:
+            future = self._futures.get(person_id)
+            if future is not None:
+                return future
+            future = self._executor.submit(self._download, person_id)
+            self._futures[person_id] = future
+
+        # Outside the lock, the callback runs right here when the download already finished
+        future.add_done_callback(lambda f: self._forget_failed(person_id, f))
+        return future
+
+    def _forget_failed(self, person_id: str, future):
+        if future.exception() is None and future.result() is not None:
+            return
+        with self._lock:
+            if self._futures.get(person_id) is future:
+                del self._futures[person_id]
+
+    def _download(self, person_id: str):
+        file_path = self.path(person_id)
+        temp_path = f"{file_path}.part"
+
+        try:
+            gazu_client.files.download_person_avatar(person_id, file_path=temp_path)
+            os.replace(temp_path, file_path)
+            logger.info(f"Avatar downloaded: {file_path}")
+            return file_path
+        except Exception as e:
+            logger.warning(f"Could not download avatar for user {person_id}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+    @staticmethod
+    def _timestamp(value):
+        """Zou dates are naive UTC ISO strings"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+
+avatar_cache = AvatarCache()
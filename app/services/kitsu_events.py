@@ -0,0 +1,124 @@
+import threading
+from functools import partial
+
+from app.config import Settings
+from app.core.gazu_client import gazu_client
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class KitsuEventListener:
+    """
+    Listens to the Kitsu (Zou) event stream on a background thread.
+
+    Every subscribed event is passed to on_event(event_name, data) from the listener thread.
+    While the socket is down, on_poll() is called every poll_interval seconds instead and the
+    connection is retried after each poll. A reconnect polls once more, for the changes made since
+    the last poll and before the listeners were added.
+    """
+
+    EVENTS = (
+        "task:new", "task:update", "task:delete", "task:assign", "task:unassign", "task:status-changed",
+        "comment:new", "comment:update", "comment:delete",
+        "shot:new", "shot:update", "shot:delete",
+        "sequence:new", "sequence:update", "sequence:delete",
+    )
+
+    def __init__(self, on_event, on_poll=None, on_connection_changed=None, event_host: str = None,
+                 poll_interval: int = Settings.EVENTS_POLL_INTERVAL):
+        self.on_event = on_event
+        self.on_poll = on_poll
+        self.on_connection_changed = on_connection_changed
+        self.event_host = event_host
+        self.poll_interval = poll_interval
+
+        self.connected = False
+        self._connections = 0
+        self._client = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            if not self._stopped.is_set():
+                return
+            self._thread.join()
+
+        self._stopped.clear()
+        self._connections = 0
+        self._thread = threading.Thread(target=self._run, name="kitsu-events", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        client = self._client
+        if client is not None:
+            try:
+                client.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing Kitsu event stream: {e}")
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.warning(f"Kitsu event stream unavailable: {e}")
+            finally:
+                self._client = None
+                self._set_connected(False)
+
+            # Socket is down: poll until it comes back
+            if self._stopped.wait(self.poll_interval):
+                break
+            self._poll()
+
+    def _listen(self):
+        """Connect and block until the socket disconnects"""
+        gazu_client.client.set_event_host(self._event_host())
+        self._client = gazu_client.events.init(reconnection=False)
+        for event_name in self.EVENTS:
+            gazu_client.events.add_listener(self._client, event_name, partial(self._dispatch, event_name))
+
+        if self._stopped.is_set():
+            self._client.disconnect()
+            return
+
+        logger.info(f"Listening to Kitsu events on {gazu_client.client.get_event_host()}")
+        self._set_connected(True)
+        self._connections += 1
+        if self._connections > 1:
+            # Catch up, the socket only delivers what happens from now on
+            self._poll()
+        self._client.wait()
+
+    def _event_host(self) -> str:
+        """Explicit host, otherwise the Zou host without its /api suffix (where socket.io is served)"""
+        if self.event_host:
+            return self.event_host
+
+        host = gazu_client.client.get_host().rstrip("/")
+        return host[:-len("/api")] if host.endswith("/api") else host
+
+    def _dispatch(self, event_name: str, data=None):
+        try:
+            self.on_event(event_name, data or {})
+        except Exception as e:
+            logger.error(f"Error handling Kitsu event {event_name}: {e}")
+
+    def _poll(self):
+        if self.on_poll is None:
+            return
+        try:
+            self.on_poll()
+        except Exception as e:
+            logger.error(f"Error polling Kitsu: {e}")
+
+    def _set_connected(self, connected: bool):
+        if connected == self.connected:
+            return
+
+        self.connected = connected
+        logger.info(f"Kitsu event stream {'connected' if connected else 'disconnected, polling'}")
+        if self.on_connection_changed is not None:
+            self.on_connection_changed(connected)
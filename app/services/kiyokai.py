@@ -1,11 +1,19 @@
 import logging
 import httpx
 from app.core.app_states import AppState
+from app.core.kiyokai_client import kiyokai_client
 from app.core.logger import get_logger
 from app.config import Settings
 
 logger = get_logger(__name__)
 
+# Response cache tags: reads are tagged, writes invalidate (see KiyokaiClient)
+MASTER_SHOTS_TAG = "mastershots"
+VERSION_SHOTS_TAG = "versionshots"
+
+def shot_tag(shot_id: str, task_id: str) -> str:
+    return f"shot:{shot_id}:{task_id}"
+
 class KiyokaiService:
     def __init__(self):
         super().__init__()
@@ -43,12 +51,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.get(f"{kiyokai_url}/api/v1/shots/mastershots/list/{shot_id}/tasks/{task_id}", headers=headers)
+            response = kiyokai_client.get(f"/api/v1/shots/mastershots/list/{shot_id}/tasks/{task_id}", endpoint="get_master_shot_data_by_id",
+                                          cache_tags=(MASTER_SHOTS_TAG, shot_tag(shot_id, task_id)))
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Master shot data retrieved successfully: {response.json()}")
             return response.json()
@@ -66,9 +71,10 @@ class KiyokaiService:
             }
 
     @staticmethod
-    def get_master_shot_by_master_shot_id(master_shot_id: str) -> dict:
+    def get_master_shot_by_master_shot_id(master_shot_id: str, fresh: bool = False) -> dict:
         """
         Fetch master shot data by master shot ID from Kiyokai API.
+        fresh skips the response cache, for lock checks.
         """
         kiyokai_url = AppState().kiyokai_url
         token = AppState().access_token
@@ -80,12 +86,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.get(f"{kiyokai_url}/api/v1/shots/mastershots/{master_shot_id}", headers=headers)
+            response = kiyokai_client.get(f"/api/v1/shots/mastershots/{master_shot_id}", endpoint="get_master_shot_by_master_shot_id",
+                                          cache_tags=(MASTER_SHOTS_TAG,), fresh=fresh)
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Master shot data retrieved successfully: {response.json()}")
             return response.json()
@@ -116,12 +119,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.post(f"{kiyokai_url}/api/v1/shots/mastershots/create", json=data, headers=headers)
+            response = kiyokai_client.post("/api/v1/shots/mastershots/create", json=data, endpoint="create_master_shot",
+                                           invalidates=(MASTER_SHOTS_TAG,))
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Master shot created successfully: {response.json()}")
             return response.json()
@@ -153,12 +153,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.patch(f"{kiyokai_url}/api/v1/shots/mastershots/update/{shot_id}/tasks/{task_id}", json=data, headers=headers)
+            response = kiyokai_client.patch(f"/api/v1/shots/mastershots/update/{shot_id}/tasks/{task_id}", json=data, endpoint="update_master_shot",
+                                            invalidates=(MASTER_SHOTS_TAG, shot_tag(shot_id, task_id)))
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Master shot updated successfully: {response.json()}")
             return response.json()
@@ -190,12 +187,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.get(f"{kiyokai_url}/api/v1/shots/versionshots/list/{shot_id}/tasks/{task_id}", headers=headers)
+            response = kiyokai_client.get(f"/api/v1/shots/versionshots/list/{shot_id}/tasks/{task_id}", endpoint="get_version_shot_by_shot_id",
+                                          cache_tags=(VERSION_SHOTS_TAG, shot_tag(shot_id, task_id)))
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Version shot data retrieved successfully: {response.json()}")
             return response.json()
@@ -213,9 +207,10 @@ class KiyokaiService:
             }
 
     @staticmethod
-    def get_version_shot_by_version_id(version_id: str) -> dict:
+    def get_version_shot_by_version_id(version_id: str, fresh: bool = False) -> dict:
         """
         Fetch version shot data by version ID from Kiyokai API.
+        fresh skips the response cache, for lock checks.
         """
         kiyokai_url = AppState().kiyokai_url
         token = AppState().access_token
@@ -227,12 +222,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.get(f"{kiyokai_url}/api/v1/shots/versionshots/{version_id}", headers=headers)
+            response = kiyokai_client.get(f"/api/v1/shots/versionshots/{version_id}", endpoint="get_version_shot_by_version_id",
+                                          cache_tags=(VERSION_SHOTS_TAG,), fresh=fresh)
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Version shot data retrieved successfully: {response.json()}")
             return response.json()
@@ -264,12 +256,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.patch(f"{kiyokai_url}/api/v1/shots/versionshots/{version_id}", json=data, headers=headers)
+            response = kiyokai_client.patch(f"/api/v1/shots/versionshots/{version_id}", json=data, endpoint="update_version_shot_by_version_id",
+                                            invalidates=(VERSION_SHOTS_TAG, MASTER_SHOTS_TAG))
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Version shot updated successfully: {response.json()}")
             return response.json()
@@ -301,12 +290,9 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.post(f"{kiyokai_url}/api/v1/shots/versionshots/create", json=data, headers=headers)
+            response = kiyokai_client.post("/api/v1/shots/versionshots/create", json=data, endpoint="create_version_shot",
+                                           invalidates=(VERSION_SHOTS_TAG, MASTER_SHOTS_TAG))
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"Version shot created successfully: {response.json()}")
             return response.json()
@@ -338,12 +324,8 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.post(f"{kiyokai_url}/api/v1/nas/create", json=data, headers=headers)
+            response = kiyokai_client.post("/api/v1/nas/create", json=data, endpoint="create_nas_server")
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"NAS server created successfully: {response.json()}")
             return response.json()
@@ -375,12 +357,8 @@ class KiyokaiService:
                 "message": "Kiyokai URL is not set."
             }
 
-        headers = {
-            "Authorization": f"Bearer {token}"
-        }
-
         try:
-            response = httpx.get(f"{kiyokai_url}/api/v1/nas/list", headers=headers)
+            response = kiyokai_client.get("/api/v1/nas/list", endpoint="get_nas_server_list")
             response.raise_for_status()  # Raise an error for bad responses
             logger.info(f"NAS server list retrieved successfully: {response.json()}")
             return response.json()
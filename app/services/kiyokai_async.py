@@ -0,0 +1,146 @@
+import httpx
+
+from app.core.app_states import AppState
+from app.core.kiyokai_client import async_kiyokai_client
+from app.core.logger import get_logger
+from app.services.kiyokai import MASTER_SHOTS_TAG, VERSION_SHOTS_TAG, shot_tag
+
+logger = get_logger(__name__)
+
+class AsyncKiyokaiService:
+    """
+    Coroutine version of KiyokaiService, with the same endpoints and the same result dicts.
+
+    Runs on the shared async loop (app.core.async_loop), so several calls can be awaited together
+    with asyncio.gather. Qt handlers start them through the JobRunner instead of blocking a slot.
+    """
+
+    @staticmethod
+    async def _request(action: str, method: str, path: str, endpoint: str, **kwargs) -> dict:
+        kiyokai_url = AppState().kiyokai_url
+        token = AppState().access_token
+        if not kiyokai_url or not token:
+            logger.error("Kiyokai URL is not set.")
+            return {
+                "success": False,
+                "message": "Kiyokai URL is not set."
+            }
+
+        try:
+            response = await async_kiyokai_client.request(method, path, endpoint, **kwargs)
+            response.raise_for_status()  # Raise an error for bad responses
+            logger.info(f"{action} succeeded: {response.json()}")
+            return response.json()
+        except httpx.RequestError as e:
+            logger.error(f"Request error while {action}: {e}")
+            return {
+                "success": False,
+                "message": f"Request error: {str(e)}"
+            }
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error while {action}: {e}")
+            return {
+                "success": False,
+                "message": f"HTTP error: {str(e)}",
+                "status_code": e.response.status_code
+            }
+
+    @staticmethod
+    async def get_master_shot_data_by_id(shot_id: str, task_id: str) -> dict:
+        """
+        Fetch master shot data by ID from Kiyokai API.
+        """
+        return await AsyncKiyokaiService._request(
+            "fetching master shot data", "GET", f"/api/v1/shots/mastershots/list/{shot_id}/tasks/{task_id}",
+            "get_master_shot_data_by_id", cache_tags=(MASTER_SHOTS_TAG, shot_tag(shot_id, task_id))
+        )
+
+    @staticmethod
+    async def get_master_shot_by_master_shot_id(master_shot_id: str, fresh: bool = False) -> dict:
+        """
+        Fetch master shot data by master shot ID from Kiyokai API.
+        fresh skips the response cache, for lock checks.
+        """
+        return await AsyncKiyokaiService._request(
+            "fetching master shot data by ID", "GET", f"/api/v1/shots/mastershots/{master_shot_id}",
+            "get_master_shot_by_master_shot_id", cache_tags=(MASTER_SHOTS_TAG,), fresh=fresh
+        )
+
+    @staticmethod
+    async def create_master_shot(data: dict) -> dict:
+        """
+        Create a new master shot in Kiyokai.
+        """
+        return await AsyncKiyokaiService._request(
+            "creating master shot", "POST", "/api/v1/shots/mastershots/create", "create_master_shot", json=data,
+            invalidates=(MASTER_SHOTS_TAG,)
+        )
+
+    @staticmethod
+    async def update_master_shot(shot_id: str, task_id: str, data: dict) -> dict:
+        """
+        Update an existing master shot in Kiyokai.
+        """
+        return await AsyncKiyokaiService._request(
+            "updating master shot", "PATCH", f"/api/v1/shots/mastershots/update/{shot_id}/tasks/{task_id}",
+            "update_master_shot", json=data, invalidates=(MASTER_SHOTS_TAG, shot_tag(shot_id, task_id))
+        )
+
+    @staticmethod
+    async def get_version_shot_by_shot_id(shot_id: str, task_id: str) -> dict:
+        """
+        Fetch version shot data by shot ID from Kiyokai API.
+        """
+        return await AsyncKiyokaiService._request(
+            "fetching version shot data", "GET", f"/api/v1/shots/versionshots/list/{shot_id}/tasks/{task_id}",
+            "get_version_shot_by_shot_id", cache_tags=(VERSION_SHOTS_TAG, shot_tag(shot_id, task_id))
+        )
+
+    @staticmethod
+    async def get_version_shot_by_version_id(version_id: str, fresh: bool = False) -> dict:
+        """
+        Fetch version shot data by version ID from Kiyokai API.
+        fresh skips the response cache, for lock checks.
+        """
+        return await AsyncKiyokaiService._request(
+            "fetching version shot data by version ID", "GET", f"/api/v1/shots/versionshots/{version_id}",
+            "get_version_shot_by_version_id", cache_tags=(VERSION_SHOTS_TAG,), fresh=fresh
+        )
+
+    @staticmethod
+    async def update_version_shot_by_version_id(version_id: str, data: dict) -> dict:
+        """
+        Update an existing version shot in Kiyokai.
+        """
+        return await AsyncKiyokaiService._request(
+            "updating version shot", "PATCH", f"/api/v1/shots/versionshots/{version_id}",
+            "update_version_shot_by_version_id", json=data, invalidates=(VERSION_SHOTS_TAG, MASTER_SHOTS_TAG)
+        )
+
+    @staticmethod
+    async def create_version_shot(data: dict) -> dict:
+        """
+        Create a new version shot in Kiyokai.
+        """
+        return await AsyncKiyokaiService._request(
+            "creating version shot", "POST", "/api/v1/shots/versionshots/create", "create_version_shot", json=data,
+            invalidates=(VERSION_SHOTS_TAG, MASTER_SHOTS_TAG)
+        )
+
+    @staticmethod
+    async def create_nas_server(data: dict) -> dict:
+        """
+        Create a new NAS server in Kiyokai.
+        """
+        return await AsyncKiyokaiService._request(
+            "creating NAS server", "POST", "/api/v1/nas/create", "create_nas_server", json=data
+        )
+
+    @staticmethod
+    async def get_nas_server_list() -> dict:
+        """
+        Fetch the list of NAS servers from Kiyokai.
+        """
+        return await AsyncKiyokaiService._request(
+            "fetching NAS server list", "GET", "/api/v1/nas/list", "get_nas_server_list"
+        )
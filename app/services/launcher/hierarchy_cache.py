@@ -0,0 +1,132 @@
+import sqlite3
+import time
+from contextlib import closing
+
+from app.config import Settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class HierarchyCache:
+    """
+    SQLite snapshot of the launcher hierarchy.
+
+    Entities are stored as flat rows (see LauncherData.fetch_entities) keyed by Zou host and user,
+    so switching server or account never mixes trees.
+    """
+
+    def __init__(self, path: str = Settings.HIERARCHY_CACHE_FILE):
+        self.path = path
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sync (
+                host TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (host, user_id)
+            );
+            CREATE TABLE IF NOT EXISTS entities (
+                host TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                type TEXT NOT NULL,
+                parent_id TEXT NOT NULL,
+                id TEXT NOT NULL,
+                name TEXT,
+                updated_at TEXT,
+                for_entity TEXT,
+                position INTEGER NOT NULL,
+                PRIMARY KEY (host, user_id, type, parent_id, id)
+            );
+        """)
+        return conn
+
+    def load(self, host: str, user_id: str, max_age: int = Settings.HIERARCHY_CACHE_MAX_AGE):
+        """Return the cached rows in server order, or None when there is no snapshot or it is older than max_age"""
+        try:
+            with closing(self._connect()) as conn:
+                synced = conn.execute(
+                    "SELECT synced_at FROM sync WHERE host = ? AND user_id = ?", (host, user_id)
+                ).fetchone()
+
+                if not synced:
+                    return None
+                if max_age is not None and time.time() - synced[0] > max_age:
+                    logger.info(f"Hierarchy snapshot for {user_id}@{host} is older than {max_age}s")
+                    return None
+
+                cursor = conn.execute(
+                    "SELECT id, type, parent_id, name, updated_at, for_entity FROM entities "
+                    "WHERE host = ? AND user_id = ? ORDER BY position",
+                    (host, user_id)
+                )
+                rows = []
+                for entity_id, entity_type, parent_id, name, updated_at, for_entity in cursor:
+                    row = {"id": entity_id, "type": entity_type, "parent_id": parent_id, "name": name, "updated_at": updated_at}
+                    if entity_type == "task_type":
+                        row["for_entity"] = for_entity
+                    rows.append(row)
+                return rows
+        except sqlite3.Error as e:
+            logger.error(f"Error reading hierarchy cache: {e}")
+            return None
+
+    def sync(self, host: str, user_id: str, rows: list) -> int:
+        """
+        Bring the snapshot in line with freshly fetched rows.
+
+        Only rows that are new, moved or whose updated_at changed are written, rows that disappeared
+        are deleted. Returns the number of entities that changed.
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                cached = {
+                    (entity_type, parent_id, entity_id): (updated_at, name, position)
+                    for entity_type, parent_id, entity_id, updated_at, name, position in conn.execute(
+                        "SELECT type, parent_id, id, updated_at, name, position FROM entities WHERE host = ? AND user_id = ?",
+                        (host, user_id)
+                    )
+                }
+
+                changed = []
+                for position, row in enumerate(rows):
+                    key = (row["type"], row["parent_id"], row["id"])
+                    if cached.pop(key, None) != (row.get("updated_at"), row.get("name"), position):
+                        changed.append((
+                            host, user_id, row["type"], row["parent_id"], row["id"], row.get("name"),
+                            row.get("updated_at"), row.get("for_entity"), position
+                        ))
+
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entities "
+                    "(host, user_id, type, parent_id, id, name, updated_at, for_entity, position) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    changed
+                )
+                conn.executemany(
+                    "DELETE FROM entities WHERE host = ? AND user_id = ? AND type = ? AND parent_id = ? AND id = ?",
+                    [(host, user_id) + key for key in cached]
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync (host, user_id, synced_at) VALUES (?, ?, ?)",
+                    (host, user_id, time.time())
+                )
+                return len(changed) + len(cached)
+        except sqlite3.Error as e:
+            logger.error(f"Error writing hierarchy cache: {e}")
+            return 0
+
+    def invalidate(self, host: str = None, user_id: str = None):
+        """Drop the snapshot of one host/user, or every snapshot when no key is given"""
+        where, params = "", ()
+        if host is not None and user_id is not None:
+            where, params = " WHERE host = ? AND user_id = ?", (host, user_id)
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(f"DELETE FROM entities{where}", params)
+                conn.execute(f"DELETE FROM sync{where}", params)
+            logger.info(f"Hierarchy cache invalidated: {host or 'all hosts'}")
+        except sqlite3.Error as e:
+            logger.error(f"Error invalidating hierarchy cache: {e}")
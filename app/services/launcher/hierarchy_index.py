@@ -0,0 +1,97 @@
+class HierarchyIndex:
+    """
+    Id lookups over the project_data tree.
+
+    Every project, task type, asset type, episode, sequence and shot node is reachable by id in O(1),
+    together with its parent id and its row inside the parent's children list (which is also its
+    row in the matching combobox).
+    """
+
+    LEVELS = ("project", "task", "asset", "episode", "sequence", "shot")
+
+    def __init__(self):
+        self._nodes = {level: {} for level in self.LEVELS}
+        self._parents = {}
+        self._positions = {}
+
+    def clear(self):
+        for nodes in self._nodes.values():
+            nodes.clear()
+        self._parents.clear()
+        self._positions.clear()
+
+    def rebuild(self, project_data: list):
+        """Index a whole tree, replacing whatever was indexed before"""
+        self.clear()
+        self.add_children("project", None, project_data)
+
+    def add_children(self, level: str, parent_id, nodes: list):
+        """Index the children of one node, and recursively everything loaded below them"""
+        id_key = f"{level}_id"
+        for position, node in enumerate(nodes):
+            node_id = node[id_key]
+
+            # Task and asset types are shared between projects, key them by project
+            key = (parent_id, node_id) if level in ("task", "asset") else node_id
+            self._nodes[level][key] = node
+            self._positions[(level, parent_id, node_id)] = position
+            if parent_id is not None:
+                self._parents[(level, node_id)] = parent_id
+
+            if level == "project":
+                self.add_children("task", node_id, node.get("tasks", []))
+                self.add_children("asset", node_id, node.get("assets", []))
+                self.add_children("episode", node_id, node.get("episodes", []))
+            elif level == "episode":
+                self.add_children("sequence", node_id, node.get("sequences", []))
+            elif level == "sequence":
+                self.add_children("shot", node_id, node.get("shots", []))
+
+    def remove_children(self, level: str, parent_id, nodes: list):
+        """Forget the children of one node before they are replaced"""
+        id_key = f"{level}_id"
+        for node in nodes:
+            node_id = node[id_key]
+            key = (parent_id, node_id) if level in ("task", "asset") else node_id
+            self._nodes[level].pop(key, None)
+            self._positions.pop((level, parent_id, node_id), None)
+            self._parents.pop((level, node_id), None)
+
+            if level == "episode":
+                self.remove_children("sequence", node_id, node.get("sequences", []))
+            elif level == "sequence":
+                self.remove_children("shot", node_id, node.get("shots", []))
+
+# Lookups ==========================================================================================
+    def project(self, project_id):
+        return self._nodes["project"].get(project_id)
+
+    def task(self, project_id, task_id):
+        return self._nodes["task"].get((project_id, task_id))
+
+    def asset(self, project_id, asset_id):
+        return self._nodes["asset"].get((project_id, asset_id))
+
+    def episode(self, episode_id):
+        return self._nodes["episode"].get(episode_id)
+
+    def sequence(self, sequence_id):
+        return self._nodes["sequence"].get(sequence_id)
+
+    def shot(self, shot_id):
+        return self._nodes["shot"].get(shot_id)
+
+    def parent_id(self, level: str, node_id):
+        """Id of the project/episode/sequence a node belongs to"""
+        return self._parents.get((level, node_id))
+
+    def position(self, level: str, parent_id, node_id) -> int:
+        """Row of a node inside its parent's children list, -1 when it is not indexed"""
+        return self._positions.get((level, parent_id, node_id), -1)
+
+    def shot_path(self, shot_id) -> tuple:
+        """(project_id, episode_id, sequence_id) of a loaded shot"""
+        sequence_id = self.parent_id("shot", shot_id)
+        episode_id = self.parent_id("sequence", sequence_id)
+        project_id = self.parent_id("episode", episode_id)
+        return project_id, episode_id, sequence_id
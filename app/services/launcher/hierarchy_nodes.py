@@ -0,0 +1,109 @@
+import sys
+from collections.abc import Mapping
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class HierarchyNode(Mapping):
+    """
+    Base class for the slotted project hierarchy nodes.
+
+    Nodes store their fields in __slots__ with interned id/name strings instead of a per-node dict,
+    but still read like the dicts they replace (node["shot_id"], node.get("shots"), "project" in node,
+    dict(node)), so existing callers keep working.
+    """
+
+    __slots__ = ()
+
+    # Dict key -> slot name, in the key order of the original dicts
+    FIELDS = {}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self.FIELDS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, self.FIELDS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_dict(self) -> dict:
+        """Plain nested dict copy, e.g. for JSON"""
+        return {
+            key: [child.to_dict() for child in value] if isinstance(value, list) else value
+            for key, value in self.items()
+        }
+
+
+class ShotNode(HierarchyNode):
+    __slots__ = ("id", "name")
+    FIELDS = {"shot_id": "id", "shot": "name"}
+
+    def __init__(self, shot_id, name):
+        self.id = _intern(shot_id)
+        self.name = _intern(name)
+
+
+class SequenceNode(HierarchyNode):
+    __slots__ = ("id", "name", "shots")
+    FIELDS = {"sequence_id": "id", "sequence": "name", "shots": "shots"}
+
+    def __init__(self, sequence_id, name, shots=None):
+        self.id = _intern(sequence_id)
+        self.name = _intern(name)
+        self.shots = shots if shots is not None else []
+
+
+class EpisodeNode(HierarchyNode):
+    __slots__ = ("id", "name", "sequences")
+    FIELDS = {"episode_id": "id", "episode": "name", "sequences": "sequences"}
+
+    def __init__(self, episode_id, name, sequences=None):
+        self.id = _intern(episode_id)
+        self.name = _intern(name)
+        self.sequences = sequences if sequences is not None else []
+
+
+class TaskTypeNode(HierarchyNode):
+    __slots__ = ("id", "name", "for_entity")
+    FIELDS = {"task_id": "id", "task": "name", "task_for_entity": "for_entity"}
+
+    def __init__(self, task_id, name, for_entity):
+        self.id = _intern(task_id)
+        self.name = _intern(name)
+        self.for_entity = _intern(for_entity)
+
+
+class AssetTypeNode(HierarchyNode):
+    __slots__ = ("id", "name")
+    FIELDS = {"asset_id": "id", "asset": "name"}
+
+    def __init__(self, asset_id, name):
+        self.id = _intern(asset_id)
+        self.name = _intern(name)
+
+
+class ProjectNode(HierarchyNode):
+    __slots__ = ("id", "name", "episodes", "tasks", "assets")
+    FIELDS = {"project_id": "id", "project": "name", "episodes": "episodes", "tasks": "tasks", "assets": "assets"}
+
+    def __init__(self, project_id, name, episodes=None, tasks=None, assets=None):
+        self.id = _intern(project_id)
+        self.name = _intern(name)
+        self.episodes = episodes if episodes is not None else []
+        self.tasks = tasks if tasks is not None else []
+        self.assets = assets if assets is not None else []
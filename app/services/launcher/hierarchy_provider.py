@@ -0,0 +1,458 @@
+import threading
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app.config import Settings
+from app.core.logger import get_logger
+from app.services.asset import AssetService
+from app.services.project import ProjectService
+from app.services.shot import ShotService
+from app.services.task import TaskService
+from app.services.launcher.hierarchy_index import HierarchyIndex
+from app.services.launcher.hierarchy_nodes import EpisodeNode, SequenceNode, ShotNode
+from app.services.launcher.launcher_data import LauncherData
+from app.services.launcher.shot_search_index import ShotSearchIndex
+
+logger = get_logger(__name__)
+
+# kind is "added", "removed" or "renamed"; position is the row in the parent's list (-1 when removed)
+HierarchyChange = namedtuple("HierarchyChange", ["kind", "level", "parent_id", "node_id", "name", "position"])
+
+class HierarchyProvider:
+    """
+    Lazily expands the project hierarchy.
+
+    Only the project list is fetched up front. Task/asset types, episodes, sequences and shots
+    are fetched the first time a node is expanded, memoized on the node itself, and concurrent
+    requests for the same node share a single in-flight fetch. Background refreshes re-fetch only
+    the nodes that were expanded (sync_loaded_in_background), unless that costs more than a full sync.
+    """
+
+    CHILD_LEVELS = {"project": ("task", "asset", "episode"), "episode": ("sequence",), "sequence": ("shot",)}
+    CHILDREN_KEYS = {
+        "project": "projects", "task": "tasks", "asset": "assets",
+        "episode": "episodes", "sequence": "sequences", "shot": "shots"
+    }
+
+    def __init__(self, max_workers: int = Settings.LAUNCHER_MAX_WORKERS):
+        self.project_data = []
+        self.index = HierarchyIndex()
+
+        self._search_index = None
+        self._loaded = set()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def load_projects(self) -> list:
+        """Fetch the project list, without any of its children"""
+        project_list = ProjectService.get_user_project()
+        if not isinstance(project_list, list):
+            logger.error(f"Failed to load project list: {project_list}")
+            project_list = []
+
+        self.set_project_data([LauncherData.build_project(project, [], []) for project in project_list], loaded=False)
+        return self.project_data
+
+    def load_snapshot(self) -> bool:
+        """Seed the tree from the on-disk snapshot, returns False when there is none"""
+        project_data = LauncherData.load_cached()
+        if project_data is None:
+            return False
+
+        self.set_project_data(project_data)
+        return True
+
+    def sync_in_background(self):
+        """Refresh the on-disk snapshot off the calling thread, the future resolves to the fresh tree or None"""
+        return self._executor.submit(self._sync)
+
+    def prefers_full_sync(self) -> bool:
+        """
+        Whether re-fetching the loaded nodes one by one costs more requests than a full sync
+        (five per project), as for a tree seeded from the snapshot where everything is loaded.
+        """
+        with self._lock:
+            fetches = 1 + sum(2 if kind == "details" else 1 for kind, _ in self._loaded)
+            return fetches >= 1 + 5 * len(self.project_data)
+
+    def sync_loaded_in_background(self):
+        """
+        Re-fetch the project list and the children of every loaded node off the calling thread.
+
+        Levels that were never expanded are not fetched. The future resolves to the list of
+        (level, parent_id, children) updates for apply_loaded(), parents first, or None when the
+        project list could not be fetched.
+        """
+        return self._executor.submit(self._sync_loaded)
+
+    def _sync(self):
+        try:
+            return LauncherData.sync_cache()
+        except Exception as e:
+            logger.error(f"Error syncing hierarchy: {e}")
+            return None
+
+    def _sync_loaded(self):
+        project_list = ProjectService.get_user_project()
+        if not isinstance(project_list, list):
+            logger.error(f"Failed to refresh project list: {project_list}")
+            return None
+
+        order = {"details": 0, "episodes": 1, "sequences": 2, "shots": 3}
+        with self._lock:
+            keys = sorted(self._loaded, key=lambda key: order[key[0]])
+
+        loaders = {
+            "details": lambda project_id: (TaskService.get_task_types_by_project(project_id),
+                                           AssetService.get_asset_types_by_project(project_id)),
+            "episodes": ShotService.get_episode_by_project,
+            "sequences": ShotService.get_sequence_by_episode,
+            "shots": ShotService.get_shots_by_sequence,
+        }
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda key: loaders[key[0]](key[1]), keys))
+
+        updates = [("project", None, [LauncherData.build_project(project, [], []) for project in project_list])]
+        for (kind, parent_id), result in zip(keys, results):
+            if kind == "details":
+                task_list, asset_list = result
+                if isinstance(task_list, list) and isinstance(asset_list, list):
+                    details = LauncherData.build_project({"id": parent_id, "name": ""}, task_list, asset_list)
+                    updates.append(("task", parent_id, details["tasks"]))
+                    updates.append(("asset", parent_id, details["assets"]))
+                    continue
+            elif isinstance(result, list):
+                node_class = {"episodes": EpisodeNode, "sequences": SequenceNode, "shots": ShotNode}[kind]
+                updates.append((kind[:-1], parent_id, [node_class(entity.get("id"), entity.get("name")) for entity in result]))
+                continue
+            logger.warning(f"Hierarchy refresh of {kind} of {parent_id} failed, keeping them")
+        return updates
+
+    def apply_loaded(self, updates: list) -> list:
+        """Merge the result of sync_loaded_in_background in place, returns the HierarchyChange list"""
+        changes = []
+        parents = {"project": self.index.project, "task": self.index.project, "asset": self.index.project,
+                   "episode": self.index.project, "sequence": self.index.episode, "shot": self.index.sequence}
+        with self._lock:
+            removed = set()
+            for level, parent_id, children in updates:
+                if parent_id in removed:
+                    continue
+                parent = {"projects": self.project_data} if level == "project" else parents[level](parent_id)
+                if parent is None:
+                    continue
+
+                list_key = self.CHILDREN_KEYS[level]
+                start = len(changes)
+                # One level at a time: nodes that stay keep their loaded children, new ones load lazily
+                self._merge_children(level, parent_id, parent, {list_key: children}, changes, True, recursive=False)
+                for change in changes[start:]:
+                    if change.kind == "removed":
+                        removed.add(change.node_id)
+                        for child_level in self.CHILD_LEVELS.get(level, ()):
+                            self._loaded.discard(self._loaded_key(child_level, change.node_id))
+
+            self.index.rebuild(self.project_data)
+            self._search_index = None
+
+        logger.info(f"Loaded hierarchy refreshed: {len(changes)} changes")
+        return changes
+
+    def apply_refresh(self, project_data: list) -> list:
+        """
+        Merge a freshly fetched tree into the current one in place.
+
+        Existing nodes are kept (and renamed when needed) so references held by the UI stay valid.
+        Levels that were never expanded simply adopt the fresh children. Returns the list of
+        HierarchyChange for every added, removed or renamed node in the expanded levels.
+        """
+        changes = []
+        with self._lock:
+            self._merge_children("project", None, {"projects": self.project_data}, {"projects": project_data}, changes, True)
+            self.index.rebuild(self.project_data)
+            self._search_index = None
+
+        logger.info(f"Hierarchy refreshed: {len(changes)} changes")
+        return changes
+
+    def _merge_children(self, level: str, parent_id, parent, fresh_parent, changes: list, expanded: bool,
+                        recursive: bool = True):
+        list_key = self.CHILDREN_KEYS[level]
+        current, fresh = parent[list_key], fresh_parent[list_key]
+
+        if not expanded:
+            parent[list_key] = fresh
+            self._loaded.add(self._loaded_key(level, parent_id))
+            for node in fresh:
+                self._mark_loaded(level, node)
+            return
+
+        id_key = f"{level}_id"
+        fresh_ids = {node[id_key] for node in fresh}
+        current_by_id = {node[id_key]: node for node in current}
+
+        for node in current:
+            if node[id_key] not in fresh_ids:
+                changes.append(HierarchyChange("removed", level, parent_id, node[id_key], node[level], -1))
+
+        merged = []
+        for position, fresh_node in enumerate(fresh):
+            node_id = fresh_node[id_key]
+            node = current_by_id.get(node_id)
+
+            if node is None:
+                if recursive:
+                    self._mark_loaded(level, fresh_node)
+                changes.append(HierarchyChange("added", level, parent_id, node_id, fresh_node[level], position))
+                merged.append(fresh_node)
+                continue
+
+            if node[level] != fresh_node[level]:
+                node[level] = fresh_node[level]
+                changes.append(HierarchyChange("renamed", level, parent_id, node_id, node[level], position))
+
+            # Task and asset types share one memo key, check every level before merging any of them
+            child_levels = self.CHILD_LEVELS.get(level, ()) if recursive else ()
+            expanded_levels = [self._loaded_key(child_level, node_id) in self._loaded for child_level in child_levels]
+            for child_level, child_expanded in zip(child_levels, expanded_levels):
+                self._merge_children(child_level, node_id, node, fresh_node, changes, child_expanded)
+            merged.append(node)
+
+        current[:] = merged
+
+    def _mark_loaded(self, level: str, node):
+        """Flag a fully fetched node and its subtree as expanded"""
+        node_id = node[f"{level}_id"]
+        for child_level in self.CHILD_LEVELS.get(level, ()):
+            self._loaded.add(self._loaded_key(child_level, node_id))
+            for child in node[self.CHILDREN_KEYS[child_level]]:
+                self._mark_loaded(child_level, child)
+
+    @staticmethod
+    def _loaded_key(level: str, parent_id):
+        """Memo key guarding the children of parent_id at this level"""
+        keys = {"task": "details", "asset": "details", "episode": "episodes", "sequence": "sequences", "shot": "shots"}
+        return keys[level], parent_id
+
+    def set_project_data(self, project_data: list, loaded: bool = True):
+        """Replace the tree, marking every level as loaded when it comes from a full load"""
+        with self._lock:
+            self.project_data[:] = project_data
+            self.index.rebuild(self.project_data)
+            self._search_index = None
+            self._loaded.clear()
+
+            if loaded:
+                for project in self.project_data:
+                    self._loaded.update({("details", project["project_id"]), ("episodes", project["project_id"])})
+                    for episode in project["episodes"]:
+                        self._loaded.add(("sequences", episode["episode_id"]))
+                        for sequence in episode["sequences"]:
+                            self._loaded.add(("shots", sequence["sequence_id"]))
+
+    def invalidate(self, level: str = None, node_id: str = None):
+        """Forget memoized children so the next expansion fetches them again"""
+        with self._lock:
+            if level is None:
+                self._loaded.clear()
+            else:
+                self._loaded.discard((level, node_id))
+
+    def search_index(self) -> ShotSearchIndex:
+        """Search index over the shots loaded so far, rebuilt after the tree changes"""
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = ShotSearchIndex(self.project_data)
+                logger.info(f"Shot search index built: {len(self._search_index)} entries")
+            return self._search_index
+
+# Events ===========================================================================================
+    def fetch_siblings(self, level: str, node_id: str):
+        """
+        Refetch the children of the parent of one shot or sequence in the background.
+
+        The future resolves to (parent_id, children), or None when the parent was never expanded
+        (it will be fetched fresh when it is) or the request failed.
+        """
+        return self._executor.submit(self._fetch_siblings, level, node_id)
+
+    def _fetch_siblings(self, level: str, node_id: str):
+        parent_id = self.index.parent_id(level, node_id)
+        if parent_id is None:
+            # New node, ask Zou where it lives
+            entity = ShotService.get_shot(node_id) if level == "shot" else ShotService.get_sequence(node_id)
+            parent_id = entity.get("parent_id") if isinstance(entity, dict) else None
+
+        with self._lock:
+            if parent_id is None or self._loaded_key(level, parent_id) not in self._loaded:
+                return None
+
+        if level == "shot":
+            shot_list = ShotService.get_shots_by_sequence(parent_id)
+            if not isinstance(shot_list, list):
+                return None
+            return parent_id, [ShotNode(shot.get("id"), shot.get("name")) for shot in shot_list]
+
+        sequence_list = ShotService.get_sequence_by_episode(parent_id)
+        if not isinstance(sequence_list, list):
+            return None
+        return parent_id, [SequenceNode(sequence.get("id"), sequence.get("name")) for sequence in sequence_list]
+
+    def apply_siblings(self, level: str, parent_id: str, children: list) -> list:
+        """Merge the result of fetch_siblings in place, returns the HierarchyChange list"""
+        changes = []
+        parent = self.index.sequence(parent_id) if level == "shot" else self.index.episode(parent_id)
+        if parent is None:
+            return changes
+
+        list_key = self.CHILDREN_KEYS[level]
+        with self._lock:
+            previous = list(parent[list_key])
+
+            # Only this level: sequences that stay keep their loaded shots
+            self._merge_children(level, parent_id, parent, {list_key: children}, changes, True, recursive=False)
+            self.index.remove_children(level, parent_id, previous)
+            self.index.add_children(level, parent_id, parent[list_key])
+            self._search_index = None
+
+        logger.info(f"Hierarchy {level}s of {parent_id} re-synced: {len(changes)} changes")
+        return changes
+
+# Expansion ========================================================================================
+    # The getters block until the level is fetched: call them off the GUI thread (job runner, async loop)
+    def get_project(self, project_id: str):
+        """Return the project node with its task and asset types loaded"""
+        project = self.index.project(project_id)
+        if project is None:
+            return None
+
+        self._expand(("details", project_id), lambda: self._load_details(project)).result()
+        return project
+
+    def get_episodes(self, project_id: str) -> list:
+        project = self.index.project(project_id)
+        if project is None:
+            return []
+
+        self._expand(("episodes", project_id), lambda: self._load_episodes(project)).result()
+        return project["episodes"]
+
+    def get_sequences(self, episode_id: str) -> list:
+        episode = self.index.episode(episode_id)
+        if episode is None:
+            return []
+
+        self._expand(("sequences", episode_id), lambda: self._load_sequences(episode)).result()
+        return episode["sequences"]
+
+    def get_shots(self, sequence_id: str) -> list:
+        sequence = self.index.sequence(sequence_id)
+        if sequence is None:
+            return []
+
+        self._expand(("shots", sequence_id), lambda: self._load_shots(sequence)).result()
+        return sequence["shots"]
+
+    def prefetch_episodes(self, project_id: str):
+        """Start fetching the episodes of a project without waiting for them"""
+        project = self.index.project(project_id)
+        if project is not None:
+            self._expand(("episodes", project_id), lambda: self._load_episodes(project))
+
+    def _expand(self, key: tuple, loader) -> Future:
+        """Future of the fetch behind key, shared with concurrent callers, already done when memoized"""
+        future = self._submit(key, loader)
+        if future is None:
+            future = Future()
+            future.set_result(None)
+        return future
+
+    def _submit(self, key: tuple, loader):
+        """Schedule a loader unless its result is memoized or already being fetched"""
+        with self._lock:
+            if key in self._loaded:
+                return None
+
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._executor.submit(self._run, key, loader)
+                self._in_flight[key] = future
+            else:
+                logger.info(f"Joining in-flight hierarchy request: {key}")
+            return future
+
+    def _run(self, key: tuple, loader):
+        try:
+            if loader():
+                with self._lock:
+                    self._loaded.add(key)
+        except Exception as e:
+            logger.error(f"Error expanding hierarchy node {key}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+# Loaders ==========================================================================================
+    def _load_details(self, project: dict) -> bool:
+        project_id = project["project_id"]
+        task_list = TaskService.get_task_types_by_project(project_id)
+        asset_list = AssetService.get_asset_types_by_project(project_id)
+
+        if not isinstance(task_list, list) or not isinstance(asset_list, list):
+            return False
+
+        details = LauncherData.build_project({"id": project_id, "name": project["project"]}, task_list, asset_list)
+        with self._lock:
+            self.index.remove_children("task", project_id, project["tasks"])
+            self.index.remove_children("asset", project_id, project["assets"])
+            project["tasks"] = details["tasks"]
+            project["assets"] = details["assets"]
+            self.index.add_children("task", project_id, project["tasks"])
+            self.index.add_children("asset", project_id, project["assets"])
+            self._search_index = None
+        return True
+
+    def _load_episodes(self, project: dict) -> bool:
+        episode_list = ShotService.get_episode_by_project(project["project_id"])
+        if not isinstance(episode_list, list):
+            return False
+
+        episodes = [
+            EpisodeNode(episode.get("id"), episode.get("name")) for episode in episode_list
+        ]
+        with self._lock:
+            self.index.remove_children("episode", project["project_id"], project["episodes"])
+            project["episodes"] = episodes
+            self.index.add_children("episode", project["project_id"], episodes)
+            self._search_index = None
+        return True
+
+    def _load_sequences(self, episode: dict) -> bool:
+        sequence_list = ShotService.get_sequence_by_episode(episode["episode_id"])
+        if not isinstance(sequence_list, list):
+            return False
+
+        sequences = [
+            SequenceNode(sequence.get("id"), sequence.get("name")) for sequence in sequence_list
+        ]
+        with self._lock:
+            self.index.remove_children("sequence", episode["episode_id"], episode["sequences"])
+            episode["sequences"] = sequences
+            self.index.add_children("sequence", episode["episode_id"], sequences)
+            self._search_index = None
+        return True
+
+    def _load_shots(self, sequence: dict) -> bool:
+        shot_list = ShotService.get_shots_by_sequence(sequence["sequence_id"])
+        if not isinstance(shot_list, list):
+            return False
+
+        shots = [ShotNode(shot.get("id"), shot.get("name")) for shot in shot_list]
+        with self._lock:
+            self.index.remove_children("shot", sequence["sequence_id"], sequence["shots"])
+            sequence["shots"] = shots
+            self.index.add_children("shot", sequence["sequence_id"], shots)
+            self._search_index = None
+        return True
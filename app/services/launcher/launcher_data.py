@@ -1,72 +1,264 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from app.config import Settings
 from app.core.app_states import AppState
+from app.core.logger import get_logger
+from app.services.launcher.hierarchy_cache import HierarchyCache
+from app.services.launcher.hierarchy_nodes import ProjectNode, TaskTypeNode, AssetTypeNode, EpisodeNode, SequenceNode, \
+    ShotNode
 from app.services.asset import AssetService
-from app.services.files import FileService
 from app.services.project import ProjectService
 from app.services.shot import ShotService
 from app.services.task import TaskService
 
+logger = get_logger(__name__)
+
 class LauncherData:
     """A class to handle the extraction of names from launcher data."""
 
     @staticmethod
-    def load_data() -> list:
-        """Load data into the launcher"""
+    def load_data(max_workers: int = Settings.LAUNCHER_MAX_WORKERS, progress_callback=None,
+                  bulk: bool = Settings.LAUNCHER_BULK_LOAD) -> list:
+        """
+        Load data into the launcher.
+
+        Each level of the hierarchy (projects -> episodes -> sequences -> shots) is fetched
+        concurrently on a bounded worker pool. progress_callback(level, done, total) is
+        called every time a request of the current level finishes.
+
+        In bulk mode every sequence and shot of a project is fetched in one request each
+        and grouped client-side by parent_id, so the request count only grows with projects.
+        """
+
+        if bulk:
+            return LauncherData._load_data_bulk(max_workers, progress_callback)
 
         all_data = []
 
         # Load projects
+        project_list = LauncherData._as_list(ProjectService.get_user_project())
+        project_ids = [project.get("id") for project in project_list]
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # Task types, asset types and episodes for each project
+            project_results = LauncherData._map_level(executor, "projects", [
+                call
+                for project_id in project_ids
+                for call in (
+                    (TaskService.get_task_types_by_project, project_id),
+                    (AssetService.get_asset_types_by_project, project_id),
+                    (ShotService.get_episode_by_project, project_id),
+                )
+            ], progress_callback)
+
+            episode_lists = []
+            for index, (project, project_id) in enumerate(zip(project_list, project_ids)):
+                task_list, asset_list, episode_list = project_results[index * 3:index * 3 + 3]
+                episode_lists.append(episode_list)
+
+                all_data.append(LauncherData.build_project(project, task_list, asset_list))
+
+            # Load sequences for each episode
+            episodes = [
+                (project_data, episode)
+                for project_data, episode_list in zip(all_data, episode_lists)
+                for episode in episode_list
+            ]
+            sequence_lists = LauncherData._map_level(executor, "episodes", [
+                (ShotService.get_sequence_by_episode, episode.get("id")) for _, episode in episodes
+            ], progress_callback)
+
+            sequences = []
+            for (project_data, episode), sequence_list in zip(episodes, sequence_lists):
+                episode_data = EpisodeNode(episode.get("id"), episode.get("name"))
+                project_data["episodes"].append(episode_data)
+                sequences.extend((episode_data, sequence) for sequence in sequence_list)
+
+            # Load shots for each sequence
+            shot_lists = LauncherData._map_level(executor, "sequences", [
+                (ShotService.get_shots_by_sequence, sequence.get("id")) for _, sequence in sequences
+            ], progress_callback)
+
+            for (episode_data, sequence), shots in zip(sequences, shot_lists):
+                episode_data["sequences"].append(SequenceNode(
+                    sequence.get("id"),
+                    sequence.get("name"),
+                    [ShotNode(shot.get("id"), shot.get("name")) for shot in shots]
+                ))
+
+        return all_data
+
+    @staticmethod
+    def _load_data_bulk(max_workers: int, progress_callback=None) -> list:
+        """Load the launcher data with O(projects) requests"""
+        return LauncherData.build_tree(LauncherData.fetch_entities(max_workers, progress_callback))
+
+    @staticmethod
+    def fetch_entities(max_workers: int = Settings.LAUNCHER_MAX_WORKERS, progress_callback=None,
+                       failures: list = None) -> list:
+        """
+        Fetch the whole hierarchy as flat entity rows, in server order.
+
+        Each row has id, type, parent_id, name and updated_at (task types also carry for_entity).
+        Failed requests are appended to failures when a list is given.
+        """
+
         project_list = ProjectService.get_user_project()
-        for project in project_list:
+        if not isinstance(project_list, list):
+            if failures is not None:
+                failures.append(("get_user_project", None))
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            project_results = LauncherData._map_level(executor, "projects", [
+                call
+                for project in project_list
+                for call in (
+                    (TaskService.get_task_types_by_project, project.get("id")),
+                    (AssetService.get_asset_types_by_project, project.get("id")),
+                    (ShotService.get_episode_by_project, project.get("id")),
+                    (ShotService.get_sequences_by_project, project.get("id")),
+                    (ShotService.get_shots_by_project, project.get("id")),
+                )
+            ], progress_callback, failures)
+
+        rows = []
+        for index, project in enumerate(project_list):
             project_id = project.get("id")
+            task_list, asset_list, episode_list, sequence_list, shot_list = project_results[index * 5:index * 5 + 5]
 
-            task_list = TaskService.get_task_types_by_project(project_id)
-            asset_list = AssetService.get_asset_types_by_project(project_id)
-
-            project_data = {
-                "project_id": project_id,
-                "project": project.get("name"),
-                "episodes": [],
-                "tasks": [
-                    {"task_id": task["id"], "task": task["name"], "task_for_entity": task["for_entity"]}
-                    for task in task_list
-                ],
-                "assets": [
-                    {"asset_id": asset["id"], "asset": asset["name"]} for asset in asset_list
-                ]
-            }
-            # Load episodes for each project
-            episode_list = ShotService.get_episode_by_project(project_id)
-            for episode in episode_list:
-                episode_id = episode.get("id")
-                episode_data = {
-                    "episode_id": episode_id,
-                    "episode": episode.get("name"),
-                    "sequences": []
-                }
-                # Load sequences for each episode
-                sequence_list = ShotService.get_sequence_by_episode(episode_id)
-                for sequence in sequence_list:
-                    sequence_id = sequence.get("id")
-                    sequence_data = {
-                        "sequence_id": sequence_id,
-                        "sequence": sequence.get("name"),
-                        "shots": []
-                    }
-                    # Load shots for each sequence
-                    shots = ShotService.get_shots_by_sequence(sequence_id)
-                    shot_data = []
-                    for shot in shots:
-                        shot_data.append({
-                            "shot_id": shot.get("id"),
-                            "shot": shot.get("name"),
-                        })
+            rows.append(LauncherData._entity_row("project", project, ""))
+            rows.extend(
+                dict(LauncherData._entity_row("task_type", task, project_id), for_entity=task.get("for_entity"))
+                for task in task_list
+            )
+            rows.extend(LauncherData._entity_row("asset_type", asset, project_id) for asset in asset_list)
+            rows.extend(LauncherData._entity_row("episode", episode, project_id) for episode in episode_list)
+            rows.extend(LauncherData._entity_row("sequence", sequence, sequence.get("parent_id")) for sequence in sequence_list)
+            rows.extend(LauncherData._entity_row("shot", shot, shot.get("parent_id")) for shot in shot_list)
 
-                    sequence_data["shots"] = shot_data
-                    episode_data["sequences"].append(sequence_data)
-                project_data["episodes"].append(episode_data)
+        return rows
+
+    @staticmethod
+    def build_tree(rows: list) -> list:
+        """Group flat entity rows by parent_id into the nested project_data structure"""
+        children = {}
+        for row in rows:
+            children.setdefault((row["type"], row["parent_id"]), []).append(row)
+
+        all_data = []
+        for project in children.get(("project", ""), []):
+            project_id = project["id"]
+            project_data = LauncherData.build_project(
+                project,
+                children.get(("task_type", project_id), []),
+                children.get(("asset_type", project_id), [])
+            )
+
+            for episode in children.get(("episode", project_id), []):
+                project_data["episodes"].append(EpisodeNode(episode["id"], episode["name"], [
+                    SequenceNode(sequence["id"], sequence["name"], [
+                        ShotNode(shot["id"], shot["name"])
+                        for shot in children.get(("shot", sequence["id"]), [])
+                    ])
+                    for sequence in children.get(("sequence", episode["id"]), [])
+                ]))
             all_data.append(project_data)
+
         return all_data
 
+    @staticmethod
+    def _entity_row(entity_type: str, entity: dict, parent_id: str) -> dict:
+        return {
+            "id": entity.get("id"),
+            "type": entity_type,
+            "parent_id": parent_id or "",
+            "name": entity.get("name"),
+            "updated_at": entity.get("updated_at"),
+        }
+
+# Cache ============================================================================================
+    @staticmethod
+    def load_cached(max_age: int = Settings.HIERARCHY_CACHE_MAX_AGE):
+        """Return the cached project_data for the current host and user, or None when missing or stale"""
+        host, user_id = LauncherData._cache_key()
+        rows = HierarchyCache().load(host, user_id, max_age)
+        if rows is None:
+            return None
+
+        logger.info(f"Loaded hierarchy snapshot for {user_id}@{host}: {len(rows)} entities")
+        return LauncherData.build_tree(rows)
+
+    @staticmethod
+    def sync_cache(max_workers: int = Settings.LAUNCHER_MAX_WORKERS):
+        """
+        Fetch the hierarchy and write only the entities whose updated_at changed into the cache.
+
+        Returns the refreshed project_data, or None when a request failed and the snapshot was kept.
+        """
+        failures = []
+        rows = LauncherData.fetch_entities(max_workers, failures=failures)
+        if failures:
+            logger.warning(f"Hierarchy sync skipped, {len(failures)} requests failed")
+            return None
+
+        host, user_id = LauncherData._cache_key()
+        changed = HierarchyCache().sync(host, user_id, rows)
+        logger.info(f"Hierarchy synced for {user_id}@{host}: {changed} entities changed")
+        return LauncherData.build_tree(rows)
+
+    @staticmethod
+    def invalidate_cache():
+        """Drop the cached hierarchy of the current host and user"""
+        host, user_id = LauncherData._cache_key()
+        HierarchyCache().invalidate(host, user_id)
+
+    @staticmethod
+    def _cache_key() -> tuple:
+        user = (AppState().user_data or {}).get("user") or {}
+        return AppState().zou_url or "", user.get("id") or ""
+
+    @staticmethod
+    def build_project(project: dict, task_list: list, asset_list: list) -> ProjectNode:
+        """Build a project node without its episodes"""
+        return ProjectNode(
+            project.get("id"),
+            project.get("name"),
+            tasks=[TaskTypeNode(task["id"], task["name"], task["for_entity"]) for task in task_list],
+            assets=[AssetTypeNode(asset["id"], asset["name"]) for asset in asset_list]
+        )
+
+    @staticmethod
+    def _map_level(executor, level: str, calls: list, progress_callback=None, failures: list = None) -> list:
+        """Run every (function, argument) call of one hierarchy level and return results in call order"""
+        results = [[] for _ in calls]
+        futures = {executor.submit(func, arg): index for index, (func, arg) in enumerate(calls)}
+        total = len(futures)
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.error(f"Error loading {level} level: {e}")
+                response = None
+
+            if isinstance(response, list):
+                results[index] = response
+            elif failures is not None:
+                func, arg = calls[index]
+                failures.append((func.__name__, arg))
+
+            if progress_callback:
+                progress_callback(level, done, total)
+
+        logger.info(f"Loaded {level} level: {total} requests")
+        return results
+
+    @staticmethod
+    def _as_list(response) -> list:
+        """Services return an error dict on failure, treat it as an empty result"""
+        return response if isinstance(response, list) else []
 
     @staticmethod
     def extract_all_name_id(data: list) -> list:
@@ -119,4 +311,13 @@ class LauncherData:
                                 "id": shot["shot_id"]
                             })
 
-        return results
\ No newline at end of file
+        return results
+
+    @staticmethod
+    def iter_shot_paths(data: list):
+        """Yield (project, episode, sequence, shot) for every loaded shot, in tree order"""
+        for project in data:
+            for episode in project.get("episodes", []):
+                for sequence in episode.get("sequences", []):
+                    for shot in sequence.get("shots", []):
+                        yield project, episode, sequence, shot
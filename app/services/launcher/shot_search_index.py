@@ -0,0 +1,253 @@
+import re
+from collections import defaultdict
+
+from app.services.launcher.launcher_data import LauncherData
+
+
+class ShotSearchIndex:
+    """
+    Fuzzy search over every project / episode / sequence / shot / task path.
+
+    Shots are stored once, in tree order, so each project, episode and sequence covers a contiguous
+    range of shot rows. Names are indexed once per node (trigrams for substring matches, prefixes
+    at word starts for short and word-start matches) and only expanded to shot rows at query time.
+    Shot task types are matched on their own and paired with the shots of their project, so the
+    index stays small even though every (shot, task) pair is a result.
+    """
+
+    MAX_PREFIX = 8
+
+    # Score of one query term: start of the shot (or task) name, start of a word, anywhere
+    HEAD, WORD, SUBSTRING = 3, 2, 1
+
+    TOKEN_RE = re.compile(r"[a-z]+|\d+")
+    TERM_SPLIT_RE = re.compile(r"[\s/]+")
+
+    def __init__(self, project_data: list = ()):
+        self.entry_count = 0
+
+        # Shot rows: the row number is the id used in the shot posting lists
+        self._rows = []
+        self._row_project = []
+        self._shot_names = []
+        self._shot_trigrams = defaultdict(list)
+        self._shot_prefixes = defaultdict(list)
+        self._shot_heads = defaultdict(list)
+
+        # Projects, episodes and sequences ("groups"): posting lists hold group ids
+        self._group_names = []
+        self._group_spans = []
+        self._group_trigrams = defaultdict(list)
+        self._group_prefixes = defaultdict(list)
+
+        # Per project: its group id and its shot task types as (task node, lowercase name)
+        self._project_groups = []
+        self._project_tasks = []
+
+        self.build(project_data)
+
+    def __len__(self):
+        return self.entry_count
+
+    def build(self, project_data: list):
+        """Index the shots loaded in project_data"""
+        current = {}
+
+        for project, episode, sequence, shot in LauncherData.iter_shot_paths(project_data):
+            row = len(self._rows)
+
+            for level, node in (("project", project), ("episode", episode), ("sequence", sequence)):
+                node_group = current.get(level)
+                if node_group is None or node_group[0] is not node:
+                    node_group = current[level] = (node, self._add_group(node[level], row))
+                    if level == "project":
+                        self._project_groups.append(node_group[1])
+                        self._project_tasks.append([
+                            (task, (task["task"] or "").lower())
+                            for task in project.get("tasks", [])
+                            if (task.get("task_for_entity") or "").lower() == "shot"
+                        ])
+                self._group_spans[node_group[1]][1] = row + 1
+
+            self._rows.append((project, episode, sequence, shot))
+            self._row_project.append(len(self._project_tasks) - 1)
+            self._add_shot(shot["shot"], row)
+            self.entry_count += len(self._project_tasks[-1])
+
+    def _add_group(self, name: str, row: int) -> int:
+        group = len(self._group_names)
+        name = (name or "").lower()
+        self._group_names.append(name)
+        self._group_spans.append([row, row])
+        self._add_grams(name, group, self._group_trigrams, self._group_prefixes)
+        return group
+
+    def _add_shot(self, name: str, row: int):
+        name = (name or "").lower()
+        self._shot_names.append(name)
+        self._add_grams(name, row, self._shot_trigrams, self._shot_prefixes)
+        for length in range(1, min(len(name), self.MAX_PREFIX) + 1):
+            self._shot_heads[name[:length]].append(row)
+
+    def _add_grams(self, name: str, node: int, trigrams: dict, prefixes: dict):
+        for gram in {name[i:i + 3] for i in range(len(name) - 2)}:
+            trigrams[gram].append(node)
+
+        grams = set()
+        for start in self._word_starts(name):
+            grams.update(name[start:start + length] for length in range(1, self.MAX_PREFIX + 1))
+        for gram in grams:
+            prefixes[gram].append(node)
+
+    def _word_starts(self, name: str) -> set:
+        return {0} | {match.start() for match in self.TOKEN_RE.finditer(name)}
+
+# Search ===========================================================================================
+    def search(self, query: str, limit: int = 50) -> list:
+        """
+        Return up to limit results ranked best first.
+
+        Every whitespace or "/" separated term must match the shot path or the task name. Terms
+        of one or two characters only match at the start of a word.
+        """
+        terms = [term for term in self.TERM_SPLIT_RE.split(query.lower()) if term]
+        if not terms or not self._rows or limit <= 0:
+            return []
+
+        term_rows = [self._match(term) for term in terms]
+
+        # Tasks that match the same terms equally well share the same shot candidates
+        task_groups = defaultdict(lambda: defaultdict(list))
+        for project, tasks in enumerate(self._project_tasks):
+            for position, (task, task_name) in enumerate(tasks):
+                tiers = tuple(self._tier(task_name, term) for term in terms)
+                task_groups[tiers][project].append((position, task))
+
+        ranked = []
+        for tiers, tasks_by_project in task_groups.items():
+            required = [rows for rows, tier in zip(term_rows, tiers) if not tier]
+            task_score = sum(tiers)
+
+            count = 0
+            for score, row in self._rank_rows(required, tasks_by_project):
+                for position, task in tasks_by_project[self._row_project[row]]:
+                    ranked.append((-(score + task_score), row, position, task))
+                    count += 1
+                if count >= limit:
+                    break
+
+        ranked.sort(key=lambda entry: entry[:3])
+        return [self._result(row, task, -score) for score, row, _, task in ranked[:limit]]
+
+    def _match(self, term: str) -> tuple:
+        """(matching rows, rows matching at a word start, rows whose shot name starts with term)"""
+        shot_words = self._word_matches(term, self._shot_names, self._shot_prefixes)
+        group_words = self._word_matches(term, self._group_names, self._group_prefixes)
+
+        if len(term) < 3:
+            shot_matches, group_matches = shot_words, group_words
+        else:
+            shot_matches = self._substring_matches(term, self._shot_names, self._shot_trigrams)
+            group_matches = self._substring_matches(term, self._group_names, self._group_trigrams)
+
+        if len(term) <= self.MAX_PREFIX:
+            heads = set(self._shot_heads.get(term, ()))
+        else:
+            heads = {row for row in self._shot_heads.get(term[:self.MAX_PREFIX], ()) if self._shot_names[row].startswith(term)}
+
+        words = self._expand(shot_words, group_words)
+        matches = words if shot_matches is shot_words else self._expand(shot_matches, group_matches)
+        return matches, words, heads
+
+    def _word_matches(self, term: str, names: list, prefixes: dict):
+        if len(term) <= self.MAX_PREFIX:
+            return prefixes.get(term, ())
+        return [
+            node for node in prefixes.get(term[:self.MAX_PREFIX], ())
+            if any(names[node].startswith(term, start) for start in self._word_starts(names[node]))
+        ]
+
+    @staticmethod
+    def _substring_matches(term: str, names: list, trigrams: dict):
+        postings = sorted((trigrams.get(term[i:i + 3], ()) for i in range(len(term) - 2)), key=len)
+        if not postings[0]:
+            return ()
+
+        candidates = set(postings[0]).intersection(*postings[1:])
+        if len(term) == 3:
+            return candidates
+        return [node for node in candidates if term in names[node]]
+
+    def _expand(self, shot_rows, groups) -> set:
+        rows = set(shot_rows)
+
+        # Groups nest and neighbour each other, merge their spans into as few ranges as possible
+        start = end = 0
+        for group_start, group_end in sorted(self._group_spans[group] for group in groups):
+            if group_start > end:
+                rows.update(range(start, end))
+                start = group_start
+            end = max(end, group_end)
+        rows.update(range(start, end))
+        return rows
+
+    def _tier(self, name: str, term: str) -> int:
+        if name.startswith(term):
+            return self.HEAD
+        if term not in name:
+            return 0
+        if any(name.startswith(term, start) for start in self._word_starts(name)):
+            return self.WORD
+        return self.SUBSTRING if len(term) >= 3 else 0
+
+    def _rank_rows(self, required: list, tasks_by_project: dict):
+        """Yield (score, row) for shots of these projects matching every required term, best first"""
+        if not required:
+            for project in tasks_by_project:
+                for row in range(*self._group_spans[self._project_groups[project]]):
+                    yield 0, row
+            return
+
+        candidates = set.intersection(*sorted((matches for matches, _, _ in required), key=len))
+        if not candidates:
+            return
+
+        # Split the candidates by how well each term matches them, then merge the parts by total score
+        # (heads are a subset of words, words of matches, so a single term needs no intersections)
+        if len(required) == 1:
+            partitions = [((self.HEAD, heads), (self.WORD, words - heads), (self.SUBSTRING, candidates - words))
+                          for _, words, heads in required]
+        else:
+            partitions = [
+                ((self.HEAD, heads & candidates), (self.WORD, (words & candidates) - heads), (self.SUBSTRING, candidates - words))
+                for _, words, heads in required
+            ]
+        buckets = defaultdict(list)
+        self._split(partitions, 0, candidates, 0, buckets)
+
+        for score in sorted(buckets, reverse=True):
+            for row in sorted(set().union(*buckets[score])):
+                if self._row_project[row] in tasks_by_project:
+                    yield score, row
+
+    def _split(self, partitions: list, level: int, rows: set, score: int, buckets: dict):
+        if not rows:
+            return
+        if level == len(partitions):
+            buckets[score].append(rows)
+            return
+
+        for tier, part in partitions[level]:
+            self._split(partitions, level + 1, rows & part, score + tier, buckets)
+
+    def _result(self, row: int, task, score: int) -> dict:
+        project, episode, sequence, shot = self._rows[row]
+        return {
+            "project_id": project["project_id"],
+            "task_id": task["task_id"],
+            "episode_id": episode["episode_id"],
+            "sequence_id": sequence["sequence_id"],
+            "shot_id": shot["shot_id"],
+            "path": " / ".join((project["project"], episode["episode"], sequence["sequence"], shot["shot"], task["task"])),
+            "score": score,
+        }
@@ -0,0 +1,249 @@
+import asyncio
+import glob
+import os
+
+from app.config import Settings
+from app.core.async_loop import run_blocking
+from app.core.logger import get_logger
+from app.services.kiyokai_async import AsyncKiyokaiService
+from app.services.version_import import VersionImportService, VersionListUnavailable
+from app.utils.version_shots import VersionShotService
+
+logger = get_logger(__name__)
+
+class MasterShotProvisioningService:
+    """
+    Creates the master shots of a whole episode or sequence from a root folder on the NAS.
+
+    The master file and version folder of every shot are found by formatting a naming template
+    with {project}, {episode}, {sequence}, {shot} and {task} under the root folder; master file
+    templates may contain the wildcards * ? [ (the first match wins). Shots that already have a master
+    shot are left alone. plan() only reads, so it doubles as the dry run; provision() creates the
+    missing master shots at most Settings.PROVISION_CONCURRENCY at a time and, when asked, then
+    registers the versions of every matched shot (see VersionImportService).
+    """
+
+    @staticmethod
+    def template_fields(base: dict, sequence: dict, shot: dict) -> dict:
+        return {
+            "project": base.get("project_name") or "",
+            "episode": base.get("episode_name") or "",
+            "sequence": sequence.get("sequence") or "",
+            "shot": shot.get("shot") or "",
+            "task": base.get("task_name") or "",
+        }
+
+    @staticmethod
+    def match_master_file(root_folder: str, template: str, fields: dict):
+        """Full path of the master file the template points to, None when there is none"""
+        path = os.path.join(root_folder, template.format(**fields))
+        # Only the template decides, the root folder or a shot name may contain [ literally
+        if any(char in template for char in "*?["):
+            matches = sorted(match for match in glob.glob(path) if os.path.isfile(match))
+            return matches[0] if matches else None
+        return path if os.path.isfile(path) else None
+
+    @staticmethod
+    def match_version_folder(root_folder: str, template: str, fields: dict) -> str:
+        if not template:
+            return ""
+        path = os.path.join(root_folder, template.format(**fields))
+        return path if os.path.isdir(path) else ""
+
+    @staticmethod
+    async def collect_shots(hierarchy, episode_id: str, sequence_id: str = None) -> list:
+        """(sequence, shot) pairs of the sequence, or of every sequence of the episode"""
+        sequences = await run_blocking(hierarchy.get_sequences, episode_id)
+        if sequence_id:
+            sequences = [sequence for sequence in sequences if sequence["sequence_id"] == sequence_id]
+
+        shot_lists = await asyncio.gather(*(run_blocking(hierarchy.get_shots, sequence["sequence_id"])
+                                            for sequence in sequences))
+        return [(sequence, shot) for sequence, shots in zip(sequences, shot_lists) for shot in shots]
+
+    @staticmethod
+    async def plan(base: dict, hierarchy, root_folder: str, master_template: str, version_template: str = "",
+                   sequence_id: str = None, with_versions: bool = False,
+                   concurrency: int = Settings.PROVISION_CONCURRENCY) -> list:
+        """
+        One entry per shot of the scope: {"shot_name", "status", "data", "master_shot_id", "versions", "error"}.
+
+        status is "create", "exists" (a master shot is registered), "no_file" (the template
+        matched nothing) or "error" (the master shot could not be read, only a 404 means there is
+        none). data is the create payload, versions the number of version files that still need
+        registering (only counted with with_versions), error why the shot or its versions could
+        not be read (they are then left alone).
+        """
+        pairs = await MasterShotProvisioningService.collect_shots(hierarchy, base.get("episode_id"), sequence_id)
+        # The reads are bounded too, a whole episode would otherwise queue on the connection pool
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        def match(sequence, shot):
+            fields = MasterShotProvisioningService.template_fields(base, sequence, shot)
+            return (MasterShotProvisioningService.match_master_file(root_folder, master_template, fields),
+                    MasterShotProvisioningService.match_version_folder(root_folder, version_template, fields))
+
+        matches = await asyncio.gather(*(run_blocking(match, sequence, shot) for sequence, shot in pairs))
+        scans = {}
+        if with_versions:
+            version_folders = [version_folder for _, version_folder in matches if version_folder]
+            scans = await run_blocking(VersionShotService.scan_many, version_folders)
+
+        async def plan_shot(sequence, shot, file_path, version_folder):
+            data = base.copy()
+            data.update({
+                "file_name": os.path.basename(file_path) if file_path else None,
+                "file_path": file_path,
+                "version_folder": version_folder,
+                "sequence_id": sequence["sequence_id"],
+                "sequence_name": sequence["sequence"],
+                "shot_id": shot["shot_id"],
+                "shot_name": shot["shot"],
+            })
+            entry = {"shot_name": f"{sequence['sequence']}/{shot['shot']}", "status": "create", "data": data,
+                     "master_shot_id": None, "versions": 0, "error": None}
+
+            async with semaphore:
+                response = await AsyncKiyokaiService.get_master_shot_data_by_id(shot["shot_id"], base.get("task_id"))
+            if response.get("success") and response.get("data"):
+                entry["status"] = "exists"
+                entry["master_shot_id"] = response["data"].get("id")
+            elif not response.get("success") and response.get("status_code") != 404:
+                # Timeout, server or auth error: the shot may well have a master shot already
+                entry["status"] = "error"
+                entry["error"] = f"Could not read the master shot: {response.get('message', 'Unknown error')}"
+                return entry
+            elif not file_path:
+                entry["status"] = "no_file"
+                return entry
+
+            if with_versions and version_folder:
+                normal, _ = scans[version_folder]
+                registered = set()
+                if entry["status"] == "exists":
+                    try:
+                        async with semaphore:
+                            registered = await VersionImportService.registered_versions(shot["shot_id"], base.get("task_id"))
+                    except VersionListUnavailable as e:
+                        entry["error"] = str(e)
+                        return entry
+                to_create, _ = VersionImportService.plan(data, normal, registered)
+                entry["versions"] = len(to_create)
+            return entry
+
+        return list(await asyncio.gather(*(plan_shot(sequence, shot, *matched)
+                                           for (sequence, shot), matched in zip(pairs, matches))))
+
+    @staticmethod
+    async def provision(base: dict, hierarchy, root_folder: str, master_template: str, version_template: str = "",
+                        sequence_id: str = None, with_versions: bool = False, dry_run: bool = False,
+                        progress=None, concurrency: int = Settings.PROVISION_CONCURRENCY) -> dict:
+        """
+        Create the missing master shots of the scope (nothing when dry_run), then their versions.
+
+        progress(done, total, message) is called from the async loop thread after every step.
+        Returns {"success", "dry_run", "entries", "created", "failed": [(shot_name, message)],
+        "versions": {shot_name: VersionImportService result}}. A shot whose master shot turns out
+        to exist when creating it gets the "exists" status, its versions are still registered.
+        """
+        entries = await MasterShotProvisioningService.plan(
+            base, hierarchy, root_folder, master_template, version_template, sequence_id, with_versions, concurrency
+        )
+        report = {"success": True, "dry_run": dry_run, "entries": entries, "created": [], "failed": [], "versions": {}}
+        if dry_run:
+            return report
+
+        to_create = [entry for entry in entries if entry["status"] == "create"]
+        to_version = [entry for entry in entries if entry["versions"]] if with_versions else []
+        total = len(to_create) + len(to_version)
+        done = 0
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        def step(message):
+            nonlocal done
+            done += 1
+            if progress is not None:
+                progress(done, total, message)
+
+        if progress is not None:
+            progress(0, total, f"{len(to_create)} master shots to create")
+
+        async def create(entry):
+            async with semaphore:
+                response = await AsyncKiyokaiService.create_master_shot(entry["data"])
+
+            if response.get("success"):
+                entry["master_shot_id"] = (response.get("data") or {}).get("id")
+                report["created"].append(entry["shot_name"])
+                logger.info(f"Master shot {entry['shot_name']} created.")
+            elif response.get("exists"):
+                # Created since the plan was made, only its id is needed for the versions
+                entry["status"] = "exists"
+                entry["master_shot_id"] = (response.get("data") or {}).get("id")
+                logger.info(f"Master shot {entry['shot_name']} already exists.")
+            else:
+                report["failed"].append((entry["shot_name"], response.get("message", "Unknown error")))
+                logger.warning(f"Failed to create master shot {entry['shot_name']}: {response.get('message', 'Unknown error')}")
+            step(entry["shot_name"])
+
+        await asyncio.gather(*(create(entry) for entry in to_create))
+
+        # One shot at a time, each import already keeps VERSION_IMPORT_CONCURRENCY POSTs in flight
+        for entry in to_version:
+            if entry["master_shot_id"]:
+                try:
+                    result = await VersionImportService.import_versions(
+                        VersionImportService.version_base(entry["data"], entry["master_shot_id"]),
+                        entry["data"]["version_folder"]
+                    )
+                except VersionListUnavailable as e:
+                    entry["error"] = str(e)
+                    result = {"success": False, "created": [], "skipped": [], "failed": []}
+                report["versions"][entry["shot_name"]] = result
+            step(f"{entry['shot_name']} versions")
+
+        report["success"] = (not report["failed"] and not any(entry["error"] for entry in entries)
+                             and all(result["success"] for result in report["versions"].values()))
+        logger.info(f"Provisioned {len(report['created'])} master shots, {len(report['failed'])} failed")
+        return report
+
+    @staticmethod
+    def format_report(report: dict) -> str:
+        """Plain text summary of a provision() report, one line per shot"""
+        labels = {"create": "create", "exists": "exists", "no_file": "no file", "error": "error"}
+        created = set(report["created"])
+        failed = dict(report["failed"])
+
+        lines = []
+        for entry in sorted(report["entries"], key=lambda entry: entry["shot_name"]):
+            name = entry["shot_name"]
+            if entry["status"] == "error":
+                lines.append(f"{name}: ERROR: {entry['error']}")
+                continue
+            if name in failed:
+                status = f"FAILED: {failed[name]}"
+            elif name in created:
+                status = "created"
+            else:
+                status = labels[entry["status"]]
+            if entry["status"] == "create":
+                status += f"  {entry['data']['file_path']}"
+
+            versions = report["versions"].get(name)
+            if entry["error"]:
+                status += f"  (versions left alone: {entry['error']})"
+            elif versions is not None:
+                status += f"  ({len(versions['created'])} versions registered, {len(versions['failed'])} failed)"
+            elif entry["versions"]:
+                status += f"  ({entry['versions']} versions to register)"
+            lines.append(f"{name}: {status}")
+
+        counts = {status: sum(entry["status"] == status for entry in report["entries"]) for status in labels}
+        if report["dry_run"]:
+            summary = f"Dry run: {counts['create']} to create"
+        else:
+            summary = f"Provisioned: {len(report['created'])} created"
+        lines.append("")
+        lines.append(f"{summary}, {counts['exists']} existing, {counts['no_file']} without file, "
+                     f"{counts['error']} unreadable, {len(report['failed'])} failed")
+        return "\n".join(lines)
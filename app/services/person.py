@@ -0,0 +1,84 @@
+import threading
+import time
+
+from app.config import Settings
+from app.core.gazu_client import gazu_client
+from app.core.logger import get_logger
+from app.core.single_flight import single_flight
+
+logger = get_logger(__name__)
+
+class PersonService:
+    """Service for interacting with Person API"""
+
+    @staticmethod
+    @single_flight
+    def get_all_persons():
+        """Fetch every person of the Zou instance in one request"""
+
+        try:
+            response = gazu_client.person.all_persons()
+            logger.info(f"Person list: {len(response)} persons")
+            return response
+        except Exception as e:
+            logger.error(f"Network error: {e}")
+            return {"success": False, "message": f"Network error: {e}"}
+
+
+class PersonDirectory:
+    """
+    Persons memoized by id.
+
+    The whole person list is loaded in one request and kept for ttl seconds. Ids that are not in
+    the directory are resolved together: one reload covers the whole batch, and ids still unknown
+    afterwards are remembered until the next reload instead of being fetched one by one.
+    """
+
+    def __init__(self, ttl: int = Settings.PERSON_DIRECTORY_TTL):
+        self.ttl = ttl
+        self._persons = {}
+        self._unknown = set()
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def get(self, person_id: str):
+        """Return one person, or None when it does not exist"""
+        return self.resolve([person_id]).get(person_id)
+
+    def resolve(self, person_ids) -> dict:
+        """Return {person_id: person} for every id that exists, with at most one request per call"""
+        person_ids = {person_id for person_id in person_ids if person_id}
+
+        with self._lock:
+            if self._is_expired() or any(
+                person_id not in self._persons and person_id not in self._unknown for person_id in person_ids
+            ):
+                self._reload()
+
+                # Whatever is still missing does not exist (or is hidden from this user)
+                self._unknown.update(person_id for person_id in person_ids if person_id not in self._persons)
+
+            return {person_id: self._persons[person_id] for person_id in person_ids if person_id in self._persons}
+
+    def invalidate(self):
+        """Forget every person, the next lookup reloads the directory"""
+        with self._lock:
+            self._persons.clear()
+            self._unknown.clear()
+            self._loaded_at = None
+
+    def _is_expired(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def _reload(self):
+        person_list = PersonService.get_all_persons()
+        if not isinstance(person_list, list):
+            logger.warning(f"Keeping {len(self._persons)} cached persons, reload failed: {person_list}")
+            return
+
+        self._persons = {person["id"]: person for person in person_list if person.get("id")}
+        self._unknown.clear()
+        self._loaded_at = time.monotonic()
+
+
+person_directory = PersonDirectory()
@@ -1,5 +1,6 @@
 from app.core.gazu_client import gazu_client
 from app.core.logger import get_logger
+from app.core.single_flight import single_flight
 
 logger = get_logger(__name__)
 
@@ -7,6 +8,7 @@ class ProjectService:
     """Service for interacting with Project API"""
 
     @staticmethod
+    @single_flight
     def get_user_project():
         """Fetch data from Project API"""
 
@@ -19,6 +21,7 @@ class ProjectService:
             return {"success": False, "message": f"Network error: {e}"}
 
     @staticmethod
+    @single_flight
     def get_project_metadata(project_id: str):
         """Fetch project metadata by project ID"""
 
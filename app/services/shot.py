@@ -1,5 +1,6 @@
 from app.core.gazu_client import gazu_client
 from app.core.logger import get_logger
+from app.core.single_flight import single_flight
 
 logger = get_logger(__name__)
 
@@ -7,6 +8,7 @@ class ShotService:
     """Service for interacting with Shot API"""
 
     @staticmethod
+    @single_flight
     def get_shots_by_sequence(sequence_id: str):
         """Fetch data from Shot API"""
 
@@ -19,6 +21,59 @@ class ShotService:
             return {"success": False, "message": f"Network error: {e}"}
 
     @staticmethod
+    @single_flight
+    def get_shot(shot_id: str):
+        """Fetch one shot by ID"""
+
+        try:
+            response = gazu_client.shot.get_shot(shot_id)
+            logger.info(f"Shot {shot_id}: {response}")
+            return response
+        except Exception as e:
+            logger.error(f"Network error: {e}")
+            return {"success": False, "message": f"Network error: {e}"}
+
+    @staticmethod
+    @single_flight
+    def get_sequence(sequence_id: str):
+        """Fetch one sequence by ID"""
+
+        try:
+            response = gazu_client.shot.get_sequence(sequence_id)
+            logger.info(f"Sequence {sequence_id}: {response}")
+            return response
+        except Exception as e:
+            logger.error(f"Network error: {e}")
+            return {"success": False, "message": f"Network error: {e}"}
+
+    @staticmethod
+    @single_flight
+    def get_shots_by_project(project_id: str):
+        """Fetch every shot of a project in one request"""
+
+        try:
+            response = gazu_client.shot.all_shots_for_project(project_id)
+            logger.info(f"Project shot list for {project_id}: {len(response)} shots")
+            return response
+        except Exception as e:
+            logger.error(f"Network error: {e}")
+            return {"success": False, "message": f"Network error: {e}"}
+
+    @staticmethod
+    @single_flight
+    def get_sequences_by_project(project_id: str):
+        """Fetch every sequence of a project in one request"""
+
+        try:
+            response = gazu_client.shot.all_sequences_for_project(project_id)
+            logger.info(f"Project sequence list for {project_id}: {len(response)} sequences")
+            return response
+        except Exception as e:
+            logger.error(f"Network error: {e}")
+            return {"success": False, "message": f"Network error: {e}"}
+
+    @staticmethod
+    @single_flight
     def get_sequence_by_episode(episode_id: str):
         """Fetch sequence by project ID"""
 
@@ -31,6 +86,7 @@ class ShotService:
             return {"success": False, "message": f"Network error: {e}"}
 
     @staticmethod
+    @single_flight
     def get_episode_by_project(project_id: str):
         """Fetch episode by project ID"""
 
@@ -43,6 +99,7 @@ class ShotService:
             return {"success": False, "message": f"Network error: {e}"}
 
     @staticmethod
+    @single_flight
     def get_sequence_by_name(project_id: str, episode_id: str, sequence_name: str):
         """Fetch sequence by name"""
 
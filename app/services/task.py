@@ -1,10 +1,11 @@
 import logging
-import os.path
 
 from app.core.app_states import AppState
 from app.core.logger import get_logger
+from app.core.single_flight import single_flight
 from app.core.gazu_client import gazu_client
-from app.config import Settings
+from app.services.avatar_cache import avatar_cache
+from app.services.person import person_directory
 
 logger = get_logger(__name__)
 
@@ -13,6 +14,7 @@ class TaskService:
         super().__init__()
 
     @staticmethod
+    @single_flight
     def get_tasks_by_user():
         """Make API request to get task list for a project"""
 
@@ -26,6 +28,7 @@ class TaskService:
             return {"success": False, "message": f"Network error: {e}"}
 
     @staticmethod
+    @single_flight
     def get_table_task_list():
         """Make API request to get task list for a project"""
 
@@ -38,27 +41,21 @@ class TaskService:
 
             extracted_data = []
 
+            # Resolve every commenter at once instead of one request per task
+            persons = person_directory.resolve(
+                (task.get("last_comment") or {}).get("person_id") for task in response
+            )
+
             for task in response:
-                last_comment = task.get("last_comment", {})
+                last_comment = task.get("last_comment") or {}
 
                 # Handle case where person_id might be invalid or missing
-                try:
-                    user = gazu_client.person.get_person(last_comment.get("person_id"))
-                    if not user:
-                        user = {"full_name": None, "has_avatar": False, "id": None}
-                except Exception as user_error:
-                    logger.warning(f"Could not fetch user for person_id {last_comment.get('person_id')}: {user_error}")
-                    user = {"full_name": None, "has_avatar": False, "id": None}
+                user = dict(persons.get(last_comment.get("person_id")) or {"full_name": None, "has_avatar": False, "id": None})
 
+                # Only avatars already on disk, missing ones are downloaded by the dashboard in the background
                 avatar_path = None
                 if user.get("has_avatar") and user.get("id"):
-                    try:
-                        os.makedirs(os.path.join(Settings.FILES_DIR, "avatar"), exist_ok=True)
-                        avatar_path = os.path.join(Settings.FILES_DIR, "avatar", f"{user['id']}.png")
-                        user["avatar_path"] = gazu_client.files.download_person_avatar(user["id"], file_path=avatar_path)
-                    except Exception as avatar_error:
-                        logger.warning(f"Could not download avatar for user {user.get('id')}: {avatar_error}")
-                        avatar_path = None
+                    avatar_path = avatar_cache.cached_path(user)
 
                 extracted_data.append({
                     "id": task.get("id"),
@@ -76,7 +73,9 @@ class TaskService:
                     "task_type_id": task.get("task_type_id"),
                     "due_date": task.get("due_date"),
                     "priority": task.get("priority"),
+                    "last_comment_person_id": user.get("id"),
                     "last_comment_person_full_name": user.get("full_name"),
+                    "last_comment_person_has_avatar": bool(user.get("has_avatar")),
                     "last_comment_text": last_comment.get("text"),
                     "last_comment_person_avatar_path": avatar_path,
                     "entity_preview_file_id": task.get("entity_preview_file_id"),
@@ -90,6 +89,7 @@ class TaskService:
             return []  # Return empty list instead of error dictionary
 
     @staticmethod
+    @single_flight
     def get_task_comments(task_id: str):
         """Make API request to get comments for a task"""
 
@@ -102,6 +102,7 @@ class TaskService:
             return {"success": False, "message": f"Network error: {e}"}
 
     @staticmethod
+    @single_flight
     def get_task_types_by_project(project_id: str):
         """Make API request to get tasks for a project"""
 
@@ -0,0 +1,154 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import Settings
+from app.core.gazu_client import gazu_client
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class ThumbnailCache:
+    """
+    Size-bounded on-disk LRU of preview thumbnails, keyed by preview file id.
+
+    Recency survives restarts through the file mtime, which is bumped on every hit. Downloads run
+    on a small worker pool, concurrent requests for the same preview share one download, and the
+    least recently used files are evicted once the directory grows past max_bytes. Partial
+    downloads (.part) left by a crash or a failed write are swept whenever the cache is pruned.
+    """
+
+    def __init__(self, directory: str = os.path.join(Settings.FILES_DIR, "preview"),
+                 max_bytes: int = Settings.THUMBNAIL_CACHE_MAX_BYTES, max_workers: int = Settings.THUMBNAIL_MAX_WORKERS):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()  # file_id -> size, least recently used first
+        self._size = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan()
+
+    def path(self, file_id: str) -> str:
+        return os.path.join(self.directory, f"{file_id}.png")
+
+    def contains(self, file_id: str) -> bool:
+        """Whether the thumbnail is on disk, without marking it as used"""
+        with self._lock:
+            return file_id in self._entries
+
+    def get(self, file_id: str):
+        """Path of a cached thumbnail (marked as recently used), or None"""
+        with self._lock:
+            if file_id not in self._entries:
+                return None
+            self._entries.move_to_end(file_id)
+
+        file_path = self.path(file_id)
+        try:
+            os.utime(file_path)
+        except OSError:
+            # Deleted behind our back
+            self._forget(file_id)
+            return None
+        return file_path
+
+    def fetch(self, file_id: str):
+        """Future resolving to the thumbnail path (or None), downloading it only when it is not cached"""
+        with self._lock:
+            future = self._in_flight.get(file_id)
+            if future is None:
+                future = self._executor.submit(self._fetch, file_id)
+                self._in_flight[file_id] = future
+            return future
+
+    def _fetch(self, file_id: str):
+        try:
+            return self.get(file_id) or self._download(file_id)
+        finally:
+            with self._lock:
+                self._in_flight.pop(file_id, None)
+
+    def _download(self, file_id: str):
+        file_path = self.path(file_id)
+        temp_path = f"{file_path}.part"
+
+        try:
+            gazu_client.files.download_preview_file_thumbnail(file_id, file_path=temp_path)
+            os.replace(temp_path, file_path)
+        except Exception as e:
+            logger.error(f"Error downloading preview thumbnail {file_id}: {e}")
+            return None
+        finally:
+            # Only still there when the download or the rename failed
+            self._remove_partial(temp_path)
+
+        self._add(file_id, os.path.getsize(file_path))
+        logger.info(f"Preview thumbnail downloaded: {file_path}")
+        return file_path
+
+    def _scan(self):
+        """Load what is already on disk, oldest mtime first"""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".png"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name[:-len(".png")], stat.st_size))
+
+        for _, file_id, size in sorted(files):
+            self._entries[file_id] = size
+            self._size += size
+        self._evict()
+        self._sweep_partials()
+
+    def _sweep_partials(self):
+        """Delete .part files of downloads no longer in flight"""
+        with self._lock:
+            in_flight = set(self._in_flight)
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".png.part") and entry.name[:-len(".png.part")] not in in_flight:
+                self._remove_partial(entry.path)
+
+    @staticmethod
+    def _remove_partial(temp_path: str):
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove partial thumbnail {temp_path}: {e}")
+
+    def _add(self, file_id: str, size: int):
+        with self._lock:
+            self._size += size - self._entries.pop(file_id, 0)
+            self._entries[file_id] = size
+        self._evict()
+
+    def _forget(self, file_id: str):
+        with self._lock:
+            self._size -= self._entries.pop(file_id, 0)
+
+    def _evict(self):
+        evicted = []
+        with self._lock:
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                file_id, size = self._entries.popitem(last=False)
+                self._size -= size
+                evicted.append(file_id)
+
+        for file_id in evicted:
+            try:
+                os.remove(self.path(file_id))
+            except OSError as e:
+                logger.warning(f"Could not evict preview thumbnail {file_id}: {e}")
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} preview thumbnails")
+            self._sweep_partials()
+
+
+thumbnail_cache = ThumbnailCache()
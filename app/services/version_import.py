@@ -0,0 +1,120 @@
+import asyncio
+
+from app.config import Settings
+from app.core.async_loop import run_blocking
+from app.core.logger import get_logger
+from app.services.kiyokai_async import AsyncKiyokaiService
+from app.utils.version_shots import VersionShotService
+
+logger = get_logger(__name__)
+
+class VersionListUnavailable(Exception):
+    """The registered versions could not be read, importing now could register duplicates"""
+
+
+class VersionImportService:
+    """
+    Registers every version file of a version folder as a version shot in Kiyokai.
+
+    The versions already registered for the shot / task are read first and skipped, so an import
+    can be run again (after a cancel or a failed POST) and only sends what is missing. The POSTs
+    run on the shared async loop, at most Settings.VERSION_IMPORT_CONCURRENCY at a time.
+    """
+
+    @staticmethod
+    def plan(data: dict, normal_files: dict, registered: set) -> tuple:
+        """
+        Version shot payloads to create from the scanned normal files, and the version numbers
+        skipped because they are already registered.
+        """
+        to_create, skipped = [], []
+        for version_number, files in normal_files.items():
+            if not files:
+                continue
+            if version_number in registered:
+                skipped.append(version_number)
+                continue
+
+            # Get the only item from the dict
+            file_name, file_path = next(iter(files.items()))
+
+            version_data = data.copy()
+            version_data["file_name"] = file_name
+            version_data["file_path"] = file_path
+            version_data["version_number"] = version_number
+            to_create.append(version_data)
+        return to_create, skipped
+
+    @staticmethod
+    def version_base(data: dict, master_shot_id: str) -> dict:
+        """Master shot payload turned into the base of its version shots"""
+        version_data = data.copy()
+        for key in ("file_name", "file_path", "nas_server_id", "version_folder"):
+            version_data.pop(key, None)
+        version_data["master_shot_id"] = master_shot_id
+        return version_data
+
+    @staticmethod
+    async def registered_versions(shot_id: str, task_id: str) -> set:
+        """
+        Version numbers already registered for the shot / task. Raises VersionListUnavailable when
+        the list cannot be read (server error, timeout), a 404 means no versions yet.
+        """
+        response = await AsyncKiyokaiService.get_version_shot_by_shot_id(shot_id, task_id)
+        if not response.get("success"):
+            if response.get("status_code") == 404:
+                logger.info(f"No registered versions yet for {shot_id} / {task_id}")
+                return set()
+            raise VersionListUnavailable(
+                f"Could not read the registered versions of {shot_id} / {task_id}: {response.get('message')}"
+            )
+        return {int(version["version_number"]) for version in response.get("data") or []
+                if version.get("version_number") is not None}
+
+    @staticmethod
+    async def import_versions(data: dict, version_folder: str, progress=None,
+                              concurrency: int = Settings.VERSION_IMPORT_CONCURRENCY) -> dict:
+        """
+        Register the missing versions of version_folder, data carrying the master shot fields.
+
+        progress(done, total, message) is called from the async loop thread after every POST.
+        Cancelling the coroutine stops the POSTs still waiting for a slot. Nothing is sent when
+        the registered versions cannot be read (VersionListUnavailable).
+        Returns {"success", "created", "skipped", "failed": [(version_number, message)]}.
+        """
+        normal, _ = await run_blocking(VersionShotService.get_version_shot_data, version_folder)
+        registered = await VersionImportService.registered_versions(data.get("shot_id"), data.get("task_id"))
+        to_create, skipped = VersionImportService.plan(data, normal, registered)
+
+        total = len(to_create)
+        created, failed = [], []
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        if progress is not None:
+            progress(0, total, f"{total} to register, {len(skipped)} already registered")
+
+        async def create(version_data):
+            version_number = version_data["version_number"]
+            async with semaphore:
+                response = await AsyncKiyokaiService.create_version_shot(version_data)
+
+            if response.get("success"):
+                created.append(version_number)
+                logger.info(f"Version {version_number} - {version_data['file_name']} created.")
+            else:
+                failed.append((version_number, response.get("message", "Unknown error")))
+                logger.warning(f"Failed to create Version {version_number}: {response.get('message', 'Unknown error')}")
+
+            if progress is not None:
+                progress(len(created) + len(failed), total, f"v{version_number:03d}")
+
+        await asyncio.gather(*(create(version_data) for version_data in to_create))
+
+        logger.info(f"Version import of {version_folder}: {len(created)} created, {len(skipped)} skipped, "
+                    f"{len(failed)} failed")
+        return {
+            "success": not failed,
+            "created": sorted(created),
+            "skipped": skipped,
+            "failed": sorted(failed),
+        }
@@ -44,6 +44,9 @@ class Ui_Form(object):
         self.pushButton_shotLoad = QtWidgets.QPushButton(parent=self.widget_createUpdate)
         self.pushButton_shotLoad.setObjectName("pushButton_shotLoad")
         self.gridLayout_4.addWidget(self.pushButton_shotLoad, 11, 0, 1, 2)
+        self.pushButton_shotBatch = QtWidgets.QPushButton(parent=self.widget_createUpdate)
+        self.pushButton_shotBatch.setObjectName("pushButton_shotBatch")
+        self.gridLayout_4.addWidget(self.pushButton_shotBatch, 13, 0, 1, 2)
         self.label_createUpdate = QtWidgets.QLabel(parent=self.widget_createUpdate)
         self.label_createUpdate.setObjectName("label_createUpdate")
         self.gridLayout_4.addWidget(self.label_createUpdate, 0, 0, 1, 2)
@@ -207,6 +210,7 @@ class Ui_Form(object):
         self.label_locateFile.setText(_translate("Form", "Mastershot File"))
         self.comboBox_episode.setPlaceholderText(_translate("Form", "Episode"))
         self.pushButton_shotLoad.setText(_translate("Form", "Load"))
+        self.pushButton_shotBatch.setText(_translate("Form", "Batch Provision"))
         self.label_createUpdate.setText(_translate("Form", "Create Update"))
         self.pushButton_shotUpdate.setText(_translate("Form", "Update"))
         self.comboBox_nas.setPlaceholderText(_translate("Form", "Nas"))
@@ -0,0 +1,18 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from app.services.avatar_cache import avatar_cache
+
+
+class AvatarLoader(QObject):
+    """Downloads avatars on the avatar cache's worker pool and reports each one on the GUI thread"""
+
+    avatar_ready = pyqtSignal(str, str)  # person_id, file path
+
+    def request(self, person_id: str):
+        future = avatar_cache.fetch(person_id)
+        future.add_done_callback(lambda f: self._done(person_id, f))
+
+    def _done(self, person_id, future):
+        file_path = None if future.exception() else future.result()
+        if file_path:
+            self.avatar_ready.emit(person_id, file_path)
@@ -0,0 +1,81 @@
+from PyQt6.QtCore import QSignalBlocker
+from PyQt6.QtWidgets import QComboBox
+
+
+class ComboBoxService:
+    @staticmethod
+    def select_by_data(combo_box: QComboBox, data, row_hint: int = -1) -> bool:
+        """
+        Select the item whose itemData equals data.
+
+        row_hint comes from HierarchyIndex.position and is trusted when it points at the right item,
+        so selection is O(1); otherwise it falls back to a findData scan.
+        """
+        if data is None:
+            return False
+
+        if 0 <= row_hint < combo_box.count() and combo_box.itemData(row_hint) == data:
+            row = row_hint
+        else:
+            row = combo_box.findData(data)
+
+        if row < 0:
+            return False
+
+        combo_box.setCurrentIndex(row)
+        return True
+
+    @staticmethod
+    def fill(combo_box: QComboBox, items, selected=None, row_hint: int = -1) -> int:
+        """
+        Replace the items with (text, data) pairs and select the selected data, or the first item.
+
+        Signals are blocked while filling, so the cascade is not triggered once per item: the caller
+        triggers it once with the returned row (-1 when there are no items).
+        """
+        with QSignalBlocker(combo_box):
+            combo_box.clear()
+            for text, data in items:
+                combo_box.addItem(text, data)
+            if not ComboBoxService.select_by_data(combo_box, selected, row_hint) and combo_box.count():
+                combo_box.setCurrentIndex(0)
+
+        combo_box.setEnabled(combo_box.count() > 0)
+        return combo_box.currentIndex()
+
+    @staticmethod
+    def insert_item(combo_box: QComboBox, position: int, text: str, data):
+        """Insert an item without re-triggering the cascade, the current selection is kept"""
+        if combo_box.findData(data) >= 0:
+            return
+
+        position = min(max(position, 0), combo_box.count())
+        if combo_box.count() == 0:
+            combo_box.insertItem(position, text, data)
+            combo_box.setEnabled(True)
+            return
+
+        with QSignalBlocker(combo_box):
+            combo_box.insertItem(position, text, data)
+
+    @staticmethod
+    def remove_item(combo_box: QComboBox, data):
+        """Remove an item, only re-triggering the cascade when it was the selected one"""
+        row = combo_box.findData(data)
+        if row < 0:
+            return
+
+        if row == combo_box.currentIndex():
+            combo_box.removeItem(row)
+        else:
+            with QSignalBlocker(combo_box):
+                combo_box.removeItem(row)
+
+        if combo_box.count() == 0:
+            combo_box.setEnabled(False)
+
+    @staticmethod
+    def rename_item(combo_box: QComboBox, data, text: str):
+        row = combo_box.findData(data)
+        if row >= 0:
+            combo_box.setItemText(row, text)
@@ -0,0 +1,102 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from app.config import Settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HierarchyRefresher(QObject):
+    """
+    Stale-while-revalidate refresh of the project hierarchy.
+
+    The UI keeps showing the current tree while a sync runs on the provider's worker pool.
+    Only the nodes already expanded are re-fetched, so a refresh does not undo the lazy loading;
+    a tree that is fully loaded anyway (seeded from the snapshot) gets the cheaper full sync.
+    The fresh data is merged in place on the GUI thread and every difference is emitted as
+    a fine-grained signal so comboboxes can patch themselves without a rebuild.
+    """
+
+    node_added = pyqtSignal(str, object, str, str, int)  # level, parent_id, node_id, name, position
+    node_removed = pyqtSignal(str, object, str)  # level, parent_id, node_id
+    node_renamed = pyqtSignal(str, object, str, str)  # level, parent_id, node_id, name
+    refreshed = pyqtSignal(int)  # number of changes applied
+
+    _synced = pyqtSignal(object)
+    _loaded_synced = pyqtSignal(object)
+    _siblings_synced = pyqtSignal(str, object)
+
+    def __init__(self, hierarchy, interval: int = Settings.HIERARCHY_REFRESH_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.hierarchy = hierarchy
+        self._running = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval * 1000)
+        self._timer.timeout.connect(self.refresh)
+
+        # Emitted from the worker thread, delivered on the GUI thread
+        self._synced.connect(self._apply)
+        self._loaded_synced.connect(self._apply_loaded)
+        self._siblings_synced.connect(self._apply_siblings)
+
+    def start(self):
+        """Refresh now, then every interval"""
+        self.refresh()
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def refresh(self):
+        if self._running:
+            return
+
+        self._running = True
+        if self.hierarchy.prefers_full_sync():
+            future = self.hierarchy.sync_in_background()
+            future.add_done_callback(lambda f: self._synced.emit(None if f.exception() else f.result()))
+        else:
+            future = self.hierarchy.sync_loaded_in_background()
+            future.add_done_callback(lambda f: self._loaded_synced.emit(None if f.exception() else f.result()))
+
+    def _apply(self, project_data):
+        self._running = False
+        if project_data is None:
+            logger.warning("Hierarchy refresh failed, keeping the current tree")
+            return
+
+        changes = self.hierarchy.apply_refresh(project_data)
+        self._emit_changes(changes)
+        self.refreshed.emit(len(changes))
+
+    def _apply_loaded(self, updates):
+        self._running = False
+        if updates is None:
+            logger.warning("Hierarchy refresh failed, keeping the current tree")
+            return
+
+        changes = self.hierarchy.apply_loaded(updates)
+        self._emit_changes(changes)
+        self.refreshed.emit(len(changes))
+
+    def refresh_node(self, level: str, node_id: str):
+        """Re-sync only the siblings of one shot or sequence, e.g. after a Kitsu event"""
+        future = self.hierarchy.fetch_siblings(level, node_id)
+        future.add_done_callback(lambda f: self._siblings_synced.emit(level, None if f.exception() else f.result()))
+
+    def _apply_siblings(self, level, result):
+        if result is None:
+            return
+
+        parent_id, children = result
+        self._emit_changes(self.hierarchy.apply_siblings(level, parent_id, children))
+
+    def _emit_changes(self, changes: list):
+        for change in changes:
+            if change.kind == "added":
+                self.node_added.emit(change.level, change.parent_id, change.node_id, change.name, change.position)
+            elif change.kind == "removed":
+                self.node_removed.emit(change.level, change.parent_id, change.node_id)
+            elif change.kind == "renamed":
+                self.node_renamed.emit(change.level, change.parent_id, change.node_id, change.name)
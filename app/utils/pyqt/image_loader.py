@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+from app.config import Settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Shared by every loader, decoding is CPU bound
+_executor = ThreadPoolExecutor(max_workers=Settings.IMAGE_DECODE_WORKERS)
+
+
+def read_scaled(file_path: str, width: int = 0, height: int = 0) -> QImage:
+    """
+    Decode an image straight at its target size (aspect ratio kept), safe to call off the GUI thread.
+
+    With only a width or a height the other side follows the aspect ratio, with both the image fits
+    inside them. Formats that can scale while decoding (JPEG) never build the full-size buffer.
+    Returns a null QImage when the file cannot be read.
+    """
+    reader = QImageReader(file_path)
+    reader.setAutoTransform(True)
+
+    source = reader.size()
+    if source.isValid() and (width or height):
+        target = QSize(width or source.width(), height or source.height())
+        if width and height:
+            target = source.scaled(target, Qt.AspectRatioMode.KeepAspectRatio)
+        elif width:
+            target.setHeight(max(1, round(source.height() * width / source.width())))
+        else:
+            target.setWidth(max(1, round(source.width() * height / source.height())))
+        if target.width() < source.width():
+            reader.setScaledSize(target)
+
+    image = reader.read()
+    if image.isNull():
+        logger.warning(f"Could not decode {file_path}: {reader.errorString()}")
+    return image
+
+
+class ImageLoader(QObject):
+    """Decodes images on a worker thread and hands the scaled QImage back on the GUI thread"""
+
+    image_ready = pyqtSignal(str, QImage)  # key, image
+    image_failed = pyqtSignal(str)  # key
+
+    def load(self, key: str, file_path: str, width: int = 0, height: int = 0):
+        future = _executor.submit(read_scaled, file_path, width, height)
+        future.add_done_callback(lambda f: self._done(key, f))
+
+    def _done(self, key, future):
+        image = None if future.exception() else future.result()
+        if image is None or image.isNull():
+            self.image_failed.emit(key)
+        else:
+            self.image_ready.emit(key, image)
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from app.config import Settings
+from app.core.async_loop import async_loop
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CancellationToken:
+    """Set when a job is cancelled, its result is then dropped"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class JobSignals(QObject):
+    result = pyqtSignal(object)
+    error = pyqtSignal(Exception)
+    cancelled = pyqtSignal()
+
+
+class Job(QRunnable):
+    """
+    One call on the JobRunner: a blocking function run on the thread pool, or a coroutine run on
+    the shared async loop (future is then set). Signals are always delivered on the GUI thread.
+    """
+
+    def __init__(self, runner, key, func=None, args=(), kwargs=None, coroutine=None):
+        super().__init__()
+        self.runner = runner
+        self.key = key
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.coroutine = coroutine
+        self.future = None
+
+        self.token = CancellationToken()
+        self.signals = JobSignals()
+        # Kept alive by the runner so a queued job can still be taken back
+        self.setAutoDelete(False)
+
+    def run(self):
+        if self.token.cancelled:
+            self.runner._job_done.emit(self, None, None)
+            return
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.runner._job_done.emit(self, None, e)
+        else:
+            self.runner._job_done.emit(self, result, None)
+
+    def cancel(self):
+        self.runner.cancel(self)
+
+
+class JobRunner(QObject):
+    """
+    Runs the network calls of the handlers off the GUI thread.
+
+    submit() takes a blocking function (run on the runner's QThreadPool) or a coroutine (run on the
+    async loop) and returns a Job whose result / error / cancelled signals fire on the GUI thread.
+    Submitting with a key supersedes the previous job with the same key: it is taken off the queue
+    or cancelled, and its result is dropped even if it is already running. That way only the last
+    of several quick requests (shot changes, refresh clicks) reaches the widgets.
+    """
+
+    _job_done = pyqtSignal(object, object, object)  # job, result, exception
+
+    def __init__(self, parent=None, max_threads: int = Settings.JOB_RUNNER_MAX_THREADS):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, max_threads))
+
+        self._jobs = set()  # every unfinished job
+        self._latest = {}  # key -> job that superseded the others
+
+        # Emitted from the pool and loop threads, delivered on the GUI thread
+        self._job_done.connect(self._on_job_done)
+
+    def submit(self, func, *args, key: str = None, on_result=None, on_error=None, **kwargs) -> Job:
+        """
+        Run func(*args, **kwargs), or await func when it is a coroutine (cancelling the job then
+        cancels the coroutine). on_result(result) and on_error(exception) are connected to the
+        job's signals.
+        """
+        if key is not None and key in self._latest:
+            self.cancel(self._latest[key])
+
+        if asyncio.iscoroutine(func):
+            job = Job(self, key, coroutine=func)
+        else:
+            job = Job(self, key, func, args, kwargs)
+
+        if on_result is not None:
+            job.signals.result.connect(on_result)
+        if on_error is not None:
+            job.signals.error.connect(on_error)
+
+        self._jobs.add(job)
+        if key is not None:
+            self._latest[key] = job
+
+        if job.coroutine is not None:
+            job.future = async_loop.submit(job.coroutine)
+            job.future.add_done_callback(lambda f: self._coroutine_done(job, f))
+        else:
+            self.pool.start(job)
+        return job
+
+    def cancel(self, job_or_key):
+        """Cancel a job (or the latest job of a key). Its result, if it still arrives, is dropped."""
+        job = self._latest.get(job_or_key) if isinstance(job_or_key, str) else job_or_key
+        if job is None or job.token.cancelled:
+            return
+
+        job.token.cancel()
+        if job.future is not None:
+            job.future.cancel()
+        elif self.pool.tryTake(job):
+            self._on_job_done(job, None, None)
+
+    def cancel_all(self):
+        for job in list(self._jobs):
+            self.cancel(job)
+
+    def _coroutine_done(self, job, future):
+        if future.cancelled():
+            self._job_done.emit(job, None, None)
+        elif future.exception() is not None:
+            self._job_done.emit(job, None, future.exception())
+        else:
+            self._job_done.emit(job, future.result(), None)
+
+    def _on_job_done(self, job, result, error):
+        if job not in self._jobs:
+            return
+        self._jobs.discard(job)
+        if self._latest.get(job.key) is job:
+            del self._latest[job.key]
+
+        if job.token.cancelled:
+            job.signals.cancelled.emit()
+        elif error is not None:
+            if not job.signals.receivers(job.signals.error):
+                logger.error(f"Unhandled error in background job {job.key or ''}: {error}")
+            job.signals.error.emit(error)
+        else:
+            job.signals.result.emit(result)
@@ -0,0 +1,105 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from app.config import Settings
+from app.core.app_states import AppState
+from app.core.logger import get_logger
+from app.services.kitsu_events import KitsuEventListener
+
+logger = get_logger(__name__)
+
+# Events that can add a task to the current user's to-do list
+TASK_LIST_EVENTS = ("task:new", "task:assign")
+
+
+class KitsuEventBridge(QObject):
+    """
+    Applies Kitsu events on the GUI thread.
+
+    Task and comment events about listed tasks are coalesced into one tasks_changed signal (deleted
+    tasks are dropped from AppState.task_data right away, without a request). Shot and sequence
+    events re-sync only the parent of the changed node through the hierarchy refresher. While the
+    socket is down the listener polls instead: tasks_changed is emitted and the tree is re-synced.
+    """
+
+    tasks_changed = pyqtSignal()  # the to-do list should be fetched again
+    tasks_patched = pyqtSignal()  # AppState.task_data was edited in place
+    connection_changed = pyqtSignal(bool)
+
+    _event = pyqtSignal(str, object)
+    _polled = pyqtSignal()
+
+    def __init__(self, parent=None, event_host: str = None, debounce: int = Settings.EVENTS_DEBOUNCE_MS):
+        super().__init__(parent)
+        self._pending_nodes = set()
+
+        self._task_timer = QTimer(self)
+        self._task_timer.setSingleShot(True)
+        self._task_timer.setInterval(debounce)
+        self._task_timer.timeout.connect(self.tasks_changed.emit)
+
+        self._hierarchy_timer = QTimer(self)
+        self._hierarchy_timer.setSingleShot(True)
+        self._hierarchy_timer.setInterval(debounce)
+        self._hierarchy_timer.timeout.connect(self._flush_hierarchy)
+
+        # Emitted from the listener thread, delivered on the GUI thread
+        self._event.connect(self._route)
+        self._polled.connect(self._on_polled)
+
+        self.listener = KitsuEventListener(
+            self._event.emit, self._polled.emit, self.connection_changed.emit, event_host=event_host
+        )
+
+    def start(self):
+        self.listener.start()
+
+    def stop(self):
+        self.listener.stop()
+
+    def _route(self, event_name, data):
+        entity = event_name.split(":", 1)[0]
+
+        if entity in ("task", "comment"):
+            task_id = data.get("task_id")
+            if event_name == "task:delete":
+                self._drop_task(task_id)
+            elif event_name in TASK_LIST_EVENTS or task_id is None or self._is_listed(task_id):
+                self._task_timer.start()
+
+        elif entity in ("shot", "sequence"):
+            node_id = data.get(f"{entity}_id")
+            if node_id:
+                self._pending_nodes.add((entity, node_id))
+                self._hierarchy_timer.start()
+
+    def _is_listed(self, task_id) -> bool:
+        return any(isinstance(task, dict) and task.get("id") == task_id for task in AppState().task_data or [])
+
+    def _drop_task(self, task_id):
+        task_data = AppState().task_data
+        if not isinstance(task_data, list) or not self._is_listed(task_id):
+            return
+
+        task_data[:] = [task for task in task_data if not isinstance(task, dict) or task.get("id") != task_id]
+        self.tasks_patched.emit()
+
+    def _flush_hierarchy(self):
+        refresher = AppState().hierarchy_refresher
+        pending, self._pending_nodes = self._pending_nodes, set()
+        if refresher is None:
+            return
+
+        # One re-sync per parent, however many of its children changed
+        parents = set()
+        for level, node_id in pending:
+            parent_id = refresher.hierarchy.index.parent_id(level, node_id)
+            if parent_id is not None:
+                if (level, parent_id) in parents:
+                    continue
+                parents.add((level, parent_id))
+            refresher.refresh_node(level, node_id)
+
+    def _on_polled(self):
+        self.tasks_changed.emit()
+        if AppState().hierarchy_refresher is not None:
+            AppState().hierarchy_refresher.refresh()
@@ -0,0 +1,87 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache
+
+from app.config import Settings
+from app.core.logger import get_logger
+from app.services.thumbnail_cache import thumbnail_cache
+from app.utils.pyqt.image_loader import ImageLoader
+
+logger = get_logger(__name__)
+
+QPixmapCache.setCacheLimit(Settings.PREVIEW_PIXMAP_CACHE_KB)
+
+
+class PreviewPixmapService:
+    """Preview thumbnails decoded and scaled once per width, then served from QPixmapCache"""
+
+    @staticmethod
+    def cache_key(file_id: str, width: int) -> str:
+        return f"preview:{file_id}:{width}"
+
+    @staticmethod
+    def cached(file_id: str, width: int):
+        """Already scaled pixmap, or None"""
+        return QPixmapCache.find(PreviewPixmapService.cache_key(file_id, width))
+
+
+class PreviewLoader(QObject):
+    """
+    Loads scaled previews without blocking the GUI thread.
+
+    The thumbnail is fetched through the thumbnail cache and decoded at the requested width on an
+    ImageLoader worker. Only the conversion to QPixmap and the QPixmapCache insert run on the GUI thread.
+    """
+
+    preview_ready = pyqtSignal(str, int, QPixmap)  # file_id, width, pixmap
+    preview_failed = pyqtSignal(str, int)  # file_id, width
+
+    _downloaded = pyqtSignal(str, int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = set()
+
+        self.image_loader = ImageLoader(self)
+        self.image_loader.image_ready.connect(self._on_image_ready)
+        self.image_loader.image_failed.connect(self._on_image_failed)
+        self._downloaded.connect(self._decode)
+
+    def request(self, file_id: str, width: int):
+        """
+        Preview at width when it is already in memory, otherwise None and preview_ready (or
+        preview_failed) is emitted once it has been loaded.
+        """
+        pixmap = PreviewPixmapService.cached(file_id, width)
+        if pixmap is not None:
+            return pixmap
+
+        key = PreviewPixmapService.cache_key(file_id, width)
+        if key not in self._pending:
+            self._pending.add(key)
+            future = thumbnail_cache.fetch(file_id)
+            future.add_done_callback(lambda f: self._downloaded.emit(
+                file_id, width, "" if f.exception() else (f.result() or "")
+            ))
+        return None
+
+    def _decode(self, file_id, width, file_path):
+        key = PreviewPixmapService.cache_key(file_id, width)
+        if not file_path:
+            self._pending.discard(key)
+            logger.warning(f"Preview thumbnail unavailable: {file_id}")
+            self.preview_failed.emit(file_id, width)
+            return
+        self.image_loader.load(key, file_path, width=width)
+
+    def _on_image_ready(self, key, image: QImage):
+        self._pending.discard(key)
+        _, file_id, width = key.split(":")
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        self.preview_ready.emit(file_id, int(width), pixmap)
+
+    def _on_image_failed(self, key):
+        self._pending.discard(key)
+        _, file_id, width = key.split(":")
+        logger.warning(f"Failed to load preview image: {file_id}")
+        self.preview_failed.emit(file_id, int(width))
@@ -0,0 +1,46 @@
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog
+
+
+class ProgressDialog(QObject):
+    """
+    A window-modal QProgressDialog fed from any thread.
+
+    report(done, total, message) can be called from a worker or the async loop, the dialog is
+    updated on the GUI thread. It stays busy (no range) until the first report gives the total.
+    canceled fires when the user presses Cancel or closes the dialog, never on finish().
+    """
+
+    progressed = pyqtSignal(int, int, str)  # done, total, message
+    canceled = pyqtSignal()
+
+    def __init__(self, parent, title: str, label: str):
+        super().__init__(parent)
+        self.label = label
+
+        self.dialog = QProgressDialog(label, "Cancel", 0, 0, parent)
+        self.dialog.setWindowTitle(title)
+        self.dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.dialog.setMinimumDuration(0)
+        self.dialog.setAutoClose(False)
+        self.dialog.setAutoReset(False)
+        self.dialog.canceled.connect(self.canceled)
+
+        self.progressed.connect(self._on_progressed)
+        self.dialog.show()
+
+    def report(self, done: int, total: int, message: str = ""):
+        self.progressed.emit(done, total, message)
+
+    def finish(self):
+        self.dialog.canceled.disconnect(self.canceled)
+        self.dialog.close()
+        self.deleteLater()
+
+    def _on_progressed(self, done, total, message):
+        if self.dialog.wasCanceled():
+            return
+        # Label first: setValue() on a modal dialog processes events, later reports may run inside it
+        self.dialog.setLabelText(f"{self.label}\n{done} / {total}  {message}".rstrip())
+        self.dialog.setMaximum(max(total, 1))
+        self.dialog.setValue(min(done, max(total, 1)))
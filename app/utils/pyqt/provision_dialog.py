@@ -0,0 +1,91 @@
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtWidgets import QDialog, QLineEdit, QToolButton, QCheckBox, QPlainTextEdit, QPushButton, QLabel, \
+    QFormLayout, QHBoxLayout, QVBoxLayout, QFileDialog
+
+from app.config import Settings
+
+
+class ProvisionDialog(QDialog):
+    """
+    Options of a batch master shot provision: NAS root folder, naming templates and scope.
+
+    Dry Run and Provision emit run_requested(dry_run), the handler runs the job and hands the
+    report back with show_report().
+    """
+
+    run_requested = pyqtSignal(bool)  # dry_run
+
+    def __init__(self, scope: str, sequence_name: str = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Batch Provision")
+        self.resize(720, 480)
+
+        self.line_edit_root = QLineEdit(self)
+        self.line_edit_root.setPlaceholderText("/NAS/Project/Shots")
+        tool_button_root = QToolButton(self)
+        tool_button_root.setText("Locate")
+        tool_button_root.clicked.connect(self.open_folder_dialog)
+        root_layout = QHBoxLayout()
+        root_layout.addWidget(self.line_edit_root)
+        root_layout.addWidget(tool_button_root)
+
+        self.line_edit_master = QLineEdit(Settings.PROVISION_MASTER_TEMPLATE, self)
+        self.line_edit_version = QLineEdit(Settings.PROVISION_VERSION_TEMPLATE, self)
+        for line_edit in (self.line_edit_master, self.line_edit_version):
+            line_edit.setToolTip("Relative to the root folder: {project} {episode} {sequence} {shot} {task}")
+
+        self.check_box_sequence = QCheckBox(f"Only sequence {sequence_name}" if sequence_name else "Only sequence", self)
+        self.check_box_sequence.setEnabled(bool(sequence_name))
+        self.check_box_sequence.setChecked(bool(sequence_name))
+        self.check_box_versions = QCheckBox("Also register versions", self)
+
+        form_layout = QFormLayout()
+        form_layout.addRow("Scope", QLabel(scope, self))
+        form_layout.addRow("Root Folder", root_layout)
+        form_layout.addRow("Mastershot File", self.line_edit_master)
+        form_layout.addRow("Version Folder", self.line_edit_version)
+        form_layout.addRow("", self.check_box_sequence)
+        form_layout.addRow("", self.check_box_versions)
+
+        self.text_report = QPlainTextEdit(self)
+        self.text_report.setReadOnly(True)
+        self.text_report.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+
+        self.push_button_dry_run = QPushButton("Dry Run", self)
+        self.push_button_provision = QPushButton("Provision", self)
+        push_button_close = QPushButton("Close", self)
+        self.push_button_dry_run.clicked.connect(lambda: self.run_requested.emit(True))
+        self.push_button_provision.clicked.connect(lambda: self.run_requested.emit(False))
+        push_button_close.clicked.connect(self.reject)
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(self.push_button_dry_run)
+        button_layout.addWidget(self.push_button_provision)
+        button_layout.addWidget(push_button_close)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form_layout)
+        layout.addWidget(self.text_report)
+        layout.addLayout(button_layout)
+
+    def open_folder_dialog(self):
+        folder_path = QFileDialog.getExistingDirectory(self, "Select Folder", self.line_edit_root.text())
+        if folder_path:
+            self.line_edit_root.setText(folder_path)
+
+    def options(self) -> dict:
+        return {
+            "root_folder": self.line_edit_root.text().strip(),
+            "master_template": self.line_edit_master.text().strip(),
+            "version_template": self.line_edit_version.text().strip(),
+            "only_sequence": self.check_box_sequence.isChecked(),
+            "with_versions": self.check_box_versions.isChecked(),
+        }
+
+    def set_running(self, running: bool):
+        self.push_button_dry_run.setEnabled(not running)
+        self.push_button_provision.setEnabled(not running)
+
+    def show_report(self, text: str):
+        self.text_report.setPlainText(text)
@@ -0,0 +1,58 @@
+from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtWidgets import QDialog, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout, QApplication
+
+
+class QuickSwitcher(QDialog):
+    """Popup to jump to a shot by typing part of its project / episode / sequence / shot / task path"""
+
+    def __init__(self, search_index, parent=None, limit: int = 50):
+        super().__init__(parent)
+        self.search_index = search_index
+        self.limit = limit
+        self.selected = None
+
+        self.setWindowTitle("Go to Shot")
+        self.resize(640, 400)
+
+        self.line_edit = QLineEdit(self)
+        self.line_edit.setPlaceholderText("Project / Episode / Sequence / Shot / Task")
+        self.list_widget = QListWidget(self)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.line_edit)
+        layout.addWidget(self.list_widget)
+
+        self.line_edit.textChanged.connect(self.on_text_changed)
+        self.line_edit.returnPressed.connect(self.accept_current)
+        self.list_widget.itemActivated.connect(self.accept_current)
+        self.line_edit.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        # Arrow keys move through the results while typing continues in the search field
+        if obj is self.line_edit and event.type() == QEvent.Type.KeyPress and event.key() in (
+            Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_PageUp, Qt.Key.Key_PageDown
+        ):
+            QApplication.sendEvent(self.list_widget, event)
+            return True
+        return super().eventFilter(obj, event)
+
+    def on_text_changed(self, text):
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.clear()
+
+        for result in self.search_index.search(text, self.limit):
+            item = QListWidgetItem(result["path"])
+            item.setData(Qt.ItemDataRole.UserRole, result)
+            self.list_widget.addItem(item)
+
+        if self.list_widget.count():
+            self.list_widget.setCurrentRow(0)
+        self.list_widget.setUpdatesEnabled(True)
+
+    def accept_current(self, *args):
+        item = self.list_widget.currentItem()
+        if item is None:
+            return
+
+        self.selected = item.data(Qt.ItemDataRole.UserRole)
+        self.accept()
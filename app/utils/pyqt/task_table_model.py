@@ -0,0 +1,181 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QIcon
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    Dashboard task list stored as one list per task field.
+
+    Cells are only formatted when the view asks for them in data(), avatar icons are loaded the first
+    time they are painted, and updates are reported as dataChanged ranges instead of a model rebuild.
+    """
+
+    HEADERS = ["Project", "Type", "Status", "Entity", "Due Date", "Priority", "Comment By", "Last Comment"]
+    FIELDS = (
+        "id", "project_name", "task_type_name", "task_status_name",
+        "entity_type_name", "episode_name", "sequence_name", "entity_name",
+        "due_date", "priority", "last_comment_person_id", "last_comment_person_full_name",
+        "last_comment_person_avatar_path", "last_comment_text", "entity_preview_file_id",
+    )
+    COMMENT_BY_COLUMN = 6
+
+    # Column repainted when a field changes
+    FIELD_COLUMNS = {
+        "id": 0, "project_name": 0, "task_type_name": 1, "task_status_name": 2,
+        "entity_type_name": 3, "episode_name": 3, "sequence_name": 3, "entity_name": 3,
+        "due_date": 4, "priority": 5, "last_comment_person_id": 6, "last_comment_person_full_name": 6,
+        "last_comment_person_avatar_path": 6, "last_comment_text": 7, "entity_preview_file_id": 3,
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = {field: [] for field in self.FIELDS}
+        self._icons = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns["id"])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(row, column)
+        if role == Qt.ItemDataRole.UserRole:
+            if column == 0:
+                return self._columns["id"][row]
+            if column == self.COMMENT_BY_COLUMN:
+                return self._columns["last_comment_person_id"][row]
+        if role == Qt.ItemDataRole.DecorationRole and column == self.COMMENT_BY_COLUMN:
+            return self._icon(self._columns["last_comment_person_avatar_path"][row])
+        return None
+
+    def _display(self, row: int, column: int) -> str:
+        columns = self._columns
+        if column == 3:
+            if columns["episode_name"][row] and columns["sequence_name"][row]:
+                parts = ("entity_type_name", "episode_name", "sequence_name", "entity_name")
+            else:
+                parts = ("entity_type_name", "entity_name")
+            return " / ".join(columns[field][row] or "" for field in parts)
+
+        field = {
+            0: "project_name", 1: "task_type_name", 2: "task_status_name", 4: "due_date",
+            5: "priority", 6: "last_comment_person_full_name", 7: "last_comment_text",
+        }[column]
+        value = columns[field][row]
+        return "" if value is None else str(value)
+
+    def _icon(self, file_path):
+        if not file_path:
+            return None
+
+        icon = self._icons.get(file_path)
+        if icon is None:
+            icon = self._icons[file_path] = QIcon(file_path)
+        return icon
+
+# Updates ==========================================================================================
+    def set_tasks(self, tasks: list):
+        """Replace every row"""
+        self.beginResetModel()
+        for field, values in self._columns.items():
+            values[:] = [task.get(field) for task in tasks if isinstance(task, dict)]
+        self._icons.clear()
+        self.endResetModel()
+
+    def apply_tasks(self, tasks: list) -> tuple:
+        """
+        Bring the rows in line with a new task list, matched by task id.
+
+        Only removed rows, inserted rows and changed cells are signalled, so the selection and scroll
+        position survive a refresh. Falls back to a reset when rows were reordered.
+        Returns (inserted, removed, changed) row counts.
+        """
+        tasks = [task for task in tasks if isinstance(task, dict)]
+        new_ids = [task.get("id") for task in tasks]
+        new_id_set = set(new_ids)
+
+        # Removes, bottom up so the rows above keep their numbers
+        removed = [row for row, task_id in enumerate(self._columns["id"]) if task_id not in new_id_set]
+        for first, last in reversed(self._ranges(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for values in self._columns.values():
+                del values[first:last + 1]
+            self.endRemoveRows()
+
+        # The rows that stayed must still be in the same order, otherwise start over
+        old_id_set = set(self._columns["id"])
+        if len(new_id_set) != len(new_ids) or [task_id for task_id in new_ids if task_id in old_id_set] != self._columns["id"]:
+            self.set_tasks(tasks)
+            return len(tasks), len(removed), 0
+
+        # Inserts, top down at their final rows
+        inserted = [row for row, task_id in enumerate(new_ids) if task_id not in old_id_set]
+        for first, last in self._ranges(inserted):
+            self.beginInsertRows(QModelIndex(), first, last)
+            for field, values in self._columns.items():
+                values[first:first] = [task.get(field) for task in tasks[first:last + 1]]
+            self.endInsertRows()
+
+        # Changed cells, compared one field (column list) at a time
+        changed = {}
+        for field, values in self._columns.items():
+            fresh = [task.get(field) for task in tasks]
+            if fresh == values:
+                continue
+
+            column = self.FIELD_COLUMNS[field]
+            for row, (old, new) in enumerate(zip(values, fresh)):
+                if old != new:
+                    changed.setdefault(row, set()).add(column)
+            values[:] = fresh
+
+        for row, columns in sorted(changed.items()):
+            self.dataChanged.emit(self.index(row, min(columns)), self.index(row, max(columns)))
+
+        return len(inserted), len(removed), len(changed)
+
+    @staticmethod
+    def _ranges(rows: list) -> list:
+        """[(first, last)] runs of consecutive rows in an ascending list"""
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        return ranges
+
+    def task_id(self, row: int):
+        ids = self._columns["id"]
+        return ids[row] if 0 <= row < len(ids) else None
+
+    def preview_file_id(self, row: int):
+        file_ids = self._columns["entity_preview_file_id"]
+        return file_ids[row] if 0 <= row < len(file_ids) else None
+
+    def set_avatar(self, person_id: str, file_path: str):
+        """Point every row commented by person_id at a new avatar file"""
+        rows = [row for row, value in enumerate(self._columns["last_comment_person_id"]) if value == person_id]
+        if not rows:
+            return
+
+        avatar_paths = self._columns["last_comment_person_avatar_path"]
+        for row in rows:
+            avatar_paths[row] = file_path
+        self._icons.pop(file_path, None)
+
+        self.dataChanged.emit(
+            self.index(rows[0], self.COMMENT_BY_COLUMN), self.index(rows[-1], self.COMMENT_BY_COLUMN),
+            [Qt.ItemDataRole.DecorationRole]
+        )
@@ -0,0 +1,113 @@
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
+
+from app.config import Settings
+from app.core.logger import get_logger
+from app.services.thumbnail_cache import thumbnail_cache
+
+logger = get_logger(__name__)
+
+
+class _PrefetchJob(QRunnable):
+    def __init__(self, file_id: str, finished):
+        super().__init__()
+        self.file_id = file_id
+        self.finished = finished
+        # Kept alive by the prefetcher so a queued job can still be taken back
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            thumbnail_cache.fetch(self.file_id).result()
+        except Exception as e:
+            logger.warning(f"Preview prefetch failed for {self.file_id}: {e}")
+        finally:
+            self.finished.emit(self.file_id)
+
+
+class ThumbnailPrefetcher(QObject):
+    """
+    Warms the thumbnail cache for the task rows around the viewport of a table view.
+
+    Visible rows are queued first, then the look-ahead rows above and below by distance, on a small
+    low-priority pool of its own so a preview the user actually opens never waits behind a prefetch.
+    Queued rows that scrolled out of the window are taken back off the queue; downloads already
+    running are left to finish.
+    """
+
+    _finished = pyqtSignal(str)
+
+    def __init__(self, view, file_id_for_row, parent=None, lookahead: int = Settings.PREFETCH_LOOKAHEAD_ROWS,
+                 max_workers: int = Settings.PREFETCH_MAX_WORKERS, debounce: int = Settings.PREFETCH_DEBOUNCE_MS):
+        super().__init__(parent)
+        self.view = view
+        self.file_id_for_row = file_id_for_row
+        self.lookahead = lookahead
+
+        self._jobs = {}  # file_id -> queued or running job
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, max_workers))
+        self._pool.setThreadPriority(QThread.Priority.LowPriority)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce)
+        self._timer.timeout.connect(self.update)
+
+        # Emitted from the pool threads, delivered on the GUI thread
+        self._finished.connect(self._on_finished)
+
+        self.view.verticalScrollBar().valueChanged.connect(self.schedule)
+        model = self.view.model()
+        for signal in (model.modelReset, model.rowsInserted, model.rowsRemoved, model.layoutChanged, model.dataChanged):
+            signal.connect(self.schedule)
+
+    def schedule(self, *args):
+        self._timer.start()
+
+    def update(self):
+        """Queue the window around the viewport and drop queued rows that left it"""
+        wanted = self._wanted()
+
+        for file_id, job in list(self._jobs.items()):
+            if file_id not in wanted and self._pool.tryTake(job):
+                del self._jobs[file_id]
+
+        for file_id, priority in wanted.items():
+            if file_id in self._jobs or thumbnail_cache.contains(file_id):
+                continue
+            job = self._jobs[file_id] = _PrefetchJob(file_id, self._finished)
+            self._pool.start(job, priority)
+
+    def cancel(self):
+        """Take back everything still queued"""
+        for file_id, job in list(self._jobs.items()):
+            if self._pool.tryTake(job):
+                del self._jobs[file_id]
+
+    def _wanted(self) -> dict:
+        """{file_id: priority} for the visible rows (highest) and the look-ahead rows (by distance)"""
+        row_count = self.view.model().rowCount()
+        if row_count == 0:
+            return {}
+
+        first = self.view.rowAt(0)
+        last = self.view.rowAt(self.view.viewport().height() - 1)
+        first = 0 if first < 0 else first
+        last = row_count - 1 if last < 0 else last
+
+        rows = [(row, self.lookahead + 1) for row in range(first, last + 1)]
+        for distance in range(1, self.lookahead + 1):
+            priority = self.lookahead + 1 - distance
+            rows.append((last + distance, priority))
+            rows.append((first - distance, priority))
+
+        wanted = {}
+        for row, priority in rows:
+            if 0 <= row < row_count:
+                file_id = self.file_id_for_row(row)
+                if file_id and file_id not in wanted:
+                    wanted[file_id] = priority
+        return wanted
+
+    def _on_finished(self, file_id):
+        self._jobs.pop(file_id, None)
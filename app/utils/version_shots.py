@@ -1,9 +1,33 @@
 import os
 import re
+import stat
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import Settings
+
+_VERSION_REGEX = re.compile(r"_v(\d{3,})", re.IGNORECASE)
+
+# Shared by every scan_many call, scanning is mostly waiting on the NAS
+_executor = ThreadPoolExecutor(max_workers=Settings.VERSION_SCAN_WORKERS, thread_name_prefix="version-scan")
 
 class VersionShotService:
+    """
+    Version folder scanner.
+
+    Folders are read with os.scandir, whose entries already know their type, so a folder costs one
+    listing instead of one stat per file on SMB / WebDAV mounts. Results are cached per folder and
+    keyed by the folder's mtime, which changes whenever a file is added, removed or renamed: an
+    unchanged folder is answered with a single stat.
+    """
+
+    _cache = OrderedDict()  # folder_path -> (mtime_ns, normal_files, backup_files)
+    _lock = threading.Lock()
+
     @staticmethod
-    def get_version_shot_data(folder_path: str):
+    def get_version_shot_data(folder_path: str, use_cache: bool = True):
         """
         Scans the folder and separates normal files from autosave/backup files.
 
@@ -12,21 +36,70 @@ class VersionShotService:
             backup_files: dict[int, dict[str, str]]
         """
         try:
-            if not os.path.isdir(folder_path):
+            try:
+                folder_stat = os.stat(folder_path)
+            except OSError:
+                folder_stat = None
+            if folder_stat is None or not stat.S_ISDIR(folder_stat.st_mode):
                 print(f"[!] Not a valid directory: {folder_path}")
+                VersionShotService.invalidate(folder_path)
                 return {}, {}
 
-            files = os.listdir(folder_path)
-            normal_files = {}
-            backup_files = {}
+            mtime_ns = folder_stat.st_mtime_ns
+            if use_cache:
+                with VersionShotService._lock:
+                    cached = VersionShotService._cache.get(folder_path)
+                    if cached is not None and cached[0] == mtime_ns:
+                        VersionShotService._cache.move_to_end(folder_path)
+                        return VersionShotService._copy(cached[1]), VersionShotService._copy(cached[2])
 
-            version_regex = re.compile(r"_v(\d{3,})", re.IGNORECASE)
+            scanned_at = time.time_ns()
+            normal_files, backup_files = VersionShotService._scan(folder_path)
+
+            # A folder changed within the mtime granularity of the share could change again without a
+            # new mtime, only cache it once it has been quiet for longer than that
+            if scanned_at - mtime_ns > Settings.VERSION_SCAN_MTIME_GRANULARITY * 1_000_000_000:
+                with VersionShotService._lock:
+                    VersionShotService._cache[folder_path] = (mtime_ns, normal_files, backup_files)
+                    VersionShotService._cache.move_to_end(folder_path)
+                    while len(VersionShotService._cache) > Settings.VERSION_SCAN_CACHE_FOLDERS:
+                        VersionShotService._cache.popitem(last=False)
+
+            return VersionShotService._copy(normal_files), VersionShotService._copy(backup_files)
+
+        except Exception as e:
+            print(f"[-] Error getting version shot data: {e}")
+            return {}, {}
 
-            for file in files:
-                full_path = os.path.join(folder_path, file)
-                if not os.path.isfile(full_path):
+    @staticmethod
+    def scan_many(folder_paths, use_cache: bool = True) -> dict:
+        """Scan several version folders concurrently, returns {folder_path: (normal_files, backup_files)}"""
+        folder_paths = list(dict.fromkeys(folder_paths))
+        results = _executor.map(lambda folder_path: VersionShotService.get_version_shot_data(folder_path, use_cache),
+                                folder_paths)
+        return dict(zip(folder_paths, results))
+
+    @staticmethod
+    def invalidate(folder_path: str = None):
+        """Forget the cached scan of a folder, or of every folder"""
+        with VersionShotService._lock:
+            if folder_path is None:
+                VersionShotService._cache.clear()
+            else:
+                VersionShotService._cache.pop(folder_path, None)
+
+    @staticmethod
+    def _scan(folder_path: str):
+        normal_files = {}
+        backup_files = {}
+
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                # Type comes with the listing, only symlinks need a stat
+                if not entry.is_file():
                     continue
 
+                file = entry.name
                 _, ext = os.path.splitext(file)
 
                 # Determine if it's a backup (e.g., .blend1, .blend2)
@@ -35,20 +108,18 @@ class VersionShotService:
                     is_backup = True
 
                 # Extract version number
-                match = version_regex.search(file)
+                match = _VERSION_REGEX.search(file)
                 version = int(match.group(1)) if match else 0
 
                 target_dict = backup_files if is_backup else normal_files
                 if version not in target_dict:
                     target_dict[version] = {}
-                target_dict[version][file] = full_path
+                target_dict[version][file] = entry.path
 
-            # Optional: Sort version keys
-            normal_files = dict(sorted(normal_files.items()))
-            backup_files = dict(sorted(backup_files.items()))
+        # Sort version keys
+        return dict(sorted(normal_files.items())), dict(sorted(backup_files.items()))
 
-            return normal_files, backup_files
-
-        except Exception as e:
-            print(f"[-] Error getting version shot data: {e}")
-            return {}, {}
+    @staticmethod
+    def _copy(files: dict) -> dict:
+        # Callers get their own dicts, the cached ones stay untouched
+        return {version: dict(names) for version, names in files.items()}